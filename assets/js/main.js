@@ -109,7 +109,10 @@ function setupNavigation() {
 }
 
 async function loadPageContent() {
-  const containers = [...document.querySelectorAll("[data-source]")];
+  // The build inlines fragments it could render; only the rest are fetched.
+  const containers = [
+    ...document.querySelectorAll("[data-source]:not([data-prerendered])"),
+  ];
   await Promise.all(containers.map(loadMarkdown));
   await loadMetadata();
 }
@@ -119,8 +122,9 @@ async function loadMarkdown(container) {
   if (!source) return;
 
   try {
+    // Fingerprinted fragments never change under the same name.
     const response = await fetch(new URL(source, document.baseURI), {
-      cache: "no-cache",
+      cache: container.hasAttribute("data-fingerprinted") ? "default" : "no-cache",
     });
     if (!response.ok) {
       if (response.status === 404 && container.closest("[data-optional]")) {
@@ -159,7 +163,7 @@ function hideSection(container) {
 
 async function loadMetadata() {
   const display = document.getElementById("last-updated");
-  if (!display) return;
+  if (!display || display.hasAttribute("data-prerendered")) return;
 
   try {
     const response = await fetch(
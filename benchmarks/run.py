@@ -0,0 +1,344 @@
+"""Benchmark fetch validation, rendering and publishing on synthetic researchers.
+
+Run ``python benchmarks/run.py`` (or ``make bench``). Everything runs offline:
+the fetch benchmark talks to a stub HTTP server on localhost. Each case
+reports the best wall time of a few runs, item throughput, and peak traced
+memory of one extra run.
+
+Timings are stored relative to a fixed pure-Python calibration workload, so
+a baseline recorded on one machine is meaningful on another. ``--save``
+records a baseline; ``--check`` exits non-zero when a case is slower than
+its baseline by more than ``--tolerance`` and by more than ``--noise-floor``
+seconds, so jitter in sub-millisecond cases does not fail the gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from researchmap_site import render, render_html
+from researchmap_site.client import ResearchmapClient
+from researchmap_site.config import ProfileConfig, ResearchmapConfig, SiteConfig
+from researchmap_site.index import ResearcherIndex
+from researchmap_site.publications import PUBLICATION_KINDS, PublicationIndex
+from researchmap_site.ratelimit import AdaptiveRateLimiter
+from researchmap_site.sync import _html_fragment, synchronize
+
+# Small enough for CI; pass --sizes 10000,100000 to profile large researchers.
+DEFAULT_SIZES = (10, 1_000)
+DEFAULT_TOLERANCE = 2.0
+# Slowdowns smaller than this are scheduler and timer noise, whatever their ratio.
+DEFAULT_NOISE_FLOOR_SECONDS = 0.005
+# Each case runs MIN_REPEATS times, then repeats until TARGET_SECONDS have been spent.
+MIN_REPEATS = 3
+MAX_REPEATS = 100
+TARGET_SECONDS = 0.5
+PERMALINK = "benchmark"
+PROFILE = ProfileConfig(email="person [at] example.test", social_links=())
+CONFIG = SiteConfig(
+    researchmap=ResearchmapConfig(permalink=PERMALINK, base_url="http://127.0.0.1"),
+    profile=PROFILE,
+)
+PUBLICATION_SECTIONS = [section for section, _ in PUBLICATION_KINDS.values()]
+WORDS = ("market", "quantum", "learning", "portfolio", "stochastic", "neural", "bayesian")
+
+
+def _title(rng: random.Random) -> dict[str, str]:
+    words = " ".join(rng.choice(WORDS) for _ in range(8)).capitalize()
+    return {"en": words, "ja": f"{words}（日本語）"}
+
+
+def _people(rng: random.Random) -> dict[str, list[dict[str, str]]]:
+    names = [f"Author {rng.randrange(1_000)}" for _ in range(rng.randint(1, 6))]
+    return {"en": [{"name": name} for name in names]}
+
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.randint(1990, 2026)}-{rng.randint(1, 12):02d}"
+
+
+def synthetic_payload(items: int, *, seed: int = 0) -> dict[str, Any]:
+    """Return a researcher with ``items`` items in each rendered section."""
+
+    rng = random.Random(seed)
+    makers: dict[str, Callable[[], dict[str, Any]]] = {
+        "research_experience": lambda: {
+            "affiliation": _title(rng),
+            "job": {"en": "Researcher"},
+            "from_date": _date(rng),
+            "to_date": "9999",
+        },
+        "education": lambda: {
+            "affiliation": _title(rng),
+            "department": {"en": "Science"},
+            "from_date": _date(rng),
+        },
+        "published_papers": lambda: {
+            "paper_title": _title(rng),
+            "authors": _people(rng),
+            "publication_name": _title(rng),
+            "publication_date": _date(rng),
+            "referee": rng.random() < 0.5,
+            "identifiers": {"doi": [f"10.1000/{rng.randrange(10**8)}"]},
+        },
+        "books_etc": lambda: {
+            "book_title": _title(rng),
+            "authors": _people(rng),
+            "publisher": {"en": "Example Press"},
+            "publication_date": _date(rng),
+        },
+        "presentations": lambda: {
+            "presentation_title": _title(rng),
+            "presenters": _people(rng),
+            "event": _title(rng),
+            "presentation_date": _date(rng),
+        },
+        "competitive_fundings": lambda: {
+            "research_project_title": _title(rng),
+            "funding_system": {"en": "Grant-in-Aid"},
+            "from_date": _date(rng),
+            "to_date": _date(rng),
+        },
+        "awards": lambda: {
+            "award_name": _title(rng),
+            "association": {"en": "Example Society"},
+            "award_date": _date(rng),
+        },
+    }
+    graph = [
+        {
+            "@type": section_type,
+            "items": [{"rm:id": f"{section_type}-{i}", **make()} for i in range(items)],
+        }
+        for section_type, make in makers.items()
+    ]
+    return {
+        "@type": "researchers",
+        "permalink": PERMALINK,
+        "rm:modified": "2026-01-01T00:00:00Z",
+        "degrees": [{"degree": {"en": "Doctor of Science"}}],
+        "@graph": graph,
+    }
+
+
+@contextmanager
+def stub_server(body: bytes) -> Iterator[str]:
+    """Serve ``body`` as the researcher document on an ephemeral localhost port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@dataclass(frozen=True)
+class Result:
+    case: str
+    size: int
+    items: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.case}@{self.size}"
+
+
+def measure(case: str, size: int, items: int, function: Callable[[], object]) -> Result:
+    timings: list[float] = []
+    while len(timings) < MIN_REPEATS or (
+        len(timings) < MAX_REPEATS and sum(timings) < TARGET_SECONDS
+    ):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(case, size, items, min(timings), peak)
+
+
+def calibrate() -> float:
+    """Time a fixed workload that stands in for this machine's speed."""
+
+    data = [{"key": str(i), "values": list(range(20))} for i in range(5_000)]
+
+    def workload() -> None:
+        json.loads(json.dumps(data))
+        sorted(str(i * 7919 % 10_007) for i in range(100_000))
+
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        workload()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_size(items: int, output_root: Path) -> list[Result]:
+    payload = synthetic_payload(items)
+    body = json.dumps(payload).encode("utf-8")
+    index = ResearcherIndex.build(payload)
+    papers = render.render_papers(index)
+    total = items * len(payload["@graph"])
+    results: list[Result] = []
+
+    with stub_server(body) as base_url:
+        limiter = AdaptiveRateLimiter(rate=1e9, burst=1_000_000)
+        with ResearchmapClient(base_url, rate_limiter=limiter) as client:
+            results.append(
+                measure(
+                    "fetch_researcher", items, total, lambda: client.fetch_researcher(PERMALINK)
+                )
+            )
+
+    results.append(measure("index", items, total, lambda: ResearcherIndex.build(payload)))
+    for name in ("papers", "books", "presentations", "projects", "awards"):
+        results.append(measure(f"render_{name}", items, items, partial_render(name, index)))
+    results.append(
+        measure("render_profile", items, items * 2, lambda: render.render_profile(index, PROFILE))
+    )
+    results.append(measure("html_fragment", items, items, lambda: _html_fragment(papers)))
+    results.append(measure("render_all", items, total, lambda: render.render_all(index, PROFILE)))
+    results.append(
+        measure("render_all_html", items, total, lambda: render_html.render_all(index, PROFILE))
+    )
+
+    # A lab of researchers whose profiles repeat each other's items.
+    lab = [ResearcherIndex.build(synthetic_payload(items, seed=seed % 2)) for seed in range(4)]
+    listed = sum(len(index.section(section)) for index in lab for section in PUBLICATION_SECTIONS)
+    results.append(measure("publications", items, listed, lambda: build_publications(lab)))
+    publications = build_publications(lab)
+    updates = iter(lab[:2] * MAX_REPEATS * 2)
+    results.append(
+        measure(
+            "publications_update",
+            items,
+            items * 2,
+            lambda: (publications.update("0", next(updates)), publications.fragments()),
+        )
+    )
+
+    class Fetcher:
+        def fetch_researcher(self, permalink: str) -> dict[str, Any]:
+            return payload
+
+    output = output_root / f"site-{items}" / "_auto_contents"
+    results.append(
+        measure(
+            "synchronize",
+            items,
+            total,
+            lambda: synchronize(CONFIG, Fetcher(), output, force=True),
+        )
+    )
+    return results
+
+
+def build_publications(lab: list[ResearcherIndex]) -> PublicationIndex:
+    publications = PublicationIndex()
+    for number, index in enumerate(lab):
+        publications.update(str(number), index)
+    publications.fragments()
+    return publications
+
+
+def partial_render(name: str, index: ResearcherIndex) -> Callable[[], str]:
+    function = getattr(render, f"render_{name}")
+    return lambda: function(index)
+
+
+def _report(result: Result, calibration: float) -> str:
+    throughput = result.items / result.seconds if result.seconds else float("inf")
+    return (
+        f"{result.name:<28} {result.seconds * 1000:>10.2f} ms {throughput:>14,.0f} items/s "
+        f"{result.peak_bytes / 2**20:>9.1f} MiB {result.seconds / calibration:>9.2f}x"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="comma-separated items per section (default: %(default)s; up to 100000)",
+    )
+    parser.add_argument("--save", type=Path, help="write the results as a baseline")
+    parser.add_argument("--check", type=Path, help="fail on regressions against a baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown factor against the baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--noise-floor",
+        type=float,
+        default=DEFAULT_NOISE_FLOOR_SECONDS,
+        help="ignore slowdowns of fewer seconds than this (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    baseline: dict[str, float] = {}
+    if args.check is not None:
+        baseline = json.loads(args.check.read_text(encoding="utf-8"))
+
+    calibration = calibrate()
+    print(f"calibration {calibration * 1000:.2f} ms")
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for result in run_size(size, Path(directory)):
+                print(_report(result, calibration), flush=True)
+                results.append(result)
+    relative = {result.name: result.seconds / calibration for result in results}
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(relative, indent=2, sort_keys=True) + "\n")
+    if args.check is None:
+        return 0
+    regressions = [
+        f"{name}: {relative[name]:.2f}x calibration, baseline {expected:.2f}x"
+        for name, expected in sorted(baseline.items())
+        if name in relative
+        and relative[name] > expected * args.tolerance
+        and (relative[name] - expected) * calibration > args.noise_floor
+    ]
+    for regression in regressions:
+        print(f"regression {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,32 @@
 """Tools for synchronizing a static researcher site with researchmap."""
 
-from .config import SiteConfig, load_config
-from .sync import SyncResult, synchronize
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import SiteConfig, load_config
+    from .sync import SyncResult, synchronize
 
 __all__ = ["SiteConfig", "SyncResult", "load_config", "synchronize"]
+
+# Importing the package stays cheap; each name loads its module on first use.
+_EXPORTS = {
+    "SiteConfig": "config",
+    "SyncResult": "sync",
+    "load_config": "config",
+    "synchronize": "sync",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(f".{module}", __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted((*globals(), *__all__))
@@ -0,0 +1,156 @@
+"""Asyncio client for the public researchmap API.
+
+This module needs the optional ``aiohttp`` dependency (``pip install
+researchmap-site[async]``) unless a compatible session is injected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .api import (
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_RETRIES,
+    RETRY_AFTER_STATUS_CODES,
+    RETRYABLE_STATUS_CODES,
+    USER_AGENT,
+    ResearchmapError,
+    ResearchmapUnavailableError,
+    _backoff_seconds,
+    _retry_after_seconds,
+    _unavailable_status,
+    _validate_researcher,
+)
+from .index import ResearcherIndex
+from .ratelimit import THROTTLE_STATUS_CODES, AdaptiveRateLimiter, shared_rate_limiter
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _transient_errors() -> tuple[type[BaseException], ...]:
+    errors: tuple[type[BaseException], ...] = (OSError, TimeoutError)
+    try:
+        import aiohttp
+    except ImportError:
+        return errors
+    return (*errors, aiohttp.ClientError)
+
+
+class AsyncResearchmapClient:
+    """Fetch researcher records from asyncio code with the sync client's retry policy.
+
+    Every request made through one client shares a semaphore of
+    ``max_concurrency`` slots, so a single client bounds the number of
+    in-flight requests however many syncs are awaiting it. Failed attempts
+    are retried up to ``MAX_RETRIES`` times with urllib3's backoff schedule,
+    honouring ``Retry-After`` on 413, 429 and 503 responses. Each attempt also
+    waits for a token from ``rate_limiter``, shared with the synchronous
+    clients of the process unless one is given.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        session: Any | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._sleep = sleep
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
+        self._transient = _transient_errors()
+
+    def _client_session(self) -> Any:
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as error:
+                raise ResearchmapError(
+                    "AsyncResearchmapClient requires aiohttp; install researchmap-site[async]"
+                ) from error
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+                raise_for_status=False,
+            )
+        return self._session
+
+    async def _get_json(self, url: str, params: dict[str, str]) -> Any:
+        session = self._client_session()
+        consecutive_errors = 0
+        while True:
+            retry_after: float | None = None
+            wait = self.rate_limiter.reserve()
+            if wait:
+                await self._sleep(wait)
+            try:
+                async with (
+                    self._semaphore,
+                    asyncio.timeout(self.timeout),
+                    session.get(url, params=params) as response,
+                ):
+                    status = response.status
+                    if status < 400:
+                        self.rate_limiter.on_success()
+                        return json.loads(await response.read())
+                    retry_after = (
+                        _retry_after_seconds(response.headers.get("Retry-After"))
+                        if status in RETRY_AFTER_STATUS_CODES
+                        else None
+                    )
+                    if status in THROTTLE_STATUS_CODES:
+                        self.rate_limiter.on_throttle(retry_after)
+                if status not in RETRYABLE_STATUS_CODES and retry_after is None:
+                    error_type = (
+                        ResearchmapUnavailableError
+                        if _unavailable_status(status)
+                        else ResearchmapError
+                    )
+                    raise error_type(f"Failed to fetch {url}: HTTP {status}")
+                failure = f"HTTP {status}"
+            except ValueError as error:
+                raise ResearchmapError(f"Failed to fetch {url}: {error}") from error
+            except self._transient as error:
+                failure = str(error) or type(error).__name__
+
+            consecutive_errors += 1
+            if consecutive_errors > MAX_RETRIES:
+                raise ResearchmapUnavailableError(
+                    f"Failed to fetch {url}: {failure} after {MAX_RETRIES} retries"
+                )
+            delay = retry_after if retry_after is not None else _backoff_seconds(consecutive_errors)
+            if delay:
+                await self._sleep(delay)
+
+    async def fetch_researcher(self, permalink: str) -> dict[str, Any]:
+        return (await self._fetch(permalink))[0]
+
+    async def fetch_index(self, permalink: str) -> ResearcherIndex:
+        return (await self._fetch(permalink))[1]
+
+    async def _fetch(self, permalink: str) -> tuple[dict[str, Any], ResearcherIndex]:
+        url = f"{self.base_url}/{permalink}"
+        payload = await self._get_json(url, {"format": "json"})
+        return payload, _validate_researcher(payload, permalink)
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncResearchmapClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
@@ -0,0 +1,108 @@
+"""What the researchmap API looks like: limits, retry rules, errors and validation.
+
+Nothing here needs the HTTP stack, so parsers, the asyncio client and the
+command line can use it without importing ``requests``.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .index import ResearcherIndex
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL_SIZE = 10
+USER_AGENT = "richwomanbtc-site-sync/1.0 (+https://github.com/richwomanbtc/richwomanbtc.github.io)"
+# researchmap caps ``limit`` on achievement listings at 1000 items per page.
+MAX_PAGE_SIZE = 1000
+DEFAULT_SECTION_WORKERS = 4
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_AFTER_STATUS_CODES = frozenset({413, 429, 503})
+MAX_RETRIES = 4
+BACKOFF_FACTOR = 1.0
+BACKOFF_MAX_SECONDS = 120.0
+SUPPORTED_SECTION_TYPES = frozenset(
+    {
+        "awards",
+        "books",
+        "books_etc",
+        "competitive_fundings",
+        "education",
+        "presentations",
+        "published_papers",
+        "research_areas",
+        "research_experience",
+    }
+)
+
+
+class ResearchmapError(RuntimeError):
+    """Raised when researchmap data cannot be fetched or validated."""
+
+
+class ResearchmapUnavailableError(ResearchmapError):
+    """Raised when researchmap cannot be reached, times out, or answers 429 or 5xx.
+
+    Other errors mean researchmap answered and the request or the researcher's
+    data was at fault, so only this one says anything about the service.
+    """
+
+
+def _unavailable_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def _backoff_seconds(consecutive_errors: int) -> float:
+    """Mirror urllib3's backoff: no delay after the first error, then doubling."""
+
+    if consecutive_errors <= 1:
+        return 0.0
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_FACTOR * 2 ** (consecutive_errors - 1))
+
+
+def _retry_after_seconds(value: str | None, *, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    current = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - current)
+
+
+def _validate_researcher(payload: Any, permalink: str) -> ResearcherIndex:
+    """Check a researcher payload and return its index, built in the same pass."""
+
+    from .index import ResearcherIndex
+
+    if not isinstance(payload, dict):
+        raise ResearchmapError("researchmap returned a non-object JSON payload")
+    if payload.get("@type") != "researchers":
+        raise ResearchmapError("researchmap payload is not a researcher record")
+    returned_permalink = payload.get("permalink")
+    if returned_permalink != permalink:
+        raise ResearchmapError(
+            f"researchmap returned data for an unexpected permalink: {returned_permalink!r}"
+        )
+    modified = payload.get("rm:modified")
+    if not isinstance(modified, str) or not modified.strip():
+        raise ResearchmapError("researchmap payload is missing rm:modified")
+    graph = payload.get("@graph")
+    if not isinstance(graph, list):
+        raise ResearchmapError("researchmap payload is missing an @graph array")
+    index = ResearcherIndex.build(payload)
+    if not graph or index.item_count(SUPPORTED_SECTION_TYPES) == 0:
+        raise ResearchmapError("researchmap payload contains no public section items")
+    return index
@@ -0,0 +1,139 @@
+"""A circuit breaker that stops calling a failing upstream for a while.
+
+After ``threshold`` consecutive failures the breaker opens and every call is
+refused for ``cooldown`` seconds. The first call after that is a trial: its
+success closes the breaker, its failure opens it for another cool-down.
+With a ``path``, the state survives between runs, so a scheduled job does not
+wait out the upstream's timeouts again right after a failed run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal
+
+from .api import ResearchmapError
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN_SECONDS = 15 * 60
+
+BreakerState = Literal["closed", "open", "half-open"]
+
+
+class CircuitOpenError(ResearchmapError):
+    """Raised instead of calling an upstream whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Count consecutive failures of one upstream and refuse calls while open.
+
+    One breaker may be shared by several threads. While half-open, only one
+    trial call is let through at a time.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1")
+        if cooldown <= 0:
+            raise ValueError("cooldown must be positive")
+        self.path = Path(path) if path is not None else None
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until: float | None = None
+        self._trial = False
+        if self.path is not None:
+            self._load(self.path)
+
+    def _load(self, path: Path) -> None:
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            # A damaged state file only costs one call to the upstream.
+            return
+        failures = state.get("failures") if isinstance(state, dict) else None
+        open_until = state.get("open_until") if isinstance(state, dict) else None
+        if isinstance(failures, int) and failures >= 0:
+            self._failures = failures
+        if isinstance(open_until, int | float):
+            self._open_until = float(open_until)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        state = {"failures": self._failures, "open_until": self._open_until}
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(state) + "\n", encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError:
+            # The breaker keeps working in memory when its file cannot be written.
+            return
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> BreakerState:
+        if self._open_until is None:
+            return "closed"
+        return "open" if self._clock() < self._open_until else "half-open"
+
+    def retry_at(self) -> float | None:
+        """Return when an open breaker lets the next trial call through."""
+
+        with self._lock:
+            return self._open_until if self._state() == "open" else None
+
+    def allow(self) -> bool:
+        """Return whether a call may go ahead; a half-open breaker admits one trial."""
+
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "open" or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def release(self) -> None:
+        """End a call that says nothing about the upstream, freeing a half-open trial."""
+
+        with self._lock:
+            self._trial = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            changed = self._failures or self._open_until is not None
+            self._failures = 0
+            self._open_until = None
+            self._trial = False
+            if changed:
+                self._save()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._open_until = self._clock() + self.cooldown
+            self._trial = False
+            self._save()
@@ -0,0 +1,227 @@
+"""Build the deployable site: prerendered, fingerprinted and precompressed files.
+
+Run ``python -m researchmap_site.build SOURCE DESTINATION`` after
+synchronizing. Brotli siblings need the optional ``brotli`` package
+(``pip install researchmap-site[build]``); without it only gzip is written.
+Responsive images need Pillow, as described in ``images``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import re
+import shutil
+import sys
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from html import escape as html_escape
+from pathlib import Path
+from types import ModuleType
+
+from .images import build_images
+from .sync import _replace_directory
+
+PUBLIC_PATHS = (".nojekyll", "index.html", "assets", "_auto_contents")
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {".css", ".html", ".ico", ".js", ".json", ".svg", ".webmanifest", ".yml"}
+)
+HASH_LENGTH = 10
+DEFAULT_IMAGE_CACHE = Path(".cache/images")
+# Names that already carry a content hash, such as image variants.
+FINGERPRINTED = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}$")
+# Local references in index.html; absolute URLs, anchors and root paths are left alone.
+REFERENCE = re.compile(r'\b(src|href|data-source)="(?![a-z][a-z0-9+.-]*:|[#/])([^"?#]+)"')
+# A loader container of index.html and its placeholder content.
+CONTAINER = re.compile(r'(<div\b[^>]*\bdata-source="([^"]+)"[^>]*)>.*?(</div>)', re.DOTALL)
+SECTION = re.compile(r'<section id="([^"]+)"([^>]*)>')
+LAST_UPDATED = re.compile(r'(<time id="last-updated")>[^<]*(</time>)')
+NOSCRIPT = re.compile(r"[ \t]*<noscript>.*?</noscript>\n?", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class BuildResult:
+    output_directory: Path
+    prerendered: tuple[str, ...]
+    fingerprinted: dict[str, str]
+    compressed_files: tuple[str, ...]
+    images: tuple[str, ...] = ()
+
+
+def _brotli() -> ModuleType | None:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _prerender(staging: Path) -> tuple[str, ...]:
+    """Inline the generated fragments and sync time into index.html.
+
+    Filled containers are marked ``data-prerendered`` and the loader in
+    main.js skips them; containers whose fragment is missing keep their
+    placeholder and are still fetched. Optional sections without content are
+    hidden with their navigation entry, as the loader would do.
+    """
+
+    index = staging / "index.html"
+    html = index.read_text(encoding="utf-8")
+    prerendered: list[str] = []
+    hidden: list[str] = []
+    pending = 0
+
+    def fill(match: re.Match[str]) -> str:
+        nonlocal pending
+        opening, source, closing = match.groups()
+        start = html.rfind("<section ", 0, match.start())
+        section = SECTION.match(html, start) if start >= 0 else None
+        path = staging / source
+        content = path.read_text(encoding="utf-8").strip() if path.is_file() else None
+        if content is None and not (section is not None and "data-optional" in section[2]):
+            pending += 1
+            return match.group(0)
+        tag = opening.replace('aria-busy="true"', 'aria-busy="false"').rstrip()
+        opening = f"{tag} data-prerendered{opening[len(opening.rstrip()) :]}"
+        if not content:
+            if section is not None:
+                hidden.append(section[1])
+            return f"{opening}>{closing}"
+        prerendered.append(source)
+        return f"{opening}>\n{content}\n{closing}"
+
+    html = CONTAINER.sub(fill, html)
+    for section_id in hidden:
+        html = html.replace(f'<section id="{section_id}"', f'<section id="{section_id}" hidden', 1)
+        html = html.replace(f'<li><a href="#{section_id}">', f'<li hidden><a href="#{section_id}">')
+    if not pending:
+        html = NOSCRIPT.sub("", html, count=1)
+
+    metadata = staging / "_auto_contents" / "metadata.yml"
+    if metadata.is_file():
+        found = re.search(r"^last_updated:\s*(.+)$", metadata.read_text(encoding="utf-8"), re.M)
+        if found:
+            updated = html_escape(found[1].strip(), quote=False)
+            html = LAST_UPDATED.sub(
+                lambda match: f"{match[1]} data-prerendered>{updated}{match[2]}", html, count=1
+            )
+    index.write_text(html, encoding="utf-8")
+    return tuple(prerendered)
+
+
+def _fingerprint(staging: Path, reference: str) -> str | None:
+    path = staging / reference
+    if not path.is_file() or path.name == "index.html" or FINGERPRINTED.search(path.stem):
+        return None
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+    hashed = path.with_name(f"{path.stem}.{digest}{path.suffix}")
+    if not hashed.exists():
+        shutil.copy2(path, hashed)
+    return hashed.relative_to(staging).as_posix()
+
+
+def _rewrite_references(staging: Path) -> dict[str, str]:
+    """Point index.html at content-hashed copies of the files it references.
+
+    Originals stay in place for external links and the JavaScript loader's
+    hard-coded paths. Fingerprinted fragments are marked so the loader may
+    use the HTTP cache instead of revalidating them.
+    """
+
+    index = staging / "index.html"
+    fingerprinted: dict[str, str] = {}
+
+    def replace(match: re.Match[str]) -> str:
+        attribute, reference = match.groups()
+        hashed = fingerprinted.get(reference) or _fingerprint(staging, reference)
+        if hashed is None:
+            return match.group(0)
+        fingerprinted[reference] = hashed
+        marker = " data-fingerprinted" if attribute == "data-source" else ""
+        return f'{attribute}="{hashed}"{marker}'
+
+    html = REFERENCE.sub(replace, index.read_text(encoding="utf-8"))
+    index.write_text(html, encoding="utf-8")
+    return fingerprinted
+
+
+def _compress(staging: Path) -> tuple[str, ...]:
+    brotli = _brotli()
+    compressed: list[str] = []
+    for path in sorted(staging.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        # A fixed mtime keeps rebuilds byte-identical, so deploys only ship real changes.
+        path.with_name(f"{path.name}.gz").write_bytes(gzip.compress(data, 9, mtime=0))
+        if brotli is not None:
+            path.with_name(f"{path.name}.br").write_bytes(brotli.compress(data))
+        compressed.append(path.relative_to(staging).as_posix())
+    return tuple(compressed)
+
+
+def build_site(
+    source: str | Path, destination: str | Path, *, image_cache: str | Path | None = None
+) -> BuildResult:
+    """Copy the public files of ``source`` and atomically publish the build.
+
+    With an ``image_cache`` directory, responsive image variants and icons
+    are generated, or reused from the cache while their sources are unchanged.
+    """
+
+    source = Path(source).resolve()
+    output = Path(destination).resolve()
+    if not (source / "index.html").is_file():
+        raise OSError(f"Site source has no index.html: {source}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{output.name}.staging-", dir=output.parent))
+    try:
+        for name in PUBLIC_PATHS:
+            path = source / name
+            if path.is_dir():
+                shutil.copytree(path, staging / name)
+            elif path.is_file():
+                shutil.copy2(path, staging / name)
+        prerendered = _prerender(staging)
+        images = build_images(staging, Path(image_cache)) if image_cache is not None else ()
+        fingerprinted = _rewrite_references(staging)
+        compressed = _compress(staging)
+        _replace_directory(staging, output)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging)
+    return BuildResult(output, prerendered, fingerprinted, compressed, images)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build the deployable site with fingerprinted, precompressed files."
+    )
+    parser.add_argument("source", type=Path, help="site checkout to build from")
+    parser.add_argument("destination", type=Path, help="directory to replace with the build")
+    parser.add_argument(
+        "--image-cache",
+        type=Path,
+        default=DEFAULT_IMAGE_CACHE,
+        help=f"reuse generated image variants stored here (default: {DEFAULT_IMAGE_CACHE})",
+    )
+    args = parser.parse_args(argv)
+    try:
+        result = build_site(args.source, args.destination, image_cache=args.image_cache)
+    except OSError as error:
+        print(f"site build failed: {error}", file=sys.stderr)
+        return 1
+    print(
+        f"Built {result.output_directory}: {len(result.prerendered)} prerendered, "
+        f"{len(result.fingerprinted)} fingerprinted, {len(result.images)} images, "
+        f"{len(result.compressed_files)} precompressed"
+        + ("" if _brotli() is not None else " (gzip only; install brotli for .br)")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+"""Persistent store of API responses for conditional HTTP requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CHUNK_SIZE = 1 << 16
+
+
+def _validators(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """Return the request headers that revalidate this response."""
+
+        return _validators(self.etag, self.last_modified)
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A verified cache entry whose body is read from disk in chunks."""
+
+    path: Path
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        return _validators(self.etag, self.last_modified)
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        with self.path.open("rb") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+
+class BodyWriter:
+    """Stream a response body into the cache and publish it on ``commit``."""
+
+    def __init__(
+        self, cache: ResponseCache, key: str, etag: str | None, last_modified: str | None
+    ) -> None:
+        self._cache = cache
+        self._key = key
+        self._etag = etag
+        self._last_modified = last_modified
+        self._digest = hashlib.sha256()
+        handle, temporary = tempfile.mkstemp(prefix=".body.", dir=cache.directory)
+        self._path = Path(temporary)
+        self._file = os.fdopen(handle, "wb")
+        self.discarded = False
+
+    def write(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> None:
+        self._file.close()
+        meta_path, body_path = self._cache._paths(self._key)
+        os.replace(self._path, body_path)
+        _write_atomic(
+            meta_path,
+            self._cache._meta(self._key, self._etag, self._last_modified, self._digest.hexdigest()),
+        )
+
+    def discard(self) -> None:
+        self.discarded = True
+        self._file.close()
+        self._path.unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    handle, temporary = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(content)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+class ResponseCache:
+    """Keep the last validated body and its validators for each request URL.
+
+    Entries are written atomically, so concurrent writers and interrupted runs
+    leave either the previous or the new entry. Unreadable entries are treated
+    as misses; the next full response replaces them.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json", self.directory / f"{digest}.body"
+
+    @staticmethod
+    def _meta(key: str, etag: str | None, last_modified: str | None, sha256: str) -> bytes:
+        meta = {"key": key, "etag": etag, "last_modified": last_modified, "sha256": sha256}
+        return json.dumps(meta).encode("utf-8")
+
+    def _read_meta(self, key: str) -> dict[str, Any] | None:
+        meta_path, _ = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("key") != key:
+            return None
+        return meta
+
+    def get(self, key: str) -> CachedResponse | None:
+        meta = self._read_meta(key)
+        if meta is None:
+            return None
+        try:
+            body = self._paths(key)[1].read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(body).hexdigest() != meta.get("sha256"):
+            return None
+        return CachedResponse(
+            body=body,
+            etag=meta.get("etag") or None,
+            last_modified=meta.get("last_modified") or None,
+        )
+
+    def get_body(self, key: str) -> CachedBody | None:
+        """Like ``get``, but verify the body in chunks instead of loading it."""
+
+        meta = self._read_meta(key)
+        if meta is None:
+            return None
+        entry = CachedBody(
+            path=self._paths(key)[1],
+            etag=meta.get("etag") or None,
+            last_modified=meta.get("last_modified") or None,
+        )
+        digest = hashlib.sha256()
+        try:
+            for chunk in entry.iter_chunks():
+                digest.update(chunk)
+        except OSError:
+            return None
+        return entry if digest.hexdigest() == meta.get("sha256") else None
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        meta_path, body_path = self._paths(key)
+        # The body goes first so the metadata never points at a missing body.
+        _write_atomic(body_path, response.body)
+        _write_atomic(
+            meta_path,
+            self._meta(
+                key,
+                response.etag,
+                response.last_modified,
+                hashlib.sha256(response.body).hexdigest(),
+            ),
+        )
+
+    def writer(self, key: str, *, etag: str | None, last_modified: str | None) -> BodyWriter:
+        return BodyWriter(self, key, etag, last_modified)
@@ -3,13 +3,47 @@
 from __future__ import annotations
 
 import argparse
+import json
+import signal
+import sqlite3
 import sys
+import threading
 from collections.abc import Sequence
+from contextlib import ExitStack
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .client import DEFAULT_TIMEOUT_SECONDS, ResearchmapClient, ResearchmapError
-from .config import ConfigError, load_config
-from .sync import synchronize
+from .api import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT_SECONDS, MAX_PAGE_SIZE, ResearchmapError
+from .breaker import DEFAULT_COOLDOWN_SECONDS, CircuitBreaker
+from .cache import ResponseCache
+from .config import ConfigError, SiteConfig, load_config
+from .daemon import (
+    DEFAULT_INTERVAL_SECONDS,
+    DEFAULT_JITTER_SECONDS,
+    SyncDaemon,
+    _warm_renderers,
+    request,
+)
+from .metrics import METRICS_FORMATS, write_metrics
+from .payload_store import DEFAULT_KEEP, PayloadStore
+from .ratelimit import DEFAULT_MAX_RATE, DEFAULT_RATE, AdaptiveRateLimiter
+from .sync import (
+    DEFAULT_BATCH_WORKERS,
+    RENDERERS,
+    SyncResult,
+    _target_config,
+    publish_aggregate,
+    synchronize,
+    synchronize_batch,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .client import ResearchmapClient
+    from .publications import PublicationIndex
+    from .render_cache import RenderCache
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
@@ -42,30 +76,535 @@ def _parser() -> argparse.ArgumentParser:
         default=DEFAULT_TIMEOUT_SECONDS,
         help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT_SECONDS:g})",
     )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        metavar="REQUESTS",
+        help=(
+            "requests per second the adaptive rate limit may climb to without throttling "
+            f"(starts at {DEFAULT_RATE:g}, default: {DEFAULT_MAX_RATE:g})"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="reuse unchanged API responses stored in this directory (default: disabled)",
+    )
+    parser.add_argument(
+        "--render-cache",
+        type=Path,
+        help="reuse rendered items and fragments stored in this SQLite file (default: disabled)",
+    )
+    parser.add_argument(
+        "--payload-store",
+        type=Path,
+        help="keep compressed snapshots of fetched payloads in this directory (default: disabled)",
+    )
+    parser.add_argument(
+        "--keep-snapshots",
+        type=int,
+        default=DEFAULT_KEEP,
+        help=f"snapshots retained per researcher in --payload-store (default: {DEFAULT_KEEP})",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="rebuild from --payload-store without contacting researchmap (implies --force)",
+    )
+    parser.add_argument(
+        "--changes",
+        type=Path,
+        help="write item-level changes since the previous snapshot as JSON lines to this file",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        help="write per-stage timings and counters of each sync to this file",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=METRICS_FORMATS,
+        default="jsonl",
+        help=(
+            "append JSON lines, or replace a Prometheus textfile for node_exporter (default: jsonl)"
+        ),
+    )
+    parser.add_argument(
+        "--latency-budget",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "serve the last --payload-store snapshot when a refresh takes longer than this; "
+            "--daemon finishes the refresh in the background, a single run abandons it "
+            "(default: disabled)"
+        ),
+    )
+    parser.add_argument(
+        "--breaker-state",
+        type=Path,
+        help="remember repeated researchmap failures across runs in this file (default: disabled)",
+    )
+    parser.add_argument(
+        "--breaker-cooldown",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "skip researchmap for this long after repeated failures "
+            f"(default: {DEFAULT_COOLDOWN_SECONDS} with --breaker-state, otherwise disabled)"
+        ),
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default="html",
+        help="emit HTML directly or convert Markdown with Python-Markdown (default: html)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="render sections in a pool of this many worker processes (default: disabled)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        help=(
+            "fetch each section in pages of this many items instead of the full "
+            f"researcher document (1-{MAX_PAGE_SIZE}, default: disabled)"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="parse the researcher document incrementally to bound memory use",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="render and publish even when researchmap reports no changes",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="synchronize every [[researchers]] entry instead of [researchmap].permalink",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BATCH_WORKERS,
+        help=f"concurrent researchers in --batch mode (default: {DEFAULT_BATCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and refresh on a schedule and on --socket triggers",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SECONDS,
+        help=f"seconds between refreshes of a researcher (default: {DEFAULT_INTERVAL_SECONDS})",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=DEFAULT_JITTER_SECONDS,
+        help=f"random delay of up to this many seconds per run (default: {DEFAULT_JITTER_SECONDS})",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket on which the daemon accepts refresh commands (default: disabled)",
+    )
+    parser.add_argument(
+        "--trigger",
+        nargs="?",
+        const="",
+        metavar="PERMALINK",
+        help="ask the daemon at --socket to refresh one researcher, or all of them, and exit",
+    )
     return parser
 
 
+def _report(result: SyncResult) -> None:
+    if result.status == "stale":
+        print(
+            f"{result.output_directory} serves stored content "
+            f"(researchmap modified {result.source_modified})"
+        )
+    elif result.status == "unchanged":
+        print(
+            f"{result.output_directory} is already current "
+            f"(researchmap modified {result.source_modified})"
+        )
+    else:
+        print(
+            f"Generated {len(result.generated_files)} files in "
+            f"{result.output_directory} at {result.last_updated} "
+            f"({len(result.changed_files)} changed, {len(result.unchanged_files)} unchanged, "
+            f"{len(result.removed_files)} removed)"
+        )
+    if result.changes is not None:
+        for section in result.changes.sections:
+            print(f"  {section.summary()}")
+    if result.refresh_error:
+        print(
+            f"researchmap refresh failed for {result.permalink}: {result.refresh_error}",
+            file=sys.stderr,
+        )
+
+
+def _settle(results: Sequence[SyncResult], *, wait: bool) -> list[SyncResult]:
+    """Resolve refreshes that outlived their latency budget.
+
+    The daemon ``wait``s for them. A single run keeps to its budget: it abandons
+    them and reports them as still pending, unless one was already publishing.
+    """
+
+    settled: list[SyncResult] = []
+    for result in results:
+        if result.refresh is None:
+            settled.append(result)
+            continue
+        if not wait:
+            result.refresh.abandon()
+            if not result.refresh.done():
+                print(
+                    f"{result.output_directory} serves stored content; the refresh of "
+                    f"{result.permalink} was still pending and is left to the next run",
+                    flush=True,
+                )
+                settled.append(replace(result, refresh=None))
+                continue
+        else:
+            print(
+                f"{result.output_directory} serves stored content while "
+                f"{result.permalink} refreshes in the background",
+                flush=True,
+            )
+        try:
+            settled.append(result.refresh.result())
+        except (RuntimeError, OSError, ValueError) as error:
+            settled.append(replace(result, refresh_error=str(error), refresh=None))
+    return settled
+
+
+def _write_changes(path: Path | None, results: Sequence[SyncResult]) -> None:
+    if path is None:
+        return
+    with path.open("w", encoding="utf-8") as file:
+        for result in results:
+            if result.changes is not None:
+                file.write(json.dumps(result.changes.to_dict(), ensure_ascii=False) + "\n")
+
+
+def _write_metrics(args: argparse.Namespace, results: Sequence[SyncResult]) -> None:
+    if args.metrics is None:
+        return
+    runs = [
+        (result.permalink, result.status, result.metrics)
+        for result in results
+        if result.metrics is not None
+    ]
+    write_metrics(args.metrics, args.metrics_format, runs)
+
+
+def _response_cache(args: argparse.Namespace) -> ResponseCache | None:
+    return ResponseCache(args.cache_dir) if args.cache_dir is not None else None
+
+
+def _render_cache(args: argparse.Namespace, stack: ExitStack) -> RenderCache | None:
+    if args.render_cache is None:
+        return None
+    from .render_cache import RenderCache
+
+    return stack.enter_context(RenderCache(args.render_cache))
+
+
+def _payload_store(args: argparse.Namespace, stack: ExitStack) -> PayloadStore | None:
+    # An offline rebuild reads the store; writing the same payloads back is pointless.
+    if args.payload_store is None or args.offline:
+        return None
+    return stack.enter_context(PayloadStore(args.payload_store, keep=args.keep_snapshots))
+
+
+def _breaker(args: argparse.Namespace) -> CircuitBreaker | None:
+    if args.breaker_state is None and args.breaker_cooldown is None:
+        return None
+    return CircuitBreaker(
+        args.breaker_state, cooldown=args.breaker_cooldown or DEFAULT_COOLDOWN_SECONDS
+    )
+
+
+def _publications(
+    config: SiteConfig | None, payload_store: PayloadStore | None
+) -> PublicationIndex | None:
+    """Return a publication index for the daemon, seeded from stored payloads."""
+
+    if config is None or config.aggregate_directory is None:
+        return None
+    from .index import ResearcherIndex
+    from .publications import PublicationIndex
+
+    publications = PublicationIndex()
+    if payload_store is None:
+        return publications
+    for target in config.researchers:
+        try:
+            payload = payload_store.load(target.permalink)
+        except (OSError, ValueError):
+            continue
+        publications.update(target.permalink, ResearcherIndex.build(payload))
+    return publications
+
+
+def _client(
+    args: argparse.Namespace,
+    config: SiteConfig,
+    stack: ExitStack,
+    *,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> ResearchmapClient | PayloadStore:
+    if args.offline:
+        return stack.enter_context(PayloadStore(args.payload_store, keep=args.keep_snapshots))
+    # requests and urllib3 load only when a run actually talks to researchmap.
+    from .client import ResearchmapClient
+
+    return stack.enter_context(
+        ResearchmapClient(
+            config.researchmap.base_url,
+            timeout=args.timeout,
+            pool_size=pool_size,
+            cache=_response_cache(args),
+            page_size=args.page_size,
+            stream=args.stream,
+            rate_limiter=(
+                AdaptiveRateLimiter(max_rate=args.max_rate) if args.max_rate is not None else None
+            ),
+        )
+    )
+
+
+def _executor(args: argparse.Namespace, stack: ExitStack) -> ProcessPoolExecutor | None:
+    if args.processes is None:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+
+    return stack.enter_context(ProcessPoolExecutor(max_workers=args.processes))
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    try:
+        config = load_config(args.config)
+        if not config.researchers:
+            raise ConfigError("--batch requires at least one [[researchers]] entry")
+        with ExitStack() as stack:
+            client = _client(args, config, stack, pool_size=args.workers)
+            batch = synchronize_batch(
+                config,
+                client,
+                max_workers=args.workers,
+                force=args.force or args.offline,
+                render_cache=_render_cache(args, stack),
+                renderer=args.renderer,
+                executor=_executor(args, stack),
+                payload_store=_payload_store(args, stack),
+                latency_budget=args.latency_budget,
+                breaker=_breaker(args),
+            )
+            # The client and stores stay open until late refreshes are settled.
+            results = _settle(batch.results, wait=False)
+            limiter = None if isinstance(client, PayloadStore) else client.rate_limiter.stats()
+        _write_changes(args.changes, results)
+        _write_metrics(args, results)
+    except (ConfigError, OSError, ValueError, sqlite3.Error) as error:
+        print(f"researchmap sync failed: {error}", file=sys.stderr)
+        return 1
+
+    for result in results:
+        _report(result)
+    if batch.aggregate is not None:
+        _report(batch.aggregate)
+    for permalink, message in batch.failures.items():
+        print(f"researchmap sync failed for {permalink}: {message}", file=sys.stderr)
+    if config.aggregate_directory is not None and batch.aggregate is None:
+        print(
+            f"Kept the previous publication pages in {config.aggregate_directory}",
+            file=sys.stderr,
+        )
+    if limiter is not None:
+        print(
+            f"Sent {limiter.requests} requests; {limiter.throttled} throttled, "
+            f"{limiter.waited_seconds:.1f}s spent waiting, "
+            f"current rate {limiter.rate:.1f}/{limiter.max_rate:.1f} req/s"
+        )
+    return 0 if batch.ok else 1
+
+
+def _run_daemon(args: argparse.Namespace) -> int:
+    try:
+        config = load_config(args.config)
+        if args.batch and not config.researchers:
+            raise ConfigError("--batch requires at least one [[researchers]] entry")
+        targets = {target.permalink: target for target in config.researchers if args.batch}
+        permalinks = tuple(targets) or (config.researchmap.permalink,)
+        with ExitStack() as stack:
+            client = _client(args, config, stack, pool_size=args.workers)
+            render_cache = _render_cache(args, stack)
+            executor = _executor(args, stack)
+            payload_store = _payload_store(args, stack)
+            breaker = _breaker(args)
+            _warm_renderers(executor, args.processes or 0)
+            publications = _publications(config if args.batch else None, payload_store)
+            latest: dict[str, SyncResult] = {}
+            lock = threading.Lock()
+
+            def sync(permalink: str, force: bool) -> SyncResult:
+                target = targets.get(permalink)
+                result = synchronize(
+                    _target_config(config, target) if target is not None else config,
+                    client,
+                    target.output_directory if target is not None else args.output,
+                    manual_content_directory=(
+                        target.manual_content_directory
+                        if target is not None
+                        else args.manual_content
+                    ),
+                    force=force or args.force or args.offline,
+                    render_cache=render_cache,
+                    renderer=args.renderer,
+                    executor=executor,
+                    payload_store=payload_store,
+                    latency_budget=args.latency_budget,
+                    breaker=breaker,
+                    publications=publications,
+                )
+                # Holding the worker keeps a second refresh of the researcher from starting.
+                (result,) = _settle((result,), wait=True)
+                with lock:
+                    latest[permalink] = result
+                    # A textfile holds every researcher; JSON lines only the new run.
+                    prometheus = args.metrics_format == "prometheus"
+                    _write_metrics(args, list(latest.values()) if prometheus else [result])
+                    _report(result)
+                    # Only a complete index may replace the merged pages.
+                    if publications is not None and len(publications.researchers) == len(targets):
+                        _report(
+                            publish_aggregate(
+                                publications, config.aggregate_directory, render_cache=render_cache
+                            )
+                        )
+                    # A daemon runs for weeks; a crash must not lose every render since start.
+                    if render_cache is not None:
+                        render_cache.flush()
+                return result
+
+            daemon = SyncDaemon(
+                permalinks,
+                sync,
+                interval=args.interval,
+                jitter=args.jitter,
+                workers=args.workers,
+            )
+            if args.socket is not None:
+                stack.enter_context(daemon.serve(args.socket))
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                previous = signal.signal(signum, lambda *_: daemon.stop())
+                stack.callback(signal.signal, signum, previous)
+            print(f"Refreshing {len(permalinks)} researchers every {args.interval:g}s", flush=True)
+            daemon.run()
+    except (ConfigError, OSError, ValueError, sqlite3.Error) as error:
+        print(f"researchmap daemon failed: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _send_trigger(args: argparse.Namespace) -> int:
+    command = f"{'force' if args.force else 'refresh'} {args.trigger}"
+    try:
+        reply = request(args.socket, command)
+    except (OSError, ValueError) as error:
+        print(f"researchmap trigger failed: {error}", file=sys.stderr)
+        return 1
+    if "error" in reply:
+        print(f"researchmap trigger failed: {reply['error']}", file=sys.stderr)
+        return 1
+    print("Queued " + ", ".join(reply.get("queued", [])))
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     args = _parser().parse_args(argv)
     if args.timeout <= 0:
         print("error: --timeout must be greater than zero", file=sys.stderr)
         return 2
+    if args.max_rate is not None and args.max_rate <= 0:
+        print("error: --max-rate must be greater than zero", file=sys.stderr)
+        return 2
+    if args.page_size is not None and not 1 <= args.page_size <= MAX_PAGE_SIZE:
+        print(f"error: --page-size must be between 1 and {MAX_PAGE_SIZE}", file=sys.stderr)
+        return 2
+    if args.stream and args.page_size is not None:
+        print("error: --stream cannot be combined with --page-size", file=sys.stderr)
+        return 2
+    if args.workers < 1:
+        print("error: --workers must be at least 1", file=sys.stderr)
+        return 2
+    if args.changes is not None and (args.payload_store is None or args.offline):
+        print("error: --changes requires --payload-store and a fetch", file=sys.stderr)
+        return 2
+    if args.offline and args.payload_store is None:
+        print("error: --offline requires --payload-store", file=sys.stderr)
+        return 2
+    if args.keep_snapshots < 1:
+        print("error: --keep-snapshots must be at least 1", file=sys.stderr)
+        return 2
+    if args.processes is not None and args.processes < 1:
+        print("error: --processes must be at least 1", file=sys.stderr)
+        return 2
+    if args.latency_budget is not None and (args.payload_store is None or args.offline):
+        print("error: --latency-budget requires --payload-store and a fetch", file=sys.stderr)
+        return 2
+    if args.latency_budget is not None and args.latency_budget <= 0:
+        print("error: --latency-budget must be greater than zero", file=sys.stderr)
+        return 2
+    if args.breaker_cooldown is not None and args.breaker_cooldown <= 0:
+        print("error: --breaker-cooldown must be greater than zero", file=sys.stderr)
+        return 2
+    if args.interval <= 0 or args.jitter < 0:
+        print("error: --interval must be positive and --jitter non-negative", file=sys.stderr)
+        return 2
+    if args.trigger is not None:
+        if args.socket is None:
+            print("error: --trigger requires --socket", file=sys.stderr)
+            return 2
+        return _send_trigger(args)
+    if args.daemon:
+        return _run_daemon(args)
+    if args.batch:
+        return _run_batch(args)
 
     try:
         config = load_config(args.config)
-        with ResearchmapClient(config.researchmap.base_url, timeout=args.timeout) as client:
+        with ExitStack() as stack:
             result = synchronize(
                 config,
-                client,
+                _client(args, config, stack),
                 args.output,
                 manual_content_directory=args.manual_content,
+                force=args.force or args.offline,
+                render_cache=_render_cache(args, stack),
+                renderer=args.renderer,
+                executor=_executor(args, stack),
+                payload_store=_payload_store(args, stack),
+                latency_budget=args.latency_budget,
+                breaker=_breaker(args),
             )
-    except (ConfigError, ResearchmapError, OSError, ValueError) as error:
+            (result,) = _settle((result,), wait=False)
+        _write_changes(args.changes, (result,))
+        _write_metrics(args, (result,))
+    except (ConfigError, ResearchmapError, OSError, ValueError, sqlite3.Error) as error:
         print(f"researchmap sync failed: {error}", file=sys.stderr)
         return 1
 
-    print(
-        f"Generated {len(result.generated_files)} files in "
-        f"{result.output_directory} at {result.last_updated}"
-    )
+    _report(result)
     return 0
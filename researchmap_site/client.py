@@ -2,48 +2,148 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, suppress
 from typing import Any
+from urllib.parse import urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-DEFAULT_TIMEOUT_SECONDS = 30.0
-RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
-SUPPORTED_SECTION_TYPES = frozenset(
-    {
-        "awards",
-        "books",
-        "books_etc",
-        "competitive_fundings",
-        "education",
-        "presentations",
-        "published_papers",
-        "research_areas",
-        "research_experience",
-    }
+from . import metrics
+from .api import (
+    BACKOFF_FACTOR,
+    BACKOFF_MAX_SECONDS,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_SECTION_WORKERS,
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_PAGE_SIZE,
+    MAX_RETRIES,
+    RETRYABLE_STATUS_CODES,
+    SUPPORTED_SECTION_TYPES,
+    USER_AGENT,
+    ResearchmapError,
+    ResearchmapUnavailableError,
+    _retry_after_seconds,
+    _unavailable_status,
+    _validate_researcher,
 )
+from .cache import CHUNK_SIZE, BodyWriter, CachedResponse, ResponseCache
+from .index import ResearcherIndex
+from .ratelimit import THROTTLE_STATUS_CODES, AdaptiveRateLimiter, shared_rate_limiter
 
+# Set on a urllib3 response whose throttling the retry policy already reported.
+THROTTLE_REPORTED = "researchmap_throttle_reported"
 
-class ResearchmapError(RuntimeError):
-    """Raised when researchmap data cannot be fetched or validated."""
 
+class _ThrottleAwareRetry(Retry):
+    """A urllib3 retry policy that reports throttling to a shared rate limiter.
 
-def _retry_policy() -> Retry:
-    return Retry(
-        total=4,
-        connect=4,
-        read=4,
-        status=4,
-        backoff_factor=1.0,
+    urllib3 retries inside the adapter, so the client never sees intermediate
+    429/503 responses. This policy feeds them to the limiter and takes a token
+    before every retry, keeping retries inside the process-wide budget. It
+    marks each response it reported, so the client does not report the last
+    one again when retries run out.
+    """
+
+    def __init__(
+        self, *args: Any, rate_limiter: AdaptiveRateLimiter | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def new(self, **kwargs: Any) -> _ThrottleAwareRetry:
+        retry = super().new(**kwargs)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+
+    def increment(self, *args: Any, **kwargs: Any) -> _ThrottleAwareRetry:
+        response = kwargs.get("response")
+        if response is None and len(args) > 2:
+            response = args[2]
+        if (
+            self.rate_limiter is not None
+            and response is not None
+            and response.status in THROTTLE_STATUS_CODES
+        ):
+            self.rate_limiter.on_throttle(_retry_after_seconds(response.headers.get("Retry-After")))
+            setattr(response, THROTTLE_REPORTED, True)
+        return super().increment(*args, **kwargs)
+
+    def sleep(self, response: Any = None) -> None:
+        # urllib3 sleeps once before every retry it makes.
+        metrics.count("http_retries")
+        super().sleep(response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+
+def _retry_policy(rate_limiter: AdaptiveRateLimiter | None = None) -> Retry:
+    return _ThrottleAwareRetry(
+        rate_limiter=rate_limiter,
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        status=MAX_RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        backoff_max=BACKOFF_MAX_SECONDS,
         status_forcelist=RETRYABLE_STATUS_CODES,
         allowed_methods=frozenset({"GET"}),
         respect_retry_after_header=True,
     )
 
 
+def _fetch_error(url: str, error: Exception) -> ResearchmapError:
+    """Wrap a failed request, telling an unavailable service from a refused request."""
+
+    response = getattr(error, "response", None)
+    refused = isinstance(error, requests.HTTPError) and response is not None
+    if isinstance(error, requests.RequestException) and not (
+        refused and not _unavailable_status(response.status_code)
+    ):
+        return ResearchmapUnavailableError(f"Failed to fetch {url}: {error}")
+    return ResearchmapError(f"Failed to fetch {url}: {error}")
+
+
+def _cache_key(url: str, params: dict[str, str]) -> str:
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def _tee(chunks: Iterable[bytes], writer: BodyWriter | None) -> Iterator[bytes]:
+    for chunk in chunks:
+        metrics.count("bytes_received", len(chunk))
+        if writer is not None and not writer.discarded:
+            try:
+                writer.write(chunk)
+            except OSError:
+                # A full or unwritable cache only costs the copy, never the fetch.
+                writer.discard()
+        yield chunk
+
+
 class ResearchmapClient:
-    """Fetch public researcher records with bounded retries and timeouts."""
+    """Fetch public researcher records with bounded retries and timeouts.
+
+    One client may be shared by several threads; ``pool_size`` is how many of
+    them fetch at once, and bounds the pooled keep-alive connections to the
+    API host. With a
+    ``cache``, responses are revalidated with ``If-None-Match`` and
+    ``If-Modified-Since`` and a ``304 Not Modified`` reuses the stored body.
+
+    With ``page_size``, the researcher is assembled from ``/{permalink}/profile``
+    and one ``limit``/``start`` paged listing per supported section type, fetched
+    concurrently by ``section_workers`` threads, instead of the single full
+    researcher document; the pool then holds ``pool_size * section_workers``
+    connections, so every section request has one. With ``stream``, the full document is parsed
+    incrementally from the socket and never held in memory as raw bytes.
+
+    Every request, including urllib3's internal retries, first takes a token
+    from ``rate_limiter``; by default all clients in the process share
+    ``shared_rate_limiter()``, which slows down on 429/503 and ``Retry-After``.
+    """
 
     def __init__(
         self,
@@ -51,60 +151,269 @@ class ResearchmapClient:
         *,
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
         session: requests.Session | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache: ResponseCache | None = None,
+        page_size: int | None = None,
+        section_workers: int = DEFAULT_SECTION_WORKERS,
+        stream: bool = False,
+        rate_limiter: AdaptiveRateLimiter | None = None,
     ) -> None:
+        if stream and page_size is not None:
+            raise ValueError("stream and page_size are mutually exclusive")
+        if page_size is not None and not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        if section_workers < 1:
+            raise ValueError("section_workers must be at least 1")
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache = cache
+        self.page_size = page_size
+        self.section_workers = section_workers
+        self.stream = stream
+        self.rate_limiter = rate_limiter or shared_rate_limiter()
         self._owns_session = session is None
         self.session = session or requests.Session()
 
         if self._owns_session:
-            adapter = HTTPAdapter(max_retries=_retry_policy())
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=pool_size * (section_workers if page_size is not None else 1),
+                max_retries=_retry_policy(self.rate_limiter),
+            )
             self.session.mount("https://", adapter)
             self.session.mount("http://", adapter)
-        self.session.headers.setdefault(
-            "User-Agent",
-            "richwomanbtc-site-sync/1.0 (+https://github.com/richwomanbtc/richwomanbtc.github.io)",
-        )
+        self.session.headers.setdefault("User-Agent", USER_AGENT)
         self.session.headers.setdefault("Accept", "application/json")
 
+    def _send(
+        self,
+        url: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+        *,
+        stream: bool = False,
+    ) -> requests.Response:
+        self.rate_limiter.acquire()
+        metrics.count("http_requests")
+        response = self.session.get(
+            url, params=params, headers=headers, timeout=self.timeout, stream=stream
+        )
+        if response.status_code in THROTTLE_STATUS_CODES:
+            if not getattr(response.raw, THROTTLE_REPORTED, False):
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+                self.rate_limiter.on_throttle(retry_after)
+        elif response.status_code < 400:
+            self.rate_limiter.on_success()
+        return response
+
+    def _get(
+        self, url: str, params: dict[str, str], *, missing_ok: bool = False
+    ) -> tuple[Any, CachedResponse | None]:
+        """Return the decoded JSON body and the cache entry to store once it is valid."""
+
+        cached = self.cache.get(_cache_key(url, params)) if self.cache is not None else None
+        try:
+            with metrics.stage("http"):
+                response = self._send(
+                    url, params, cached.validators() if cached is not None else {}
+                )
+                body = response.content
+            metrics.count("bytes_received", len(body))
+            if response.status_code == 304 and cached is not None:
+                with metrics.stage("decode"):
+                    return json.loads(cached.body), None
+            if response.status_code == 404 and missing_ok:
+                return None, None
+            response.raise_for_status()
+            with metrics.stage("decode"):
+                payload = json.loads(body)
+        except (requests.RequestException, ValueError) as error:
+            raise _fetch_error(url, error) from error
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is None or not (etag or last_modified):
+            return payload, None
+        return payload, CachedResponse(body=body, etag=etag, last_modified=last_modified)
+
+    def _store(self, url: str, params: dict[str, str], response: CachedResponse | None) -> None:
+        if self.cache is None or response is None:
+            return
+        # A cache that cannot be written only costs the next run a full download.
+        with suppress(OSError):
+            self.cache.put(_cache_key(url, params), response)
+
     def fetch_researcher(self, permalink: str) -> dict[str, Any]:
+        return self._fetch(permalink)[0]
+
+    def fetch_index(self, permalink: str) -> ResearcherIndex:
+        """Fetch and validate a researcher, returning the index validation built.
+
+        The index holds compact records instead of the raw payload, which can
+        be released as soon as this returns.
+        """
+
+        return self._fetch(permalink)[1]
+
+    def _fetch(self, permalink: str) -> tuple[dict[str, Any], ResearcherIndex]:
+        if self.page_size is not None:
+            return self._fetch_paged(permalink, self.page_size)
+        if self.stream:
+            # Decoding and validation run inside the incremental parse of ``http``.
+            with metrics.stage("http"):
+                payload = self._fetch_streaming(permalink)
+            with metrics.stage("validate"):
+                return payload, ResearcherIndex.build(payload)
+        url = f"{self.base_url}/{permalink}"
+        params = {"format": "json"}
+        payload, cacheable = self._get(url, params)
+        with metrics.stage("validate"):
+            index = _validate_researcher(payload, permalink)
+        self._store(url, params, cacheable)
+        return payload, index
+
+    def _fetch_streaming(self, permalink: str) -> dict[str, Any]:
+        # Only streaming fetches need the incremental parser.
+        from .stream import parse_researcher
+
         url = f"{self.base_url}/{permalink}"
+        params = {"format": "json"}
+        key = _cache_key(url, params)
+        cached = self.cache.get_body(key) if self.cache is not None else None
         try:
-            response = self.session.get(
+            response = self._send(
                 url,
-                params={"format": "json"},
-                timeout=self.timeout,
+                params,
+                cached.validators() if cached is not None else {},
+                stream=True,
             )
-            response.raise_for_status()
-            payload = response.json()
-        except (requests.RequestException, ValueError) as error:
-            raise ResearchmapError(f"Failed to fetch {url}: {error}") from error
+            with closing(response):
+                if response.status_code == 304 and cached is not None:
+                    return parse_researcher(cached.iter_chunks(), permalink)
+                response.raise_for_status()
+                writer = self._body_writer(
+                    key, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+                chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+                try:
+                    payload = parse_researcher(_tee(chunks, writer), permalink)
+                except BaseException:
+                    if writer is not None:
+                        writer.discard()
+                    raise
+                if writer is not None and not writer.discarded:
+                    try:
+                        writer.commit()
+                    except OSError:
+                        writer.discard()
+                return payload
+        except requests.RequestException as error:
+            raise _fetch_error(url, error) from error
+
+    def _body_writer(
+        self, key: str, etag: str | None, last_modified: str | None
+    ) -> BodyWriter | None:
+        if self.cache is None or not (etag or last_modified):
+            return None
+        try:
+            return self.cache.writer(key, etag=etag, last_modified=last_modified)
+        except OSError:
+            return None
+
+    def _fetch_page(
+        self, permalink: str, section_type: str, start: int, limit: int
+    ) -> tuple[list[Any], int | None, tuple[str, dict[str, str], CachedResponse | None]]:
+        """Fetch one page of a section and its ``total_items``, None when not reported."""
+
+        url = f"{self.base_url}/{permalink}/{section_type}"
+        params = {"format": "json", "limit": str(limit), "start": str(start)}
+        page, cacheable = self._get(url, params, missing_ok=True)
+        if page is None:
+            return [], 0, (url, params, None)
+        if not isinstance(page, dict) or not isinstance(page.get("items"), list):
+            raise ResearchmapError(f"researchmap returned a malformed {section_type} page")
+        items = page["items"]
+        total = page.get("total_items")
+        if not isinstance(total, int) or isinstance(total, bool):
+            total = None
+        return items, total, (url, params, cacheable)
 
-        if not isinstance(payload, dict):
+    def _fetch_until_short(
+        self, permalink: str, section_type: str, start: int, limit: int
+    ) -> list[tuple[list[Any], int | None, tuple[str, dict[str, str], CachedResponse | None]]]:
+        """Fetch pages one after another until one comes back short or empty."""
+
+        pages = []
+        while True:
+            page = self._fetch_page(permalink, section_type, start, limit)
+            pages.append(page)
+            if len(page[0]) < limit:
+                return pages
+            start += limit
+
+    def _fetch_paged(
+        self, permalink: str, page_size: int
+    ) -> tuple[dict[str, Any], ResearcherIndex]:
+        section_types = sorted(SUPPORTED_SECTION_TYPES)
+        profile_url = f"{self.base_url}/{permalink}/profile"
+        profile_params = {"format": "json"}
+        with ThreadPoolExecutor(
+            max_workers=self.section_workers,
+            thread_name_prefix="researchmap-page",
+        ) as executor:
+            profile_future = metrics.submit(executor, self._get, profile_url, profile_params)
+            first_pages = {
+                section_type: metrics.submit(
+                    executor, self._fetch_page, permalink, section_type, 1, page_size
+                )
+                for section_type in section_types
+            }
+            pages: dict[str, list[Future[Any]]] = {}
+            tails: dict[str, Future[list[Any]]] = {}
+            for section_type, future in first_pages.items():
+                first_items, total, _ = future.result()
+                pages[section_type] = [future]
+                if total is not None:
+                    pages[section_type] += [
+                        metrics.submit(
+                            executor, self._fetch_page, permalink, section_type, start, page_size
+                        )
+                        for start in range(1 + page_size, total + 1, page_size)
+                    ]
+                elif len(first_items) == page_size:
+                    # Without total_items, only a short or empty page ends the section.
+                    tails[section_type] = metrics.submit(
+                        executor,
+                        self._fetch_until_short,
+                        permalink,
+                        section_type,
+                        1 + page_size,
+                        page_size,
+                    )
+            header, profile_cacheable = profile_future.result()
+
+            graph: list[dict[str, Any]] = []
+            stored = [(profile_url, profile_params, profile_cacheable)]
+            for section_type in section_types:
+                items: list[Any] = []
+                fetched = [future.result() for future in pages[section_type]]
+                if section_type in tails:
+                    fetched += tails[section_type].result()
+                for page_items, _, entry in fetched:
+                    items.extend(page_items)
+                    stored.append(entry)
+                if items:
+                    graph.append({"@type": section_type, "items": items})
+
+        if not isinstance(header, dict):
             raise ResearchmapError("researchmap returned a non-object JSON payload")
-        if payload.get("@type") != "researchers":
-            raise ResearchmapError("researchmap payload is not a researcher record")
-        returned_permalink = payload.get("permalink")
-        if returned_permalink != permalink:
-            raise ResearchmapError(
-                f"researchmap returned data for an unexpected permalink: {returned_permalink!r}"
-            )
-        modified = payload.get("rm:modified")
-        if not isinstance(modified, str) or not modified.strip():
-            raise ResearchmapError("researchmap payload is missing rm:modified")
-        graph = payload.get("@graph")
-        if not isinstance(graph, list):
-            raise ResearchmapError("researchmap payload is missing an @graph array")
-        valid_item_count = sum(
-            sum(isinstance(item, dict) for item in section.get("items", []))
-            for section in graph
-            if isinstance(section, dict)
-            and section.get("@type") in SUPPORTED_SECTION_TYPES
-            and isinstance(section.get("items"), list)
-        )
-        if not graph or valid_item_count == 0:
-            raise ResearchmapError("researchmap payload contains no public section items")
-        return payload
+        payload = {key: value for key, value in header.items() if key != "@graph"}
+        payload["@graph"] = graph
+        with metrics.stage("validate"):
+            index = _validate_researcher(payload, permalink)
+        for url, params, cacheable in stored:
+            self._store(url, params, cacheable)
+        return payload, index
 
     def close(self) -> None:
         if self._owns_session:
@@ -31,10 +31,23 @@ class ResearchmapConfig:
     base_url: str
 
 
+@dataclass(frozen=True)
+class ResearcherTarget:
+    """One researcher published by a batch run into its own output directory."""
+
+    permalink: str
+    output_directory: Path
+    profile: ProfileConfig
+    manual_content_directory: Path | None = None
+
+
 @dataclass(frozen=True)
 class SiteConfig:
     researchmap: ResearchmapConfig
     profile: ProfileConfig
+    researchers: tuple[ResearcherTarget, ...] = ()
+    # Where a batch publishes the pages merging every researcher's publications.
+    aggregate_directory: Path | None = None
 
 
 def _required_string(data: dict[str, Any], key: str, section: str) -> str:
@@ -51,6 +64,88 @@ def _https_url(data: dict[str, Any], key: str, section: str) -> str:
     return value
 
 
+def _profile(profile: dict[str, Any], section: str) -> ProfileConfig:
+    links: list[SocialLink] = []
+    social_links = profile.get("social_links", [])
+    if not isinstance(social_links, list):
+        raise ConfigError(f"{section}.social_links must be an array of tables")
+    for index, item in enumerate(social_links):
+        link_section = f"{section}.social_links[{index}]"
+        if not isinstance(item, dict):
+            raise ConfigError(f"{link_section} must be a table")
+        links.append(
+            SocialLink(
+                label=_required_string(item, "label", link_section),
+                url=_https_url(item, "url", link_section),
+                mark=_required_string(item, "mark", link_section),
+            )
+        )
+    return ProfileConfig(
+        email=_required_string(profile, "email", section),
+        social_links=tuple(links),
+    )
+
+
+def _researchers(
+    raw: Any, default_profile: ProfileConfig, root: Path
+) -> tuple[ResearcherTarget, ...]:
+    if raw is None:
+        return ()
+    if not isinstance(raw, list):
+        raise ConfigError("researchers must be an array of tables")
+
+    targets: list[ResearcherTarget] = []
+    permalinks: set[str] = set()
+    outputs: set[Path] = set()
+    for index, item in enumerate(raw):
+        section = f"researchers[{index}]"
+        if not isinstance(item, dict):
+            raise ConfigError(f"{section} must be a table")
+        permalink = _required_string(item, "permalink", section)
+        output = (root / _required_string(item, "output", section)).resolve()
+        if permalink in permalinks:
+            raise ConfigError(f"{section}.permalink {permalink!r} is declared twice")
+        if output in outputs:
+            raise ConfigError(f"{section}.output {output} is shared with another researcher")
+        permalinks.add(permalink)
+        outputs.add(output)
+
+        profile = item.get("profile")
+        if profile is not None and not isinstance(profile, dict):
+            raise ConfigError(f"{section}.profile must be a table")
+        manual = item.get("manual_content")
+        targets.append(
+            ResearcherTarget(
+                permalink=permalink,
+                output_directory=output,
+                profile=(
+                    _profile(profile, f"{section}.profile")
+                    if profile is not None
+                    else default_profile
+                ),
+                manual_content_directory=(
+                    (root / _required_string(item, "manual_content", section)).resolve()
+                    if manual is not None
+                    else None
+                ),
+            )
+        )
+    return tuple(targets)
+
+
+def _aggregate(raw: Any, researchers: tuple[ResearcherTarget, ...], root: Path) -> Path | None:
+    if raw is None:
+        return None
+    if not isinstance(raw, dict):
+        raise ConfigError("aggregate must be a table")
+    if not researchers:
+        raise ConfigError("aggregate requires at least one [[researchers]] entry")
+    output = (root / _required_string(raw, "output", "aggregate")).resolve()
+    if any(target.output_directory == output for target in researchers):
+        raise ConfigError(f"aggregate.output {output} is shared with a researcher")
+    return output
+
+
 def load_config(path: str | Path) -> SiteConfig:
     """Load a validated TOML configuration file."""
 
@@ -68,31 +163,18 @@ def load_config(path: str | Path) -> SiteConfig:
     if not isinstance(profile, dict):
         raise ConfigError("Missing [profile] configuration")
 
-    links: list[SocialLink] = []
-    social_links = profile.get("social_links", [])
-    if not isinstance(social_links, list):
-        raise ConfigError("profile.social_links must be an array of tables")
-    for index, item in enumerate(social_links):
-        section = f"profile.social_links[{index}]"
-        if not isinstance(item, dict):
-            raise ConfigError(f"{section} must be a table")
-        links.append(
-            SocialLink(
-                label=_required_string(item, "label", section),
-                url=_https_url(item, "url", section),
-                mark=_required_string(item, "mark", section),
-            )
-        )
-
     base_url = _https_url(researchmap, "base_url", "researchmap").rstrip("/")
+    site_profile = _profile(profile, "profile")
+
+    root = config_path.resolve().parent
+    researchers = _researchers(raw.get("researchers"), site_profile, root)
 
     return SiteConfig(
         researchmap=ResearchmapConfig(
             permalink=_required_string(researchmap, "permalink", "researchmap"),
             base_url=base_url,
         ),
-        profile=ProfileConfig(
-            email=_required_string(profile, "email", "profile"),
-            social_links=tuple(links),
-        ),
+        profile=site_profile,
+        researchers=researchers,
+        aggregate_directory=_aggregate(raw.get("aggregate"), researchers, root),
     )
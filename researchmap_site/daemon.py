@@ -0,0 +1,265 @@
+"""A long-running sync service with staggered schedules and on-demand triggers.
+
+The daemon keeps one client, its connection pool and the warmed renderers
+for its whole lifetime, so a refresh costs network and render time only.
+Each researcher is refreshed every ``interval`` seconds at its own phase,
+spread evenly over the interval, plus a random ``jitter``. A local Unix
+socket accepts one command per line and answers with one JSON line:
+
+``refresh [PERMALINK]``
+    Queue a refresh of one researcher, or of every researcher.
+``force [PERMALINK]``
+    Like ``refresh``, but republish even when nothing changed.
+``status``
+    Report each researcher's next scheduled run and last outcome.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import random
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sync import SyncResult
+
+DEFAULT_INTERVAL_SECONDS = 24 * 60 * 60
+DEFAULT_JITTER_SECONDS = 10 * 60
+Sync = Callable[[str, bool], "SyncResult"]
+
+
+def _warm_renderers(executor: Executor | None, workers: int) -> None:
+    """Import and exercise both render paths before the first scheduled run."""
+
+    from . import render_html
+    from .config import ProfileConfig
+    from .index import ResearcherIndex
+    from .sync import _convert_markdown
+
+    _convert_markdown("# Warm up\n\n- item\n")
+    render_html.render_all(ResearcherIndex.build({}), ProfileConfig(email="", social_links=()))
+    if executor is not None:
+        # Start every worker process now instead of during the first sync.
+        for future in [executor.submit(_convert_markdown, "") for _ in range(workers)]:
+            future.result()
+
+
+class SyncDaemon:
+    """Run ``sync(permalink, force)`` on a schedule and on request.
+
+    Syncs run in a pool of ``workers`` threads; one researcher never syncs
+    twice at once, and triggers that arrive while it is syncing are merged
+    into a single follow-up run.
+    """
+
+    def __init__(
+        self,
+        permalinks: Sequence[str],
+        sync: Sync,
+        *,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        jitter: float = DEFAULT_JITTER_SECONDS,
+        workers: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not permalinks:
+            raise ValueError("The daemon needs at least one researcher")
+        if interval <= 0 or jitter < 0:
+            raise ValueError("interval must be positive and jitter non-negative")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.permalinks = tuple(permalinks)
+        self.interval = interval
+        self.jitter = jitter
+        self.workers = workers
+        self._sync = sync
+        self._clock = clock
+        self._random = rng or random.Random()
+        self._condition = threading.Condition()
+        self._stopping = False
+        now = clock()
+        self._phase = {
+            permalink: now + interval * position / len(self.permalinks)
+            for position, permalink in enumerate(self.permalinks)
+        }
+        self._schedule: list[tuple[float, str]] = []
+        for permalink, base in self._phase.items():
+            heapq.heappush(self._schedule, (base + self._random.uniform(0, jitter), permalink))
+        self._queued: dict[str, bool] = {}
+        self._running: set[str] = set()
+        self._last: dict[str, dict[str, str]] = {}
+
+    def trigger(self, permalink: str | None = None, *, force: bool = False) -> tuple[str, ...]:
+        """Queue an immediate refresh of ``permalink``, or of every researcher."""
+
+        if permalink is not None and permalink not in self._phase:
+            raise ValueError(f"Unknown researcher: {permalink}")
+        permalinks = self.permalinks if permalink is None else (permalink,)
+        with self._condition:
+            for name in permalinks:
+                self._queued[name] = self._queued.get(name, False) or force
+            self._condition.notify_all()
+        return permalinks
+
+    def status(self) -> dict[str, Any]:
+        now = self._clock()
+        with self._condition:
+            due = {permalink: at for at, permalink in self._schedule}
+            return {
+                permalink: {
+                    "next_run_seconds": round(max(0.0, due[permalink] - now), 3),
+                    "running": permalink in self._running,
+                    "queued": permalink in self._queued,
+                    **self._last.get(permalink, {}),
+                }
+                for permalink in self.permalinks
+            }
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+    def _ready(self) -> list[tuple[str, bool]] | None:
+        """Wait until syncs can start and return them, or None once stopped."""
+
+        with self._condition:
+            while not self._stopping:
+                now = self._clock()
+                while self._schedule and self._schedule[0][0] <= now:
+                    _, permalink = heapq.heappop(self._schedule)
+                    # The base advances by whole intervals, so jitter never accumulates.
+                    self._phase[permalink] += self.interval
+                    while self._phase[permalink] <= now:
+                        self._phase[permalink] += self.interval
+                    due = self._phase[permalink] + self._random.uniform(0, self.jitter)
+                    heapq.heappush(self._schedule, (due, permalink))
+                    self._queued.setdefault(permalink, False)
+                ready = [
+                    (permalink, force)
+                    for permalink, force in self._queued.items()
+                    if permalink not in self._running
+                ]
+                if ready:
+                    for permalink, _ in ready:
+                        del self._queued[permalink]
+                        self._running.add(permalink)
+                    return ready
+                timeout = self._schedule[0][0] - now if self._schedule else None
+                self._condition.wait(timeout)
+            return None
+
+    def _finish(self, permalink: str, future: Future[SyncResult]) -> None:
+        error = future.exception()
+        if error is not None:
+            print(f"researchmap sync failed for {permalink}: {error}", file=sys.stderr)
+            outcome = {"last_status": "failed", "last_error": str(error)}
+        else:
+            outcome = {"last_status": future.result().status}
+        with self._condition:
+            self._running.discard(permalink)
+            self._last[permalink] = {
+                **outcome,
+                "last_finished": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            self._condition.notify_all()
+
+    def run(self) -> None:
+        """Serve schedules and triggers until ``stop``, then finish running syncs."""
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="researchmap-daemon"
+        ) as pool:
+            while (ready := self._ready()) is not None:
+                for permalink, force in ready:
+                    future = pool.submit(self._sync, permalink, force)
+                    future.add_done_callback(
+                        lambda done, permalink=permalink: self._finish(permalink, done)
+                    )
+
+    def handle(self, line: str) -> dict[str, Any]:
+        """Answer one socket command."""
+
+        command, _, argument = line.strip().partition(" ")
+        argument = argument.strip()
+        try:
+            if command in ("refresh", "force"):
+                queued = self.trigger(argument or None, force=command == "force")
+                return {"queued": list(queued)}
+            if command == "status" and not argument:
+                return {"researchers": self.status()}
+        except ValueError as error:
+            return {"error": str(error)}
+        return {"error": f"Unknown command: {line.strip()!r}"}
+
+    @contextmanager
+    def serve(self, path: str | Path) -> Iterator[Path]:
+        """Accept commands on a Unix socket at ``path`` while the context is open."""
+
+        path = Path(path)
+        with suppress(FileNotFoundError):
+            if not stat.S_ISSOCK(path.lstat().st_mode):
+                raise OSError(f"Refusing to replace non-socket file: {path}")
+            # A socket left behind by a crashed daemon refuses connections.
+            with socket.socket(socket.AF_UNIX) as probe:
+                if probe.connect_ex(str(path)) == 0:
+                    raise OSError(f"Another daemon is listening on {path}")
+            path.unlink()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    reply = daemon.handle(raw.decode("utf-8", errors="replace"))
+                    self.wfile.write(json.dumps(reply, ensure_ascii=False).encode() + b"\n")
+
+        server = socketserver.ThreadingUnixStreamServer(str(path), Handler, bind_and_activate=False)
+        server.daemon_threads = True
+        # The socket must be private from the moment it exists, not after a chmod.
+        umask = os.umask(0o077)
+        try:
+            server.server_bind()
+            server.server_activate()
+        except OSError:
+            server.server_close()
+            raise
+        finally:
+            os.umask(umask)
+        thread = threading.Thread(target=server.serve_forever, name="researchmap-socket")
+        thread.start()
+        try:
+            yield path
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            with suppress(FileNotFoundError):
+                path.unlink()
+
+
+def request(path: str | Path, command: str, *, timeout: float = 10.0) -> dict[str, Any]:
+    """Send one command to a running daemon and return its reply."""
+
+    with socket.socket(socket.AF_UNIX) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(path))
+        connection.sendall(command.strip().encode("utf-8") + b"\n")
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("rb") as replies:
+            reply = replies.readline()
+    if not reply:
+        raise OSError(f"No reply from the daemon at {path}")
+    return json.loads(reply)
@@ -0,0 +1,130 @@
+"""Item-level differences between two payloads of the same researcher."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SectionDiff:
+    """Item ids added, removed, or modified within one section type."""
+
+    section_type: str
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    modified: tuple[str, ...] = ()
+
+    def summary(self) -> str:
+        return (
+            f"{self.section_type}: {len(self.added)} added, "
+            f"{len(self.modified)} modified, {len(self.removed)} removed"
+        )
+
+
+@dataclass(frozen=True)
+class PayloadDiff:
+    """What changed in a researcher payload since the previous stored snapshot.
+
+    ``previous_modified`` is empty when there was no earlier snapshot, in
+    which case every item is reported as added. ``fields`` names the changed
+    top-level members; ``sections`` lists only section types with changes.
+    """
+
+    permalink: str
+    previous_modified: str
+    modified: str
+    fields: tuple[str, ...] = ()
+    sections: tuple[SectionDiff, ...] = ()
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.fields or self.sections)
+
+    def section(self, section_type: str) -> SectionDiff | None:
+        return next((diff for diff in self.sections if diff.section_type == section_type), None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "permalink": self.permalink,
+            "previous_modified": self.previous_modified,
+            "modified": self.modified,
+            "fields": list(self.fields),
+            "sections": {
+                diff.section_type: {
+                    "added": list(diff.added),
+                    "removed": list(diff.removed),
+                    "modified": list(diff.modified),
+                }
+                for diff in self.sections
+            },
+        }
+
+
+def _digest(value: Any) -> str:
+    data = json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _items(payload: Mapping[str, Any]) -> dict[str, dict[str, str]]:
+    """Return section type → item key → content digest.
+
+    Items are keyed by ``rm:id``. Items without one are keyed by their
+    content, so an edit to them reads as a removal plus an addition.
+    """
+
+    sections: dict[str, dict[str, str]] = {}
+    graph = payload.get("@graph")
+    for section in graph if isinstance(graph, list) else ():
+        if not isinstance(section, Mapping) or not isinstance(section.get("@type"), str):
+            continue
+        items = sections.setdefault(section["@type"], {})
+        section_items = section.get("items")
+        for item in section_items if isinstance(section_items, list) else ():
+            if not isinstance(item, Mapping):
+                continue
+            digest = _digest(item)
+            identifier = item.get("rm:id")
+            items[str(identifier) if identifier is not None else f"sha256:{digest}"] = digest
+    return sections
+
+
+def diff_payloads(
+    permalink: str, previous: Mapping[str, Any] | None, current: Mapping[str, Any]
+) -> PayloadDiff:
+    """Compare two payloads section by section, matching items by ``rm:id``."""
+
+    before = _items(previous or {})
+    after = _items(current)
+    sections: list[SectionDiff] = []
+    for section_type in sorted(before.keys() | after.keys()):
+        old = before.get(section_type, {})
+        new = after.get(section_type, {})
+        diff = SectionDiff(
+            section_type,
+            added=tuple(key for key in new if key not in old),
+            removed=tuple(key for key in old if key not in new),
+            modified=tuple(key for key, digest in new.items() if old.get(key, digest) != digest),
+        )
+        if diff.added or diff.removed or diff.modified:
+            sections.append(diff)
+
+    old_fields = {key: value for key, value in (previous or {}).items() if key != "@graph"}
+    new_fields = {key: value for key, value in current.items() if key != "@graph"}
+    fields = tuple(
+        sorted(
+            key
+            for key in old_fields.keys() | new_fields.keys()
+            if key not in old_fields or key not in new_fields or old_fields[key] != new_fields[key]
+        )
+    )
+    return PayloadDiff(
+        permalink=permalink,
+        previous_modified=str((previous or {}).get("rm:modified") or ""),
+        modified=str(current.get("rm:modified") or ""),
+        fields=fields,
+        sections=tuple(sections),
+    )
@@ -0,0 +1,221 @@
+"""Responsive image variants and icon sets, cached by the hash of their source.
+
+Generating images needs the optional Pillow dependency (``pip install
+researchmap-site[images]``). Cached variants are reused without it; when it
+is missing and nothing is cached, images are published unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import shutil
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+# Bump when the generated output changes for the same source and settings.
+IMAGE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ResponsiveImage:
+    widths: tuple[int, ...]
+    sizes: str
+
+
+@dataclass(frozen=True)
+class Variant:
+    path: str
+    mime_type: str
+    width: int
+
+
+# The portrait is shown at most 8.6rem (about 138 CSS px) wide; see .hero-portrait.
+RESPONSIVE_IMAGES = {
+    "assets/images/profile.jpg": ResponsiveImage(widths=(160, 320, 480), sizes="138px"),
+}
+# Preferred formats first; the last one is the <img> fallback every browser reads.
+FORMATS = (("AVIF", "image/avif", ".avif"), ("WEBP", "image/webp", ".webp"))
+FALLBACK_FORMAT = ("JPEG", "image/jpeg", ".jpg")
+ICON_SOURCE = "assets/images/android-chrome-512x512.png"
+ICONS = {
+    "assets/images/android-chrome-192x192.png": (192,),
+    "assets/images/apple-touch-icon.png": (180,),
+    "assets/images/favicon-32x32.png": (32,),
+    "assets/images/favicon-16x16.png": (16,),
+    "assets/images/favicon.ico": (16, 32, 48),
+}
+SAVE_OPTIONS: dict[str, dict[str, Any]] = {
+    "AVIF": {"quality": 60},
+    "WEBP": {"quality": 80, "method": 6},
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+}
+HASH_LENGTH = 10
+
+# Writes generated files into a directory and lists them, or returns None without Pillow.
+Generate = Callable[[Path], "list[dict[str, Any]] | None"]
+
+
+def _pillow() -> ModuleType | None:
+    try:
+        import PIL.Image
+    except ImportError:
+        return None
+    return PIL.Image
+
+
+def _cached(cache: Path, key: str) -> list[dict[str, Any]] | None:
+    try:
+        manifest = json.loads((cache / key / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, list) or not all(
+        isinstance(entry, dict) and (cache / key / str(entry.get("file"))).is_file()
+        for entry in manifest
+    ):
+        return None
+    return manifest
+
+
+def _generate_variants(
+    source: Path, spec: ResponsiveImage, target: Path
+) -> list[dict[str, Any]] | None:
+    image_module = _pillow()
+    if image_module is None:
+        return None
+    from PIL import ImageOps, features
+
+    formats = [entry for entry in FORMATS if features.check(entry[0].lower())]
+    manifest: list[dict[str, Any]] = []
+    with image_module.open(source) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    for width in spec.widths:
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), image_module.Resampling.LANCZOS)
+        for format_name, mime_type, suffix in (*formats, FALLBACK_FORMAT):
+            name = f"{source.stem}-{width}w{suffix}"
+            resized.save(target / name, format=format_name, **SAVE_OPTIONS[format_name])
+            manifest.append({"file": name, "mime_type": mime_type, "width": width})
+    return manifest
+
+
+def _generate_icons(source: Path, target: Path) -> list[dict[str, Any]] | None:
+    image_module = _pillow()
+    if image_module is None:
+        return None
+    manifest: list[dict[str, Any]] = []
+    with image_module.open(source) as original:
+        image = original.convert("RGBA")
+    for path, sizes in ICONS.items():
+        name = Path(path).name
+        if name.endswith(".ico"):
+            image.save(target / name, format="ICO", sizes=[(size, size) for size in sizes])
+        else:
+            resized = image.resize((sizes[0], sizes[0]), image_module.Resampling.LANCZOS)
+            resized.save(target / name, format="PNG", optimize=True)
+        manifest.append({"file": name, "path": path})
+    return manifest
+
+
+def _build(cache: Path, key: str, generate: Generate) -> tuple[Path, list[dict[str, Any]]] | None:
+    entry = cache / key
+    manifest = _cached(cache, key)
+    if manifest is not None:
+        return entry, manifest
+    staging = cache / f".{key}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    try:
+        manifest = generate(staging)
+        if manifest is None:
+            return None
+        (staging / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        shutil.rmtree(entry, ignore_errors=True)
+        staging.rename(entry)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return entry, manifest
+
+
+def _key(source: Path, settings: object) -> str:
+    digest = hashlib.sha256(f"{IMAGE_VERSION}:{settings!r}:".encode())
+    digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _picture(img: str, variants: Sequence[Variant], sizes: str) -> str:
+    """Wrap an ``<img>`` tag in a ``<picture>`` offering every variant."""
+
+    sources: list[str] = []
+    for _, mime_type, _ in FORMATS:
+        srcset = ", ".join(f"{v.path} {v.width}w" for v in variants if v.mime_type == mime_type)
+        if srcset:
+            sources.append(f'<source type="{mime_type}" srcset="{srcset}" sizes="{sizes}">')
+    fallback = [v for v in variants if v.mime_type == FALLBACK_FORMAT[1]]
+    srcset = ", ".join(f"{v.path} {v.width}w" for v in fallback)
+    img = re.sub(
+        r'\bsrc="[^"]*"',
+        lambda _: f'src="{fallback[-1].path}" srcset="{srcset}" sizes="{sizes}"',
+        img,
+        count=1,
+    )
+    return "<picture>" + "".join(sources) + img + "</picture>"
+
+
+def _use_picture(html: str, reference: str, variants: Sequence[Variant], sizes: str) -> str:
+    return re.sub(
+        rf'<img\b[^>]*\bsrc="{re.escape(reference)}"[^>]*>',
+        lambda match: _picture(match[0], variants, sizes),
+        html,
+    )
+
+
+def build_images(staging: Path, cache: Path) -> tuple[str, ...]:
+    """Add responsive variants and regenerated icons to a staged site.
+
+    Returns the staged files written. Sources whose hash matches a cached
+    build are not decoded again.
+    """
+
+    written: list[str] = []
+    index = staging / "index.html"
+    html = index.read_text(encoding="utf-8")
+    for reference, spec in RESPONSIVE_IMAGES.items():
+        source = staging / reference
+        if not source.is_file():
+            continue
+        key = _key(source, spec)
+        built = _build(cache, key, partial(_generate_variants, source, spec))
+        if built is None:
+            continue
+        entry, manifest = built
+        variants: list[Variant] = []
+        for item in manifest:
+            name = Path(item["file"])
+            published = source.with_name(f"{name.stem}.{key[:HASH_LENGTH]}{name.suffix}")
+            shutil.copyfile(entry / name, published)
+            path = published.relative_to(staging).as_posix()
+            written.append(path)
+            variants.append(Variant(path, item["mime_type"], item["width"]))
+        html = _use_picture(html, reference, variants, spec.sizes)
+    index.write_text(html, encoding="utf-8")
+
+    icon_source = staging / ICON_SOURCE
+    if icon_source.is_file():
+        key = _key(icon_source, ICONS)
+        built = _build(cache, key, partial(_generate_icons, icon_source))
+        if built is not None:
+            entry, manifest = built
+            for item in manifest:
+                generated, published = entry / item["file"], staging / item["path"]
+                # Hand-optimized icons in the checkout win over larger generated ones.
+                if published.is_file() and published.stat().st_size <= generated.stat().st_size:
+                    continue
+                shutil.copyfile(generated, published)
+                written.append(item["path"])
+    return tuple(written)
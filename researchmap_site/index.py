@@ -0,0 +1,104 @@
+"""A normalized, indexed view of a researcher payload built in one pass."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .records import RECORD_TYPES, _people, _text
+
+# Item fields that hold person lists rather than multilingual text.
+PEOPLE_FIELDS = ("authors", "presenters")
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    """An item of a section without a typed record, with its text resolved up front.
+
+    ``texts`` holds the preferred-language text of every text or language-map
+    field that has one, ``people`` the names of each person-list field. The
+    source item stays available for flags, identifiers and dates.
+    """
+
+    item: Mapping[str, Any]
+    texts: Mapping[str, str]
+    people: Mapping[str, tuple[str, ...]]
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Record:
+        texts: dict[str, str] = {}
+        for key, value in item.items():
+            if isinstance(value, str | Mapping) and (text := _text(value)):
+                texts[key] = text
+        people = {key: tuple(_people(item[key])) for key in PEOPLE_FIELDS if key in item}
+        return cls(item, texts, people)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.item.get(key, default)
+
+    def text(self, *keys: str) -> str:
+        """Return the first non-empty text among ``keys``."""
+
+        for key in keys:
+            text = self.texts.get(key)
+            if text:
+                return text
+        return ""
+
+
+@dataclass(frozen=True, slots=True)
+class ResearcherIndex:
+    """Section type → records for one researcher payload.
+
+    Items of rendered sections become the typed records of ``records``; other
+    sections keep generic ``Record``s. ``fields`` holds the top-level members
+    besides ``@graph``, so the index does not keep the raw graph alive. Only
+    the first section of each type is indexed, matching how sections are
+    rendered; ``item_counts`` counts the object items of every section.
+    """
+
+    fields: Mapping[str, Any]
+    sections: Mapping[str, tuple[Any, ...]]
+    item_counts: Mapping[str, int]
+
+    @classmethod
+    def build(cls, payload: Mapping[str, Any]) -> ResearcherIndex:
+        sections: dict[str, tuple[Any, ...]] = {}
+        counts: dict[str, int] = {}
+        graph = payload.get("@graph", [])
+        for section in graph if isinstance(graph, list) else ():
+            if not isinstance(section, dict):
+                continue
+            section_type = section.get("@type")
+            if not isinstance(section_type, str) or section_type in sections:
+                if isinstance(section_type, str):
+                    counts[section_type] += _object_count(section.get("items"))
+                continue
+            items = section.get("items", [])
+            items = items if isinstance(items, list) else []
+            convert = RECORD_TYPES.get(section_type, Record).from_item
+            records = tuple(convert(item) for item in items if isinstance(item, dict))
+            sections[section_type] = records
+            counts[section_type] = len(records)
+        fields = {key: value for key, value in payload.items() if key != "@graph"}
+        return cls(fields, sections, counts)
+
+    @classmethod
+    def of(cls, source: Mapping[str, Any] | ResearcherIndex) -> ResearcherIndex:
+        return source if isinstance(source, ResearcherIndex) else cls.build(source)
+
+    def section(self, *section_types: str) -> tuple[Any, ...]:
+        """Return the records of the first indexed section of any of ``section_types``."""
+
+        for section_type, records in self.sections.items():
+            if section_type in section_types:
+                return records
+        return ()
+
+    def item_count(self, section_types: Iterable[str]) -> int:
+        return sum(self.item_counts.get(section_type, 0) for section_type in section_types)
+
+
+def _object_count(items: Any) -> int:
+    return sum(isinstance(item, dict) for item in items) if isinstance(items, list) else 0
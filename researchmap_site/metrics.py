@@ -0,0 +1,229 @@
+"""Per-stage timings and counters of one sync run.
+
+``synchronize`` installs a ``Metrics`` collector in a context variable for
+the duration of the run; the client and renderers report into whichever
+collector is current, so a client shared by concurrent syncs attributes its
+requests, retries and bytes to the right researcher. Outside a run the
+reporting functions do nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+PROMETHEUS_PREFIX = "researchmap_sync"
+COUNTERS = {
+    "http_requests": "HTTP requests made by the client, not counting urllib3 retries.",
+    "http_retries": "HTTP requests retried by urllib3 after an error or throttling.",
+    "bytes_received": "Response body bytes received from researchmap.",
+    "bytes_written": "Bytes of changed files written to the staging directory.",
+}
+METRICS_FORMATS = ("jsonl", "prometheus")
+
+_current: ContextVar[Metrics | None] = ContextVar("researchmap_metrics", default=None)
+
+
+@dataclass(frozen=True)
+class StageTime:
+    """Time spent in a stage, summed over its calls.
+
+    ``cpu_seconds`` is the CPU time of the calling thread, so work handed to
+    worker processes only shows up in ``wall_seconds``.
+    """
+
+    wall_seconds: float
+    cpu_seconds: float
+    calls: int
+
+
+@dataclass(frozen=True)
+class SyncMetrics:
+    """Stage timings, counters and section item counts of one sync.
+
+    Stages nest: ``fetch`` includes the client's ``http``, ``decode`` and
+    ``validate``, and ``render`` includes the ``render.<kind>`` stages of
+    items rendered in this process. ``store`` covers saving the payload to a
+    payload store and diffing it against the previous snapshot.
+    """
+
+    stages: Mapping[str, StageTime]
+    counters: Mapping[str, int]
+    items: Mapping[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stages": {
+                name: {
+                    "wall_seconds": round(stage.wall_seconds, 6),
+                    "cpu_seconds": round(stage.cpu_seconds, 6),
+                    "calls": stage.calls,
+                }
+                for name, stage in self.stages.items()
+            },
+            "counters": dict(self.counters),
+            "items": dict(self.items),
+        }
+
+
+class Metrics:
+    """A thread-safe collector for one sync run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, list[float]] = {}
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._items: dict[str, int] = {}
+
+    def add_stage(self, name: str, wall_seconds: float, cpu_seconds: float) -> None:
+        with self._lock:
+            stage = self._stages.setdefault(name, [0.0, 0.0, 0])
+            stage[0] += wall_seconds
+            stage[1] += cpu_seconds
+            stage[2] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        if name not in COUNTERS:
+            raise ValueError(f"Unknown counter: {name!r}")
+        with self._lock:
+            self._counters[name] += value
+
+    def set_items(self, counts: Mapping[str, int]) -> None:
+        with self._lock:
+            self._items = dict(sorted(counts.items()))
+
+    def snapshot(self) -> SyncMetrics:
+        with self._lock:
+            return SyncMetrics(
+                stages={
+                    name: StageTime(wall, cpu, int(calls))
+                    for name, (wall, cpu, calls) in self._stages.items()
+                },
+                counters=dict(self._counters),
+                items=dict(self._items),
+            )
+
+
+@contextmanager
+def collecting(metrics: Metrics) -> Iterator[Metrics]:
+    """Make ``metrics`` the current collector of this thread or task."""
+
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as ``name`` in the current collector."""
+
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        metrics.add_stage(name, time.perf_counter() - wall, time.thread_time() - cpu)
+
+
+def count(name: str, value: int = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.count(name, value)
+
+
+def set_items(counts: Mapping[str, int]) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.set_items(counts)
+
+
+def submit(
+    executor: Executor, function: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> Future[T]:
+    """Submit ``function`` to a thread pool so it reports into the current collector."""
+
+    return executor.submit(copy_context().run, function, *args, **kwargs)
+
+
+def json_line(permalink: str, status: str, metrics: SyncMetrics) -> str:
+    record = {"permalink": permalink, "status": status, **metrics.to_dict()}
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(runs: Sequence[tuple[str, SyncMetrics]]) -> str:
+    """Render ``(permalink, metrics)`` pairs in the Prometheus text exposition format."""
+
+    families: list[tuple[str, str, list[tuple[str, float]]]] = []
+
+    def family(name: str, help_text: str) -> list[tuple[str, float]]:
+        samples: list[tuple[str, float]] = []
+        families.append((f"{PROMETHEUS_PREFIX}_{name}", help_text, samples))
+        return samples
+
+    wall = family("stage_wall_seconds", "Wall time spent in each sync stage.")
+    cpu = family("stage_cpu_seconds", "CPU time of the syncing thread in each sync stage.")
+    calls = family("stage_calls", "Times each sync stage ran.")
+    counters = {name: family(name, help_text) for name, help_text in COUNTERS.items()}
+    items = family("items", "Items of each researchmap section type.")
+    for permalink, metrics in runs:
+        researcher = f'permalink="{_label(permalink)}"'
+        for name, timing in metrics.stages.items():
+            labels = f'{researcher},stage="{_label(name)}"'
+            wall.append((labels, timing.wall_seconds))
+            cpu.append((labels, timing.cpu_seconds))
+            calls.append((labels, timing.calls))
+        for name, value in metrics.counters.items():
+            counters[name].append((researcher, value))
+        for section_type, value in metrics.items.items():
+            items.append((f'{researcher},section="{_label(section_type)}"', value))
+
+    lines: list[str] = []
+    for name, help_text, samples in families:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        lines += [f"{name}{{{labels}}} {value!r}" for labels, value in samples]
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(
+    path: Path, metrics_format: str, runs: Sequence[tuple[str, str, SyncMetrics]]
+) -> None:
+    """Append JSON lines, or atomically replace a Prometheus textfile.
+
+    ``runs`` holds ``(permalink, status, metrics)`` of each sync.
+    """
+
+    if metrics_format == "jsonl":
+        with path.open("a", encoding="utf-8") as file:
+            for permalink, status, metrics in runs:
+                file.write(json_line(permalink, status, metrics))
+    elif metrics_format == "prometheus":
+        # The textfile collector may read at any time, so it must never see a partial file.
+        temporary = path.with_name(f".{path.name}.tmp")
+        text = prometheus_text([(permalink, metrics) for permalink, _, metrics in runs])
+        temporary.write_text(text, encoding="utf-8")
+        os.replace(temporary, path)
+    else:
+        raise ValueError(f"Unknown metrics format: {metrics_format!r}")
@@ -0,0 +1,342 @@
+"""Compressed history of researcher payloads for offline rebuilds and audits."""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import threading
+import zlib
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import IO, Any
+from uuid import uuid4
+
+from .cache import _write_atomic
+
+DEFAULT_KEEP = 10
+INDEX_NAME = "index.jsonl"
+LOCK_NAME = "lock"
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One stored payload: its top-level fields and ``@graph`` sections by blob hash."""
+
+    permalink: str
+    modified: str
+    stored_at: str
+    fields: str
+    sections: tuple[str, ...]
+
+
+def _encode(value: Any) -> tuple[str, bytes]:
+    data = json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    raw = data.encode("utf-8")
+    return hashlib.sha256(raw).hexdigest(), raw
+
+
+def _line(record: Mapping[str, Any]) -> bytes:
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class PayloadStore:
+    """Append-only snapshots of researcher payloads with per-section dedup.
+
+    Each payload is split into its top-level fields and its ``@graph``
+    sections. Every distinct part is stored once, as a zlib frame appended to
+    a pack file, so a weekly snapshot of an unchanged researcher costs one
+    index line. ``index.jsonl`` records where each frame lives and which
+    frames make up each snapshot, keyed by permalink and ``rm:modified``; it
+    is read once on open, and frames are then decoded straight from a memory
+    map of the pack.
+
+    ``keep`` bounds the snapshots retained per researcher, and ``max_age``
+    drops older ones, although the latest snapshot is always kept.
+    ``compact`` applies the policy and rewrites the pack without unreferenced
+    frames; it runs automatically once most snapshots are past retention.
+    The store may be shared by the threads of one process, and by processes:
+    opening, saving and compacting hold an exclusive ``flock`` on ``lock`` in
+    the directory, and a save first rereads an index that another process
+    changed. It also satisfies
+    ``ResearcherFetcher``, so a rebuild can render from the latest snapshots
+    without touching the network.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        keep: int = DEFAULT_KEEP,
+        max_age: timedelta | None = None,
+    ) -> None:
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.keep = keep
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._blobs: dict[str, tuple[int, int]] = {}
+        self._snapshots: dict[str, list[Snapshot]] = {}
+        self._view: mmap.mmap | None = None
+        self._lock_file = (self.directory / LOCK_NAME).open("a+b")
+        try:
+            with self._exclusive():
+                self._open()
+        except BaseException:
+            self._lock_file.close()
+            raise
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Keep other processes from changing the index and packs meanwhile."""
+
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / INDEX_NAME
+
+    def _open(self) -> None:
+        self._blobs, self._snapshots = {}, {}
+        try:
+            content = self._index_path.read_bytes()
+        except FileNotFoundError:
+            content = b""
+        # A crash can leave a partial last line; later appends must not extend it.
+        complete = content[: content.rfind(b"\n") + 1]
+        lines = complete.splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else None
+            pack_name = header["pack"] if isinstance(header, dict) else None
+        except (ValueError, KeyError):
+            pack_name = None
+        if not isinstance(pack_name, str):
+            pack_name = f"pack-{uuid4().hex}.dat"
+            complete = _line({"pack": pack_name})
+            lines = [complete]
+            _write_atomic(self._index_path, complete)
+        elif len(complete) != len(content):
+            with self._index_path.open("r+b") as index:
+                index.truncate(len(complete))
+        self._index_size = len(complete)
+
+        self._pack_path = self.directory / pack_name
+        self._pack: IO[bytes] = self._pack_path.open("a+b")
+        size = self._pack.seek(0, os.SEEK_END)
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                if "blob" in record:
+                    offset, length = record["offset"], record["length"]
+                    if offset + length <= size:
+                        self._blobs[record["blob"]] = (offset, length)
+                    continue
+                snapshot = Snapshot(**{**record, "sections": tuple(record["sections"])})
+            except (ValueError, KeyError, TypeError):
+                continue
+            if all(part in self._blobs for part in (snapshot.fields, *snapshot.sections)):
+                self._snapshots.setdefault(snapshot.permalink, []).append(snapshot)
+        self._index: IO[bytes] = self._index_path.open("ab")
+        # Packs left behind by an interrupted compaction are unreachable; no
+        # other process can be switching packs while the lock is held.
+        for path in self.directory.glob("pack-*.dat"):
+            if path != self._pack_path:
+                path.unlink(missing_ok=True)
+
+    def _reload(self) -> None:
+        """Reread the index if another process appended to it or compacted the store."""
+
+        try:
+            current = os.stat(self._index_path)
+        except FileNotFoundError:
+            current = None
+        opened = os.fstat(self._index.fileno())
+        if current is not None and (current.st_ino, current.st_size) == (
+            opened.st_ino,
+            self._index_size,
+        ):
+            return
+        self._close_files()
+        self._open()
+
+    def save(self, permalink: str, payload: Mapping[str, Any]) -> Snapshot:
+        """Append a snapshot of ``payload`` unless it matches the latest one."""
+
+        fields = {key: value for key, value in payload.items() if key != "@graph"}
+        graph = payload.get("@graph")
+        parts = [_encode(fields), *(_encode(section) for section in graph or ())]
+        with self._lock, self._exclusive():
+            self._reload()
+            lines: list[bytes] = []
+            offset = self._pack.seek(0, os.SEEK_END)
+            for digest, raw in parts:
+                if digest in self._blobs:
+                    continue
+                frame = zlib.compress(raw)
+                self._pack.write(frame)
+                self._blobs[digest] = (offset, len(frame))
+                lines.append(_line({"blob": digest, "offset": offset, "length": len(frame)}))
+                offset += len(frame)
+
+            history = self._snapshots.setdefault(permalink, [])
+            snapshot = Snapshot(
+                permalink=permalink,
+                modified=str(payload.get("rm:modified") or ""),
+                stored_at=datetime.now(UTC).isoformat(timespec="seconds"),
+                fields=parts[0][0],
+                sections=tuple(digest for digest, _ in parts[1:]),
+            )
+            latest = history[-1] if history else None
+            if latest is not None and (latest.modified, latest.fields, latest.sections) == (
+                snapshot.modified,
+                snapshot.fields,
+                snapshot.sections,
+            ):
+                return latest
+            lines.append(_line(asdict(snapshot)))
+            # Frames are durable before the index line that references them.
+            self._pack.flush()
+            os.fsync(self._pack.fileno())
+            index_lines = b"".join(lines)
+            self._index.write(index_lines)
+            self._index.flush()
+            os.fsync(self._index.fileno())
+            self._index_size += len(index_lines)
+            history.append(snapshot)
+            if self._expired_count() > self._retained_count():
+                self._compact()
+            return snapshot
+
+    def history(self, permalink: str) -> tuple[Snapshot, ...]:
+        """Return the stored snapshots of ``permalink``, oldest first."""
+
+        with self._lock:
+            return tuple(self._snapshots.get(permalink, ()))
+
+    def load(self, permalink: str, modified: str | None = None) -> dict[str, Any]:
+        """Decode the latest snapshot, or the latest with the given ``rm:modified``."""
+
+        with self._lock:
+            for snapshot in reversed(self._snapshots.get(permalink, ())):
+                if modified is None or snapshot.modified == modified:
+                    payload = self._decode(snapshot.fields)
+                    if not isinstance(payload, dict):
+                        raise ValueError(f"Stored payload is not a JSON object: {permalink}")
+                    payload["@graph"] = [self._decode(digest) for digest in snapshot.sections]
+                    return payload
+        wanted = permalink if modified is None else f"{permalink} at {modified}"
+        raise OSError(f"No stored payload for {wanted!r} in {self.directory}")
+
+    def fetch_researcher(self, permalink: str) -> dict[str, Any]:
+        return self.load(permalink)
+
+    def _decode(self, digest: str) -> Any:
+        offset, length = self._blobs[digest]
+        if self._view is None or offset + length > len(self._view):
+            if self._view is not None:
+                self._view.close()
+            self._pack.flush()
+            self._view = mmap.mmap(self._pack.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            raw = zlib.decompress(self._view[offset : offset + length])
+        except zlib.error as error:
+            raise ValueError(f"Stored payload frame is corrupt: {self._pack_path}") from error
+        if hashlib.sha256(raw).hexdigest() != digest:
+            raise ValueError(f"Stored payload frame is corrupt: {self._pack_path}")
+        return json.loads(raw)
+
+    def _retained(self, history: list[Snapshot]) -> list[Snapshot]:
+        retained = history[-self.keep :]
+        if self.max_age is not None:
+            cutoff = (datetime.now(UTC) - self.max_age).isoformat(timespec="seconds")
+            retained = [
+                snapshot for snapshot in retained[:-1] if snapshot.stored_at >= cutoff
+            ] + retained[-1:]
+        return retained
+
+    def _retained_count(self) -> int:
+        return sum(min(len(history), self.keep) for history in self._snapshots.values())
+
+    def _expired_count(self) -> int:
+        return sum(max(len(history) - self.keep, 0) for history in self._snapshots.values())
+
+    def compact(self) -> int:
+        """Apply the retention policy, rewrite the pack, and return dropped snapshots."""
+
+        with self._lock, self._exclusive():
+            self._reload()
+            return self._compact()
+
+    def _compact(self) -> int:
+        kept = {
+            permalink: self._retained(history)
+            for permalink, history in self._snapshots.items()
+            if history
+        }
+        dropped = sum(len(history) for history in self._snapshots.values()) - sum(
+            len(history) for history in kept.values()
+        )
+        live = dict.fromkeys(
+            part
+            for history in kept.values()
+            for snapshot in history
+            for part in (snapshot.fields, *snapshot.sections)
+        )
+
+        self._pack.flush()
+        pack_name = f"pack-{uuid4().hex}.dat"
+        pack_path = self.directory / pack_name
+        blobs: dict[str, tuple[int, int]] = {}
+        lines = [_line({"pack": pack_name})]
+        with self._pack_path.open("rb") as source, pack_path.open("wb") as target:
+            for digest in live:
+                offset, length = self._blobs[digest]
+                source.seek(offset)
+                blobs[digest] = (target.tell(), length)
+                target.write(source.read(length))
+                lines.append(_line({"blob": digest, "offset": blobs[digest][0], "length": length}))
+            target.flush()
+            os.fsync(target.fileno())
+        lines.extend(_line(asdict(snapshot)) for history in kept.values() for snapshot in history)
+        # The index names its pack, so replacing it switches both at once.
+        index = b"".join(lines)
+        _write_atomic(self._index_path, index)
+
+        self._close_files()
+        self._pack_path.unlink(missing_ok=True)
+        self._pack_path = pack_path
+        self._pack = pack_path.open("a+b")
+        self._index = self._index_path.open("ab")
+        self._index_size = len(index)
+        self._blobs = blobs
+        self._snapshots = kept
+        return dropped
+
+    def _close_files(self) -> None:
+        if self._view is not None:
+            self._view.close()
+            self._view = None
+        self._pack.close()
+        self._index.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+            self._lock_file.close()
+
+    def __enter__(self) -> PayloadStore:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
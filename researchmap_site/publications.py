@@ -0,0 +1,272 @@
+"""A publication index shared by every researcher of a batch.
+
+Co-authors list the same paper or talk in their own researchmap profiles.
+The index merges those copies into one ``Publication``: first by DOI, then by
+a hash of the normalized title and year, so merging costs one dictionary
+lookup per item instead of a comparison with every other item. It also keeps
+an author → publications inverted index.
+
+Updating a researcher only touches the publications they contribute to, and
+only the year buckets whose content changed are rendered again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .index import ResearcherIndex
+    from .render import ItemCache
+
+# Item kind → the section it is read from and the aggregate page it lands on.
+PUBLICATION_KINDS = {
+    "paper": ("published_papers", "papers.html"),
+    "presentation": ("presentations", "presentations.html"),
+}
+UNDATED = "Undated"
+NOT_ALPHANUMERIC = re.compile(r"[\W_]+")
+DOI_PREFIX = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class Publication:
+    """One paper or presentation, with every researcher who lists it."""
+
+    kind: str
+    record: Any
+    researchers: tuple[str, ...]
+
+
+def _doi_text(doi: str) -> str:
+    return DOI_PREFIX.sub("", doi.strip()).lower()
+
+
+def _doi(record: Any) -> str:
+    return _doi_text(getattr(record, "doi", ""))
+
+
+def _title_key(kind: str, record: Any) -> str:
+    title = NOT_ALPHANUMERIC.sub("", unicodedata.normalize("NFKC", record.title).casefold())
+    if not title:
+        return ""
+    source = f"{kind}\0{title}\0{record.year}".encode()
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _people(kind: str, record: Any) -> tuple[str, ...]:
+    return record.authors if kind == "paper" else record.presenters
+
+
+@lru_cache(maxsize=4096)
+def _author_key(name: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
+@dataclass(frozen=True, slots=True)
+class _Copy:
+    """One researcher's copy of a publication, with its index keys computed once."""
+
+    permalink: str
+    record: Any
+    doi: str
+    title_key: str
+    authors: tuple[str, ...]
+
+    @classmethod
+    def of(cls, kind: str, permalink: str, record: Any) -> _Copy:
+        authors = tuple(filter(None, map(_author_key, _people(kind, record))))
+        return cls(permalink, record, _doi(record), _title_key(kind, record), authors)
+
+    @property
+    def rank(self) -> tuple[bool, int, int, str]:
+        # The copy with a DOI and the most authors wins; the permalink breaks
+        # ties, so the choice does not depend on which researcher synced first.
+        return (bool(self.doi), len(self.authors), len(self.record.title), self.permalink)
+
+
+@dataclass(eq=False)
+class _Group:
+    """The copies of one publication and where the indexes point at it."""
+
+    kind: str
+    copies: list[_Copy] = field(default_factory=list)
+    keys: set[tuple[str, str]] = field(default_factory=set)
+    authors: set[str] = field(default_factory=set)
+    record: Any = None
+    bucket: tuple[str, str] | None = None
+
+    def publication(self) -> Publication:
+        researchers = tuple(sorted({copy.permalink for copy in self.copies}))
+        return Publication(self.kind, self.record, researchers)
+
+
+class PublicationIndex:
+    """DOI, title-hash and author indexes over the publications of many researchers.
+
+    ``update`` replaces what one researcher contributes and is safe to call
+    from the threads of a batch; ``fragments`` renders the aggregate pages.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids = count()
+        self._groups: dict[int, _Group] = {}
+        self._keys: dict[tuple[str, str], int] = {}
+        self._by_author: dict[str, set[int]] = {}
+        self._contributions: dict[str, set[int]] = {}
+        self._buckets: dict[tuple[str, str], set[int]] = {}
+        self._rendered: dict[tuple[str, str], str] = {}
+        self._dirty: set[tuple[str, str]] = set()
+
+    @property
+    def researchers(self) -> tuple[str, ...]:
+        with self._lock:
+            return tuple(sorted(self._contributions))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._groups)
+
+    def update(self, permalink: str, index: ResearcherIndex) -> None:
+        """Replace the papers and presentations contributed by ``permalink``."""
+
+        with self._lock:
+            touched = self._withdraw(permalink)
+            contributed: set[int] = set()
+            for kind, (section_type, _) in PUBLICATION_KINDS.items():
+                for record in index.section(section_type):
+                    copy = _Copy.of(kind, permalink, record)
+                    group_id = self._find(copy)
+                    if group_id is None:
+                        group_id = next(self._ids)
+                        self._groups[group_id] = _Group(kind)
+                    self._groups[group_id].copies.append(copy)
+                    self._register(group_id, copy)
+                    contributed.add(group_id)
+            self._contributions[permalink] = contributed
+            for group_id in touched | contributed:
+                self._refresh(group_id, withdrawn=group_id in touched)
+
+    def remove(self, permalink: str) -> None:
+        with self._lock:
+            for group_id in self._withdraw(permalink):
+                self._refresh(group_id, withdrawn=True)
+
+    def by_doi(self, doi: str) -> Publication | None:
+        with self._lock:
+            group_id = self._keys.get(("doi", _doi_text(doi)))
+            return self._groups[group_id].publication() if group_id is not None else None
+
+    def by_author(self, name: str) -> tuple[Publication, ...]:
+        """Return the publications listing ``name`` among their authors or presenters."""
+
+        with self._lock:
+            group_ids = sorted(self._by_author.get(_author_key(name), ()))
+            return tuple(self._groups[group_id].publication() for group_id in group_ids)
+
+    def _withdraw(self, permalink: str) -> set[int]:
+        touched = self._contributions.pop(permalink, set())
+        for group_id in touched:
+            group = self._groups[group_id]
+            group.copies = [copy for copy in group.copies if copy.permalink != permalink]
+        return touched
+
+    def _find(self, copy: _Copy) -> int | None:
+        if copy.doi and ("doi", copy.doi) in self._keys:
+            return self._keys["doi", copy.doi]
+        group_id = self._keys.get(("title", copy.title_key)) if copy.title_key else None
+        if group_id is None:
+            return None
+        # The same title under two different DOIs is two publications.
+        if copy.doi and any(
+            other.doi not in ("", copy.doi) for other in self._groups[group_id].copies
+        ):
+            return None
+        return group_id
+
+    def _register(self, group_id: int, copy: _Copy) -> None:
+        group = self._groups[group_id]
+        for key in (("doi", copy.doi), ("title", copy.title_key)):
+            if key[1] and self._keys.setdefault(key, group_id) == group_id:
+                group.keys.add(key)
+        for author in copy.authors:
+            self._by_author.setdefault(author, set()).add(group_id)
+        group.authors.update(copy.authors)
+
+    def _refresh(self, group_id: int, *, withdrawn: bool) -> None:
+        """Re-derive the representative and bucket of a touched group.
+
+        A group that lost copies also drops the keys and authors only they had.
+        """
+
+        group = self._groups[group_id]
+        if withdrawn:
+            for key in group.keys:
+                if self._keys.get(key) == group_id:
+                    del self._keys[key]
+            for author in group.authors:
+                self._by_author[author].discard(group_id)
+                if not self._by_author[author]:
+                    del self._by_author[author]
+            group.keys, group.authors = set(), set()
+
+        best = max(group.copies, key=attrgetter("rank"), default=None)
+        record = best.record if best is not None else None
+        bucket = (group.kind, record.year or UNDATED) if record is not None else None
+        if record != group.record or bucket != group.bucket:
+            if group.bucket is not None:
+                self._buckets[group.bucket].discard(group_id)
+                self._dirty.add(group.bucket)
+            if bucket is not None:
+                self._buckets.setdefault(bucket, set()).add(group_id)
+                self._dirty.add(bucket)
+        group.record, group.bucket = record, bucket
+        if record is None:
+            del self._groups[group_id]
+        elif withdrawn:
+            for copy in group.copies:
+                self._register(group_id, copy)
+
+    def fragments(self, *, cache: ItemCache | None = None) -> dict[str, str]:
+        """Render one page per kind, newest year first, omitting kinds without items.
+
+        Only year buckets changed since the previous call are rendered again.
+        """
+
+        from .render_html import _html, _section
+
+        with self._lock:
+            for bucket in self._dirty:
+                records = sorted(
+                    (self._groups[group_id].record for group_id in self._buckets[bucket]),
+                    key=lambda record: (record.sort_key, record.title, repr(record)),
+                    reverse=True,
+                )
+                if records:
+                    heading = f"<h3>{_html(bucket[1])}</h3>"
+                    self._rendered[bucket] = f"{heading}\n{_section(cache, bucket[0], records)}"
+                else:
+                    self._rendered.pop(bucket, None)
+                    del self._buckets[bucket]
+            self._dirty.clear()
+            rendered = dict(self._rendered)
+
+        pages: dict[str, str] = {}
+        for kind, (_, filename) in PUBLICATION_KINDS.items():
+            years = sorted(
+                (year for bucket_kind, year in rendered if bucket_kind == kind),
+                # Years sort newest first; undated publications come last.
+                key=lambda year: (year != UNDATED, year),
+                reverse=True,
+            )
+            if years:
+                pages[filename] = "\n".join(rendered[kind, year] for year in years) + "\n"
+        return pages
@@ -0,0 +1,140 @@
+"""Process-wide adaptive rate limiting for researchmap requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_MIN_RATE = 0.5
+# Additive increase probes from DEFAULT_RATE up to this ceiling.
+DEFAULT_MAX_RATE = 30.0
+# Responses that mean the API wants us to slow down.
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    rate: float
+    max_rate: float
+    requests: int
+    throttled: int
+    waited_seconds: float
+
+
+class AdaptiveRateLimiter:
+    """A token bucket whose refill rate adapts AIMD-style to throttling.
+
+    Every request takes one token; tokens refill at ``rate`` per second up to
+    ``burst``. A throttled response halves the rate (at most once per second,
+    so a burst of 429s from one overload counts once) and a ``Retry-After``
+    pauses every caller until it expires. Each successful response adds
+    ``increase / rate``, so the rate climbs by about ``increase`` requests per
+    second every second until it reaches ``max_rate``. That ceiling defaults to
+    ``DEFAULT_MAX_RATE``, above the starting ``rate``, so an unthrottled
+    process speeds up instead of staying at the rate it started with.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        *,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float | None = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or min_rate <= 0 or burst < 1:
+            raise ValueError("rate, min_rate and burst must be positive")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        self.max_rate = max_rate if max_rate is not None else max(rate, DEFAULT_MAX_RATE)
+        self.min_rate = min(min_rate, self.max_rate)
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = min(rate, self.max_rate)
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._requests = 0
+        self._throttled = 0
+        self._waited = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before sending."""
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, -self._tokens / self._rate, self._paused_until - now)
+            self._requests += 1
+            self._waited += wait
+            return wait
+
+    def acquire(self) -> None:
+        """Block until the caller may send one request."""
+
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self._rate = min(self.max_rate, self._rate + self.increase / self._rate)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._throttled += 1
+            if now - self._last_decrease >= 1.0:
+                self._rate = max(self.min_rate, self._rate * self.decrease)
+                self._last_decrease = now
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(
+                rate=self._rate,
+                max_rate=self.max_rate,
+                requests=self._requests,
+                throttled=self._throttled,
+                waited_seconds=self._waited,
+            )
+
+
+_shared_limiter: AdaptiveRateLimiter | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_limiter() -> AdaptiveRateLimiter:
+    """Return the limiter every client in this process uses by default."""
+
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter()
+        return _shared_limiter
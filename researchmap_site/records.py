@@ -0,0 +1,285 @@
+"""Compact typed records converted once from researchmap section items.
+
+Each record keeps only the resolved fields the site renders, so the raw JSON
+of a researcher can be released once it is indexed. Strings that repeat
+across items and researchers, such as names, venues and years, are interned.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+LANGUAGES = ("en", "ja")
+
+
+def _text(value: Any, languages: Sequence[str] = LANGUAGES) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if not isinstance(value, Mapping):
+        return ""
+    for language in languages:
+        candidate = value.get(language)
+        if isinstance(candidate, str) and candidate.strip():
+            return candidate.strip()
+    for candidate in value.values():
+        if isinstance(candidate, str) and candidate.strip():
+            return candidate.strip()
+    return ""
+
+
+def _people(value: Any) -> list[str]:
+    people: Iterable[Any]
+    if isinstance(value, Mapping):
+        selected: list[Any] = []
+        for language in LANGUAGES:
+            candidate = value.get(language)
+            if isinstance(candidate, list) and candidate:
+                selected = candidate
+                break
+        if not selected:
+            selected = next(
+                (candidate for candidate in value.values() if isinstance(candidate, list)),
+                [],
+            )
+        people = selected
+    elif isinstance(value, list):
+        people = value
+    else:
+        return []
+
+    names: list[str] = []
+    for person in people:
+        if isinstance(person, str):
+            name = person.strip()
+        elif isinstance(person, Mapping):
+            name = _text(person.get("name"))
+        else:
+            name = ""
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def _shared(text: str) -> str:
+    return sys.intern(text) if text else text
+
+
+def _first_text(item: Mapping[str, Any], *keys: str) -> str:
+    for key in keys:
+        value = _text(item.get(key))
+        if value:
+            return value
+    return ""
+
+
+def _names(value: Any) -> tuple[str, ...]:
+    return tuple(_shared(name) for name in _people(value))
+
+
+def _period(item: Mapping[str, Any]) -> str:
+    start = str(item.get("from_date") or "").strip()
+    end = str(item.get("to_date") or "").strip()
+    if end == "9999":
+        end = "Present"
+    if start and end:
+        return _shared(f"{start} – {end}")
+    return _shared(start or end)
+
+
+def _year(value: Any) -> str:
+    text = str(value or "").strip()
+    return _shared(text.split("-", 1)[0])
+
+
+def _first_value(item: Mapping[str, Any], *keys: str) -> Any:
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
+def _sort_key(item: Mapping[str, Any], *keys: str) -> str:
+    value = _first_value(item, *keys)
+    return _shared(str(value)) if value else ""
+
+
+def _identifier(item: Mapping[str, Any], name: str) -> str:
+    identifiers = item.get("identifiers")
+    if isinstance(identifiers, Mapping):
+        values = identifiers.get(name)
+        if isinstance(values, list) and values:
+            return str(values[0]).strip()
+        if isinstance(values, str):
+            return values.strip()
+    value = item.get(name)
+    return str(value).strip() if value else ""
+
+
+@dataclass(frozen=True, slots=True)
+class CareerEntry:
+    affiliation: str
+    role: str
+    period: str
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> CareerEntry:
+        role = ", ".join(
+            part for part in (_first_text(item, "section"), _first_text(item, "job")) if part
+        )
+        return cls(
+            affiliation=_shared(_first_text(item, "affiliation")),
+            role=_shared(role),
+            period=_period(item),
+            sort_key=_sort_key(item, "from_date", "to_date"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EducationEntry:
+    school: str
+    details: str
+    period: str
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> EducationEntry:
+        department = _first_text(item, "department")
+        course = _first_text(item, "course")
+        details = ", ".join(dict.fromkeys(value for value in (department, course) if value))
+        return cls(
+            school=_shared(_first_text(item, "affiliation")),
+            details=_shared(details),
+            period=_period(item),
+            sort_key=_sort_key(item, "from_date"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Paper:
+    title: str
+    authors: tuple[str, ...]
+    journal: str
+    year: str
+    doi: str
+    referee: bool
+    doctoral_thesis: bool
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Paper:
+        return cls(
+            title=_first_text(item, "paper_title", "title"),
+            authors=_names(item.get("authors")),
+            journal=_shared(_first_text(item, "publication_name", "publication")),
+            year=_year(item.get("publication_date")),
+            doi=_identifier(item, "doi"),
+            referee=item.get("referee") is True,
+            doctoral_thesis=item.get("published_paper_type") == "doctoral_thesis",
+            sort_key=_sort_key(item, "publication_date"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Book:
+    title: str
+    authors: tuple[str, ...]
+    publisher: str
+    year: str
+    isbn: str
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Book:
+        identifiers = item.get("identifiers")
+        isbn = ""
+        if isinstance(identifiers, Mapping):
+            values = identifiers.get("isbn")
+            if isinstance(values, list) and values:
+                isbn = str(values[0]).strip()
+        if not isbn and item.get("isbn"):
+            isbn = str(item.get("isbn")).strip()
+        return cls(
+            title=_first_text(item, "book_title", "title"),
+            authors=_names(item.get("authors")),
+            publisher=_shared(_first_text(item, "publisher")),
+            year=_year(item.get("publication_date")),
+            isbn=isbn,
+            sort_key=_sort_key(item, "publication_date"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Presentation:
+    title: str
+    presenters: tuple[str, ...]
+    event: str
+    year: str
+    referee: bool
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Presentation:
+        return cls(
+            title=_first_text(item, "presentation_title", "title"),
+            presenters=_names(item.get("presenters") or item.get("authors")),
+            event=_shared(_first_text(item, "conference_name", "conference", "meeting", "event")),
+            year=_year(_first_value(item, "presentation_date", "year")),
+            referee=item.get("referee") is True,
+            sort_key=_sort_key(item, "presentation_date", "year"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    title: str
+    funding_system: str
+    period: str
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Project:
+        return cls(
+            title=_first_text(item, "research_project_title", "title"),
+            funding_system=_shared(_first_text(item, "funding_system")),
+            period=_period(item),
+            sort_key=_sort_key(item, "from_date", "to_date"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Award:
+    name: str
+    organization: str
+    awarded_work: str
+    year: str
+    sort_key: str
+
+    @classmethod
+    def from_item(cls, item: Mapping[str, Any]) -> Award:
+        return cls(
+            name=_first_text(item, "award_name", "name"),
+            organization=_shared(
+                _first_text(item, "association", "award_organization", "organization")
+            ),
+            awarded_work=_first_text(item, "award_title"),
+            year=_year(_first_value(item, "award_date", "date")),
+            sort_key=_sort_key(item, "award_date", "date"),
+        )
+
+
+# Section types whose items the site renders, and the record each becomes.
+RECORD_TYPES: dict[str, type[Any]] = {
+    "awards": Award,
+    "books": Book,
+    "books_etc": Book,
+    "competitive_fundings": Project,
+    "education": EducationEntry,
+    "presentations": Presentation,
+    "published_papers": Paper,
+    "research_experience": CareerEntry,
+}
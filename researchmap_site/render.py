@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
 from html import escape as html_escape
-from typing import Any
+from operator import attrgetter
+from typing import Any, Protocol, TypeVar
 from urllib.parse import quote
 
+from . import metrics
 from .config import ProfileConfig
-
-LANGUAGES = ("en", "ja")
+from .index import ResearcherIndex
+from .records import (
+    Award,
+    Book,
+    CareerEntry,
+    EducationEntry,
+    Paper,
+    Presentation,
+    Project,
+    _text,
+)
+
+# Bump whenever the same researchmap payload would render differently, so cached
+# and already-published output is regenerated.
+RENDER_VERSION = 3
 DEGREE_ALIASES = {
     "Doctor of Science": "Ph.D. in Science",
     "博士(理学)": "Ph.D. in Science",
@@ -29,22 +47,24 @@ AFFILIATION_ALIASES = {
     "株式会社メルカリ": "Mercari Inc.",
     "大和証券株式会社": "Daiwa Securities Co., Ltd.",
 }
+# Editing an alias changes the output without changing any record, so the
+# tables join RENDER_VERSION in every cache key and the published fingerprint.
+RENDER_SIGNATURE = hashlib.sha256(
+    repr(
+        (RENDER_VERSION, sorted(DEGREE_ALIASES.items()), sorted(AFFILIATION_ALIASES.items()))
+    ).encode()
+).hexdigest()
 MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]<>#|])")
 
+R = TypeVar("R")
 
-def _text(value: Any, languages: Sequence[str] = LANGUAGES) -> str:
-    if isinstance(value, str):
-        return value.strip()
-    if not isinstance(value, Mapping):
-        return ""
-    for language in languages:
-        candidate = value.get(language)
-        if isinstance(candidate, str) and candidate.strip():
-            return candidate.strip()
-    for candidate in value.values():
-        if isinstance(candidate, str) and candidate.strip():
-            return candidate.strip()
-    return ""
+
+class ItemCache(Protocol):
+    """Storage for rendered per-item snippets, such as ``render_cache.RenderCache``."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def put(self, key: str, value: str) -> None: ...
 
 
 def _md(value: Any) -> str:
@@ -54,328 +74,378 @@ def _md(value: Any) -> str:
     return MARKDOWN_SPECIAL.sub(r"\\\1", escaped)
 
 
-def _section_items(payload: Mapping[str, Any], *section_types: str) -> list[dict[str, Any]]:
-    graph = payload.get("@graph", [])
-    if not isinstance(graph, list):
-        return []
-    for section in graph:
-        if not isinstance(section, dict) or section.get("@type") not in section_types:
-            continue
-        items = section.get("items", [])
-        return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
-    return []
-
-
-def _people(value: Any) -> list[str]:
-    people: Iterable[Any]
-    if isinstance(value, Mapping):
-        selected: list[Any] = []
-        for language in LANGUAGES:
-            candidate = value.get(language)
-            if isinstance(candidate, list) and candidate:
-                selected = candidate
-                break
-        if not selected:
-            selected = next(
-                (candidate for candidate in value.values() if isinstance(candidate, list)),
-                [],
-            )
-        people = selected
-    elif isinstance(value, list):
-        people = value
-    else:
-        return []
+def item_key(kind: str, record: object) -> str:
+    """Return a stable cache key for rendering ``record`` as ``kind``."""
+
+    # Records are frozen dataclasses of strings, tuples and booleans, so their
+    # repr is canonical.
+    digest = hashlib.sha256(f"{RENDER_SIGNATURE}:{kind}:{record!r}".encode()).hexdigest()
+    return f"item:{digest}"
+
+
+def _newest_first(records: Iterable[R]) -> list[R]:
+    return sorted(records, key=attrgetter("sort_key"), reverse=True)
+
+
+def _render_jobs(
+    jobs: Sequence[tuple[str, Sequence[Any]]],
+    render_items: Callable[[str, Sequence[Any]], list[str]],
+    *,
+    cache: ItemCache | None = None,
+    executor: Executor | None = None,
+) -> list[list[str]]:
+    """Render the records of each ``(kind, records)`` job, one string per record.
+
+    Cached items are reused and the rest of each job goes to ``render_items``,
+    in ``executor`` when one is given. A process pool therefore receives only
+    the kind and the uncached records, and every job runs in parallel.
+    """
+
+    results: list[list[Any]] = []
+    pending: list[tuple[list[Any], list[str], list[int], Future[list[str]] | list[str]]] = []
+    for kind, records in jobs:
+        keys: list[str] = []
+        rendered: list[str | None] = [None] * len(records)
+        if cache is not None:
+            keys = [item_key(kind, record) for record in records]
+            rendered = [cache.get(key) for key in keys]
+        missing = [position for position, value in enumerate(rendered) if value is None]
+        if missing:
+            misses = [records[position] for position in missing]
+            if executor is not None:
+                outcome: Future[list[str]] | list[str] = executor.submit(render_items, kind, misses)
+            else:
+                with metrics.stage(f"render.{kind}"):
+                    outcome = render_items(kind, misses)
+            pending.append((rendered, keys, missing, outcome))
+        results.append(rendered)
+
+    for rendered, keys, missing, outcome in pending:
+        values = outcome.result() if isinstance(outcome, Future) else outcome
+        for position, value in zip(missing, values, strict=True):
+            rendered[position] = value
+            if cache is not None:
+                cache.put(keys[position], value)
+    return results
+
+
+@dataclass(frozen=True)
+class Detail:
+    label: str
+    text: str
+    href: str = ""
+
+
+@dataclass(frozen=True)
+class Entry:
+    """One list item: a bold title, optional badges and annotations, and details."""
+
+    title: str
+    badges: tuple[str, ...] = ()
+    note: str = ""
+    period: str = ""
+    details: tuple[Detail, ...] = ()
+
+
+def _entry_markdown(entry: Entry) -> str:
+    line = f"- **{_md(entry.title)}**"
+    if entry.badges:
+        line += " " + " ".join(entry.badges)
+    if entry.note:
+        line += f" — {_md(entry.note)}"
+    if entry.period:
+        line += f" ({_md(entry.period)})"
+    # Python-Markdown requires four spaces for a nested list. Keeping details
+    # under their title also lets the shared CSS treat each record as one item.
+    lines = [line]
+    for detail in entry.details:
+        text = f"[{_md(detail.text)}]({detail.href})" if detail.href else _md(detail.text)
+        lines.append(f"    - **{detail.label}:** {text}")
+    return "\n".join(lines)
 
-    names: list[str] = []
-    for person in people:
-        if isinstance(person, str):
-            name = person.strip()
-        elif isinstance(person, Mapping):
-            name = _text(person.get("name"))
-        else:
-            name = ""
-        if name and name not in names:
-            names.append(name)
-    return names
-
-
-def _first_text(item: Mapping[str, Any], *keys: str) -> str:
-    for key in keys:
-        value = _text(item.get(key))
-        if value:
-            return value
-    return ""
 
+def _markdown(build: Callable[[R], Entry | None]) -> Callable[[R], str]:
+    def render(record: R) -> str:
+        entry = build(record)
+        return _entry_markdown(entry) if entry is not None else ""
 
-def _period(item: Mapping[str, Any]) -> str:
-    start = str(item.get("from_date") or "").strip()
-    end = str(item.get("to_date") or "").strip()
-    if end == "9999":
-        end = "Present"
-    if start and end:
-        return f"{start} – {end}"
-    return start or end
+    return render
 
 
-def _year(value: Any) -> str:
-    text = str(value or "").strip()
-    return text.split("-", 1)[0]
+def _detail_tuple(*details: tuple[str, str]) -> tuple[Detail, ...]:
+    return tuple(Detail(label, text) for label, text in details if text)
 
 
-def _sort_by_date(items: Iterable[dict[str, Any]], *keys: str) -> list[dict[str, Any]]:
-    def sort_key(item: Mapping[str, Any]) -> str:
-        for key in keys:
-            value = item.get(key)
-            if value:
-                return str(value)
+def _degree(index: ResearcherIndex) -> str:
+    degrees = index.fields.get("degrees")
+    if not isinstance(degrees, list):
         return ""
+    for degree_info in degrees:
+        if not isinstance(degree_info, Mapping):
+            continue
+        name = _text(degree_info.get("degree"))
+        name = DEGREE_ALIASES.get(name, name)
+        if name:
+            return name
+    return ""
+
 
-    return sorted(items, key=sort_key, reverse=True)
+def _social_links_html(config: ProfileConfig) -> list[str]:
+    if not config.social_links:
+        return []
+    lines = ['<div class="social-links" aria-label="Social links">']
+    for link in config.social_links:
+        url = html_escape(link.url, quote=True)
+        label = html_escape(link.label, quote=True)
+        mark = html_escape(link.mark)
+        lines.append(
+            f'  <a href="{url}" target="_blank" rel="noopener noreferrer" '
+            f'aria-label="{label}" title="{label}"><span aria-hidden="true">'
+            f"{mark}</span></a>"
+        )
+    lines.append("</div>")
+    return lines
 
 
-def _details(lines: list[str]) -> list[str]:
-    # Python-Markdown requires four spaces for a nested list. Keeping details
-    # under their title also lets the shared CSS treat each record as one item.
-    return [f"    - {line}" for line in lines if line]
+def _experience(index: ResearcherIndex) -> list[CareerEntry]:
+    return _newest_first(index.section("research_experience"))
+
 
+def _education(index: ResearcherIndex) -> list[EducationEntry]:
+    return _newest_first(index.section("education"))
 
-def render_profile(payload: Mapping[str, Any], config: ProfileConfig) -> str:
+
+def _profile_markdown(
+    index: ResearcherIndex, config: ProfileConfig, career: list[str], education: list[str]
+) -> str:
     lines: list[str] = []
-    degrees = payload.get("degrees")
-    if isinstance(degrees, list):
-        for degree_info in degrees:
-            if not isinstance(degree_info, Mapping):
-                continue
-            degree = _text(degree_info.get("degree"))
-            degree = DEGREE_ALIASES.get(degree, degree)
-            if degree:
-                lines.append(f"**Degree:** {_md(degree)}")
-                lines.append("")
-                break
+    degree_name = _degree(index)
+    if degree_name:
+        lines.extend((f"**Degree:** {_md(degree_name)}", ""))
 
     lines.extend((f"**Email:** {_md(config.email)}", ""))
-    if config.social_links:
-        lines.append('<div class="social-links" aria-label="Social links">')
-        for link in config.social_links:
-            url = html_escape(link.url, quote=True)
-            label = html_escape(link.label, quote=True)
-            mark = html_escape(link.mark)
-            lines.append(
-                f'  <a href="{url}" target="_blank" rel="noopener noreferrer" '
-                f'aria-label="{label}" title="{label}"><span aria-hidden="true">'
-                f"{mark}</span></a>"
-            )
-        lines.extend(("</div>", ""))
-
-    experience = _sort_by_date(
-        _section_items(payload, "research_experience"), "from_date", "to_date"
-    )
-    if experience:
-        lines.extend(("## Career", ""))
-        for item in experience:
-            affiliation = _first_text(item, "affiliation")
-            affiliation = AFFILIATION_ALIASES.get(affiliation, affiliation)
-            if not affiliation:
-                continue
-            role_parts = [
-                _first_text(item, "section"),
-                _first_text(item, "job"),
-            ]
-            role = ", ".join(part for part in role_parts if part)
-            entry = f"- **{_md(affiliation)}**"
-            if role:
-                entry += f" — {_md(role)}"
-            period = _period(item)
-            if period:
-                entry += f" ({_md(period)})"
-            lines.append(entry)
-        lines.append("")
+    links = _social_links_html(config)
+    if links:
+        lines.extend((*links, ""))
 
-    education = _sort_by_date(_section_items(payload, "education"), "from_date")
-    if education:
-        lines.extend(("## Education", ""))
-        for item in education:
-            school = _first_text(item, "affiliation")
-            if not school:
-                continue
-            department = _first_text(item, "department")
-            course = _first_text(item, "course")
-            details = ", ".join(dict.fromkeys(value for value in (department, course) if value))
-            entry = f"- **{_md(school)}**"
-            if details:
-                entry += f" — {_md(details)}"
-            period = _period(item)
-            if period:
-                entry += f" ({_md(period)})"
-            lines.append(entry)
+    for title, entries in (("Career", career), ("Education", education)):
+        if not entries:
+            continue
+        lines.extend((f"## {title}", ""))
+        lines.extend(entry for entry in entries if entry)
         lines.append("")
 
     return "\n".join(lines).strip() + "\n"
 
 
-def _doi(item: Mapping[str, Any]) -> str:
-    identifiers = item.get("identifiers")
-    if isinstance(identifiers, Mapping):
-        values = identifiers.get("doi")
-        if isinstance(values, list) and values:
-            return str(values[0]).strip()
-        if isinstance(values, str):
-            return values.strip()
-    value = item.get("doi")
-    return str(value).strip() if value else ""
+def render_profile(
+    payload: Mapping[str, Any] | ResearcherIndex,
+    config: ProfileConfig,
+    *,
+    cache: ItemCache | None = None,
+) -> str:
+    index = ResearcherIndex.of(payload)
+    career, education = _render_jobs(
+        [("career", _experience(index)), ("education", _education(index))],
+        _render_items,
+        cache=cache,
+    )
+    return _profile_markdown(index, config, career, education)
 
 
-def render_papers(payload: Mapping[str, Any]) -> str:
-    lines: list[str] = []
-    papers = _sort_by_date(_section_items(payload, "published_papers"), "publication_date")
-    for paper in papers:
-        title = _first_text(paper, "paper_title", "title") or "Unknown title"
-        badges: list[str] = []
-        if paper.get("referee") is True:
-            badges.append('<span class="badge">Peer reviewed</span>')
-        if paper.get("published_paper_type") == "doctoral_thesis":
-            badges.append('<span class="badge badge--thesis">Doctoral thesis</span>')
-        suffix = f" {' '.join(badges)}" if badges else ""
-        lines.append(f"- **{_md(title)}**{suffix}")
-
-        detail_lines: list[str] = []
-        authors = _people(paper.get("authors"))
-        if authors:
-            detail_lines.append(f"**Authors:** {_md(', '.join(authors))}")
-        journal = _first_text(paper, "publication_name", "publication")
-        if journal:
-            detail_lines.append(f"**Journal:** {_md(journal)}")
-        year = _year(paper.get("publication_date"))
-        if year:
-            detail_lines.append(f"**Year:** {_md(year)}")
-        doi = _doi(paper)
-        if doi:
-            doi_url = "https://doi.org/" + quote(doi, safe="/:._-")
-            detail_lines.append(f"**DOI:** [{_md(doi)}]({doi_url})")
-        lines.extend(_details(detail_lines))
-        lines.append("")
-    return "\n".join(lines).strip()
+def _career_entry(career: CareerEntry) -> Entry | None:
+    affiliation = AFFILIATION_ALIASES.get(career.affiliation, career.affiliation)
+    if not affiliation:
+        return None
+    return Entry(affiliation, note=career.role, period=career.period)
 
 
-def render_books(payload: Mapping[str, Any]) -> str:
-    lines: list[str] = []
-    books = _sort_by_date(_section_items(payload, "books", "books_etc"), "publication_date")
-    for book in books:
-        title = _first_text(book, "book_title", "title") or "Unknown title"
-        lines.append(f"- **{_md(title)}**")
-        detail_lines: list[str] = []
-        authors = _people(book.get("authors"))
-        if authors:
-            detail_lines.append(f"**Authors:** {_md(', '.join(authors))}")
-        publisher = _first_text(book, "publisher")
-        if publisher:
-            detail_lines.append(f"**Publisher:** {_md(publisher)}")
-        year = _year(book.get("publication_date"))
-        if year:
-            detail_lines.append(f"**Year:** {_md(year)}")
-        identifiers = book.get("identifiers")
-        isbn = ""
-        if isinstance(identifiers, Mapping):
-            values = identifiers.get("isbn")
-            if isinstance(values, list) and values:
-                isbn = str(values[0])
-        if not isbn and book.get("isbn"):
-            isbn = str(book["isbn"])
-        if isbn:
-            detail_lines.append(f"**ISBN:** {_md(isbn)}")
-        lines.extend(_details(detail_lines))
-        lines.append("")
-    return "\n".join(lines).strip()
+def _education_entry(education: EducationEntry) -> Entry | None:
+    if not education.school:
+        return None
+    return Entry(education.school, note=education.details, period=education.period)
 
 
-def render_presentations(payload: Mapping[str, Any]) -> str:
-    lines: list[str] = []
-    presentations = _sort_by_date(
-        _section_items(payload, "presentations"), "presentation_date", "year"
+def _paper_entry(paper: Paper) -> Entry:
+    badges: list[str] = []
+    if paper.referee:
+        badges.append('<span class="badge">Peer reviewed</span>')
+    if paper.doctoral_thesis:
+        badges.append('<span class="badge badge--thesis">Doctoral thesis</span>')
+
+    details = _detail_tuple(
+        ("Authors", ", ".join(paper.authors)),
+        ("Journal", paper.journal),
+        ("Year", paper.year),
     )
-    for presentation in presentations:
-        title = _first_text(presentation, "presentation_title", "title")
-        if not title:
-            title = "Unknown title"
-        badge = (
-            ' <span class="badge">Peer reviewed</span>'
-            if presentation.get("referee") is True
-            else ""
-        )
-        lines.append(f"- **{_md(title)}**{badge}")
-        detail_lines: list[str] = []
-        presenters = _people(presentation.get("presenters") or presentation.get("authors"))
-        if presenters:
-            detail_lines.append(f"**Presenters:** {_md(', '.join(presenters))}")
-        event = _first_text(
-            presentation,
-            "conference_name",
-            "conference",
-            "meeting",
-            "event",
-        )
-        if event:
-            detail_lines.append(f"**Event:** {_md(event)}")
-        year = _year(presentation.get("presentation_date") or presentation.get("year"))
-        if year:
-            detail_lines.append(f"**Year:** {_md(year)}")
-        lines.extend(_details(detail_lines))
-        lines.append("")
-    return "\n".join(lines).strip()
+    if paper.doi:
+        doi_url = "https://doi.org/" + quote(paper.doi, safe="/:._-")
+        details += (Detail("DOI", paper.doi, doi_url),)
+    return Entry(paper.title or "Unknown title", badges=tuple(badges), details=details)
 
 
-def render_projects(payload: Mapping[str, Any]) -> str:
-    lines: list[str] = []
-    projects = _sort_by_date(
-        _section_items(payload, "competitive_fundings"), "from_date", "to_date"
+def _papers(index: ResearcherIndex) -> list[Paper]:
+    return _newest_first(index.section("published_papers"))
+
+
+def render_papers(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "paper", _papers(ResearcherIndex.of(payload)))
+
+
+def _book_entry(book: Book) -> Entry:
+    return Entry(
+        book.title or "Unknown title",
+        details=_detail_tuple(
+            ("Authors", ", ".join(book.authors)),
+            ("Publisher", book.publisher),
+            ("Year", book.year),
+            ("ISBN", book.isbn),
+        ),
     )
-    for project in projects:
-        title = _first_text(project, "research_project_title", "title")
-        if not title:
-            title = "Unknown title"
-        lines.append(f"- **{_md(title)}**")
-        detail_lines: list[str] = []
-        funding = _first_text(project, "funding_system")
-        if funding:
-            detail_lines.append(f"**Funding system:** {_md(funding)}")
-        period = _period(project)
-        if period:
-            detail_lines.append(f"**Period:** {_md(period)}")
-        lines.extend(_details(detail_lines))
-        lines.append("")
-    return "\n".join(lines).strip()
 
 
-def render_awards(payload: Mapping[str, Any]) -> str:
-    lines: list[str] = []
-    awards = _sort_by_date(_section_items(payload, "awards"), "award_date", "date")
-    for award in awards:
-        name = _first_text(award, "award_name", "name") or "Unknown award"
-        lines.append(f"- **{_md(name)}**")
-        detail_lines: list[str] = []
-        organization = _first_text(award, "association", "award_organization", "organization")
-        if organization:
-            detail_lines.append(f"**Organization:** {_md(organization)}")
-        title = _first_text(award, "award_title")
-        if title:
-            detail_lines.append(f"**Awarded work:** {_md(title)}")
-        year = _year(award.get("award_date") or award.get("date"))
-        if year:
-            detail_lines.append(f"**Year:** {_md(year)}")
-        lines.extend(_details(detail_lines))
-        lines.append("")
-    return "\n".join(lines).strip()
+def _books(index: ResearcherIndex) -> list[Book]:
+    return _newest_first(index.section("books", "books_etc"))
+
+
+def render_books(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "book", _books(ResearcherIndex.of(payload)))
+
+
+def _presentation_entry(presentation: Presentation) -> Entry:
+    badges = ('<span class="badge">Peer reviewed</span>',) if presentation.referee else ()
+    return Entry(
+        presentation.title or "Unknown title",
+        badges=badges,
+        details=_detail_tuple(
+            ("Presenters", ", ".join(presentation.presenters)),
+            ("Event", presentation.event),
+            ("Year", presentation.year),
+        ),
+    )
+
+
+def _presentations(index: ResearcherIndex) -> list[Presentation]:
+    return _newest_first(index.section("presentations"))
+
 
+def render_presentations(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "presentation", _presentations(ResearcherIndex.of(payload)))
+
+
+def _project_entry(project: Project) -> Entry:
+    return Entry(
+        project.title or "Unknown title",
+        details=_detail_tuple(
+            ("Funding system", project.funding_system),
+            ("Period", project.period),
+        ),
+    )
+
+
+def _projects(index: ResearcherIndex) -> list[Project]:
+    return _newest_first(index.section("competitive_fundings"))
+
+
+def render_projects(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "project", _projects(ResearcherIndex.of(payload)))
+
+
+def _award_entry(award: Award) -> Entry:
+    return Entry(
+        award.name or "Unknown award",
+        details=_detail_tuple(
+            ("Organization", award.organization),
+            ("Awarded work", award.awarded_work),
+            ("Year", award.year),
+        ),
+    )
 
-def render_all(payload: Mapping[str, Any], profile_config: ProfileConfig) -> dict[str, str]:
-    """Render every supported section, omitting empty optional sections."""
 
+def _awards(index: ResearcherIndex) -> list[Award]:
+    return _newest_first(index.section("awards"))
+
+
+def render_awards(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "award", _awards(ResearcherIndex.of(payload)))
+
+
+_MARKDOWN_ITEMS: dict[str, Callable[[Any], str]] = {
+    "career": _markdown(_career_entry),
+    "education": _markdown(_education_entry),
+    "paper": _markdown(_paper_entry),
+    "book": _markdown(_book_entry),
+    "presentation": _markdown(_presentation_entry),
+    "project": _markdown(_project_entry),
+    "award": _markdown(_award_entry),
+}
+
+
+def _render_items(kind: str, records: Sequence[Any]) -> list[str]:
+    render = _MARKDOWN_ITEMS[kind]
+    return [render(record) for record in records]
+
+
+def _list_markdown(items: list[str]) -> str:
+    return "\n\n".join(items).strip()
+
+
+def _section(cache: ItemCache | None, kind: str, records: Sequence[Any]) -> str:
+    (items,) = _render_jobs([(kind, records)], _render_items, cache=cache)
+    return _list_markdown(items)
+
+
+def section_jobs(index: ResearcherIndex) -> dict[str, list[Any]]:
+    """Return the sorted records of every rendered section, keyed by item kind."""
+
+    return {
+        "career": _experience(index),
+        "education": _education(index),
+        "paper": _papers(index),
+        "book": _books(index),
+        "presentation": _presentations(index),
+        "project": _projects(index),
+        "award": _awards(index),
+    }
+
+
+def render_all(
+    payload: Mapping[str, Any] | ResearcherIndex,
+    profile_config: ProfileConfig,
+    *,
+    cache: ItemCache | None = None,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """Render every supported section, omitting empty optional sections.
+
+    With an ``executor``, the items of all sections are rendered in parallel.
+    """
+
+    index = ResearcherIndex.of(payload)
+    jobs = section_jobs(index)
+    items = dict(
+        zip(
+            jobs,
+            _render_jobs(list(jobs.items()), _render_items, cache=cache, executor=executor),
+            strict=True,
+        )
+    )
     candidates = {
-        "profile.md": render_profile(payload, profile_config),
-        "papers.md": render_papers(payload),
-        "books.md": render_books(payload),
-        "presentations.md": render_presentations(payload),
-        "projects.md": render_projects(payload),
-        "awards.md": render_awards(payload),
+        "profile.md": _profile_markdown(index, profile_config, items["career"], items["education"]),
+        "papers.md": _list_markdown(items["paper"]),
+        "books.md": _list_markdown(items["book"]),
+        "presentations.md": _list_markdown(items["presentation"]),
+        "projects.md": _list_markdown(items["project"]),
+        "awards.md": _list_markdown(items["award"]),
     }
     return {name: content.strip() + "\n" for name, content in candidates.items() if content.strip()}
@@ -0,0 +1,103 @@
+"""Persistent, size-bounded cache of rendered snippets."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_MAX_ENTRIES = 200_000
+# Buffered writes are flushed automatically beyond this many pending entries.
+FLUSH_THRESHOLD = 10_000
+
+
+class RenderCache:
+    """An SQLite-backed least-recently-used map from content hashes to snippets.
+
+    Keys already encode the renderer version and the full input (see
+    ``render.item_key``), so entries never need invalidation, only eviction.
+    New entries and recency updates are buffered in memory and written in one
+    transaction by ``flush``, which also evicts the least recently used
+    entries beyond ``max_entries``. A cache may be shared by the threads of
+    one process.
+    """
+
+    def __init__(self, path: str | Path, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._touched: dict[str, int] = {}
+        self._pending: dict[str, str] = {}
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS snippets ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS snippets_used ON snippets (used)")
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key in self._pending:
+                self.hits += 1
+                return self._pending[key]
+            row = self._connection.execute(
+                "SELECT value FROM snippets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time_ns()
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._pending[key] = value
+            self._touched[key] = time.time_ns()
+            if len(self._pending) >= FLUSH_THRESHOLD:
+                self._flush()
+
+    def flush(self) -> None:
+        """Persist buffered writes and recency updates, then evict beyond the bound."""
+
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO snippets (key, value, used) VALUES (?, ?, ?)",
+                [(key, value, self._touched[key]) for key, value in self._pending.items()],
+            )
+            self._connection.executemany(
+                "UPDATE snippets SET used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items() if key not in self._pending],
+            )
+            self._pending.clear()
+            self._touched.clear()
+            (count,) = self._connection.execute("SELECT COUNT(*) FROM snippets").fetchone()
+            if count > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM snippets WHERE key IN "
+                    "(SELECT key FROM snippets ORDER BY used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> RenderCache:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
@@ -0,0 +1,270 @@
+"""Render the site's HTML fragments directly, without a Markdown round trip.
+
+The output matches what Python-Markdown produces from ``render.render_all``
+(including its loose lists and the extra heading level), so either backend
+can publish a section.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from html import escape as html_escape
+from typing import Any
+
+from .config import ProfileConfig
+from .index import ResearcherIndex
+from .render import (
+    Entry,
+    ItemCache,
+    _award_entry,
+    _awards,
+    _book_entry,
+    _books,
+    _career_entry,
+    _degree,
+    _education,
+    _education_entry,
+    _experience,
+    _md,
+    _paper_entry,
+    _papers,
+    _presentation_entry,
+    _presentations,
+    _project_entry,
+    _projects,
+    _render_jobs,
+    _social_links_html,
+    section_jobs,
+)
+
+# Python-Markdown's default tab_length.
+TAB_LENGTH = 4
+MARKDOWN_ESCAPED = re.compile(r"\\([\\`*_{}\[\]<>#|])")
+
+
+def _html(value: Any, column: int = 0) -> str:
+    """Escape API text as Python-Markdown renders it from ``render._md``.
+
+    Python-Markdown expands tabs to stops of its source lines and turns a
+    line ending in two spaces into a hard break. ``column`` is where the
+    text starts in its Markdown line, since that decides the tab stops.
+    """
+
+    text = html_escape(str(value).strip(), quote=False)
+    if "\t" in text:
+        # Markdown escapes widen the text, so the stops are found in the escaped form.
+        expanded = (" " * column + _md(value)).expandtabs(TAB_LENGTH)[column:]
+        text = MARKDOWN_ESCAPED.sub(r"\1", expanded)
+    if "  \n" in text:
+        text = text.replace("  \n", "<br />\n")
+    return text
+
+
+def _column(markdown: str) -> int:
+    """Return the column following ``markdown`` once its tabs are expanded."""
+
+    return len(markdown.expandtabs(TAB_LENGTH).rsplit("\n", 1)[-1])
+
+
+def _head_columns(entry: Entry) -> tuple[int, int, int]:
+    """Return where the title, note and period start in render._entry_markdown's line."""
+
+    markdown = f"- **{_md(entry.title)}**"
+    if entry.badges:
+        markdown += " " + " ".join(entry.badges)
+    note = _column(markdown + " — ")
+    if entry.note:
+        markdown += f" — {_md(entry.note)}"
+    return len("- **"), note, _column(markdown + " (")
+
+
+def _head(entry: Entry) -> str:
+    # Only tabs depend on the column, so most entries skip measuring it.
+    tabbed = "\t" in entry.title or "\t" in entry.note or "\t" in entry.period
+    title, note, period = _head_columns(entry) if tabbed else (0, 0, 0)
+    head = f"<strong>{_html(entry.title, title)}</strong>"
+    if entry.badges:
+        head += " " + " ".join(entry.badges)
+    if entry.note:
+        head += f" — {_html(entry.note, note)}"
+    if entry.period:
+        head += f" ({_html(entry.period, period)})"
+    return head
+
+
+def _details(entry: Entry) -> str:
+    lines = ["<ul>"]
+    for detail in entry.details:
+        column = len(f"    - **{detail.label}:** {'[' if detail.href else ''}")
+        text = _html(detail.text, column)
+        if detail.href:
+            text = f'<a href="{html_escape(detail.href, quote=True)}">{text}</a>'
+        lines.append(f"<li><strong>{detail.label}:</strong> {text}</li>")
+    lines.append("</ul>")
+    return "\n".join(lines)
+
+
+def _tight_item(entry: Entry) -> str:
+    if not entry.details:
+        return f"<li>{_head(entry)}</li>"
+    return f"<li>{_head(entry)}{_details(entry)}\n</li>"
+
+
+def _loose_item(entry: Entry) -> str:
+    if not entry.details:
+        return f"<li>\n<p>{_head(entry)}</p>\n</li>"
+    return f"<li>\n<p>{_head(entry)}</p>\n{_details(entry)}\n</li>"
+
+
+def _item(
+    format_item: Callable[[Entry], str], build: Callable[[Any], Entry | None]
+) -> Callable[[Any], str]:
+    def render(record: Any) -> str:
+        entry = build(record)
+        return format_item(entry) if entry is not None else ""
+
+    return render
+
+
+# Career and education are tight lists; other sections separate records with
+# blank lines in Markdown, which makes a list loose once it has a second item.
+_HTML_ITEMS: dict[str, Callable[[Any], str]] = {
+    "html-career": _item(_tight_item, _career_entry),
+    "html-education": _item(_tight_item, _education_entry),
+}
+for _kind, _build in (
+    ("paper", _paper_entry),
+    ("book", _book_entry),
+    ("presentation", _presentation_entry),
+    ("project", _project_entry),
+    ("award", _award_entry),
+):
+    _HTML_ITEMS[f"html-{_kind}"] = _item(_loose_item, _build)
+    _HTML_ITEMS[f"html-{_kind}-tight"] = _item(_tight_item, _build)
+
+
+def _render_items(kind: str, records: Sequence[Any]) -> list[str]:
+    render = _HTML_ITEMS[kind]
+    return [render(record) for record in records]
+
+
+def _job(kind: str, records: Sequence[Any]) -> tuple[str, Sequence[Any]]:
+    if kind in ("career", "education"):
+        return f"html-{kind}", records
+    return (f"html-{kind}-tight" if len(records) == 1 else f"html-{kind}"), records
+
+
+def _list_html(items: list[str]) -> str:
+    return "\n".join(("<ul>", *items, "</ul>")) if items else ""
+
+
+def _profile_html(
+    index: ResearcherIndex, config: ProfileConfig, career: list[str], education: list[str]
+) -> str:
+    parts: list[str] = []
+    degree = _degree(index)
+    if degree:
+        parts.append(f"<p><strong>Degree:</strong> {_html(degree, len('**Degree:** '))}</p>")
+    parts.append(f"<p><strong>Email:</strong> {_html(config.email, len('**Email:** '))}</p>")
+    links = _social_links_html(config)
+    if links:
+        parts.extend((*links, ""))
+
+    for title, entries in (("Career", career), ("Education", education)):
+        if not entries:
+            continue
+        parts.append(f"<h3>{title}</h3>")
+        listed = _list_html([entry for entry in entries if entry])
+        if listed:
+            parts.append(listed)
+
+    return "\n".join(parts).strip() + "\n"
+
+
+def render_profile(
+    payload: Mapping[str, Any] | ResearcherIndex,
+    config: ProfileConfig,
+    *,
+    cache: ItemCache | None = None,
+) -> str:
+    index = ResearcherIndex.of(payload)
+    career, education = _render_jobs(
+        [_job("career", _experience(index)), _job("education", _education(index))],
+        _render_items,
+        cache=cache,
+    )
+    return _profile_html(index, config, career, education)
+
+
+def _section(cache: ItemCache | None, kind: str, records: Sequence[Any]) -> str:
+    (items,) = _render_jobs([_job(kind, records)], _render_items, cache=cache)
+    return _list_html(items)
+
+
+def render_papers(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "paper", _papers(ResearcherIndex.of(payload)))
+
+
+def render_books(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "book", _books(ResearcherIndex.of(payload)))
+
+
+def render_presentations(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "presentation", _presentations(ResearcherIndex.of(payload)))
+
+
+def render_projects(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "project", _projects(ResearcherIndex.of(payload)))
+
+
+def render_awards(
+    payload: Mapping[str, Any] | ResearcherIndex, *, cache: ItemCache | None = None
+) -> str:
+    return _section(cache, "award", _awards(ResearcherIndex.of(payload)))
+
+
+def render_all(
+    payload: Mapping[str, Any] | ResearcherIndex,
+    profile_config: ProfileConfig,
+    *,
+    cache: ItemCache | None = None,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """Render every supported section to HTML, omitting empty optional sections.
+
+    With an ``executor``, the items of all sections are rendered in parallel.
+    """
+
+    index = ResearcherIndex.of(payload)
+    jobs = section_jobs(index)
+    items = dict(
+        zip(
+            jobs,
+            _render_jobs(
+                [_job(kind, records) for kind, records in jobs.items()],
+                _render_items,
+                cache=cache,
+                executor=executor,
+            ),
+            strict=True,
+        )
+    )
+    candidates = {
+        "profile.html": _profile_html(index, profile_config, items["career"], items["education"]),
+        "papers.html": _list_html(items["paper"]),
+        "books.html": _list_html(items["book"]),
+        "presentations.html": _list_html(items["presentation"]),
+        "projects.html": _list_html(items["project"]),
+        "awards.html": _list_html(items["award"]),
+    }
+    return {name: content.strip() + "\n" for name, content in candidates.items() if content.strip()}
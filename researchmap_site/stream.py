@@ -0,0 +1,290 @@
+"""Incremental parsing of researcher documents with bounded memory.
+
+The researcher document is a single JSON object whose size is dominated by
+the ``items`` arrays under ``@graph``. ``iter_researcher`` walks the document
+chunk by chunk, decodes one member or section item at a time, and drops the
+consumed bytes, so peak memory is bounded by the largest single item rather
+than by the whole response body.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .api import SUPPORTED_SECTION_TYPES, ResearchmapError
+
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+_WHITESPACE = b" \t\r\n"
+# Stands in for an item to mark where a section of a supported type begins.
+_SECTION_START = object()
+
+
+class _Reader:
+    """A byte buffer over an iterable of chunks that discards consumed input."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._position = 0
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += chunk
+                return True
+        return False
+
+    def _release(self) -> None:
+        if self._position:
+            del self._buffer[: self._position]
+            self._position = 0
+
+    def peek(self) -> int | None:
+        """Return the next non-whitespace byte without consuming it."""
+
+        while True:
+            buffer = self._buffer
+            while self._position < len(buffer) and buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < len(buffer):
+                return buffer[self._position]
+            self._release()
+            if not self._fill():
+                return None
+
+    def expect(self, token: bytes) -> None:
+        if self.peek() != token[0]:
+            found = self.peek()
+            raise ResearchmapError(
+                f"researchmap returned malformed JSON: expected {token.decode()!r}, "
+                f"found {chr(found) if found is not None else 'end of input'!r}"
+            )
+        self._position += 1
+
+    def consume(self, token: bytes) -> bool:
+        """Consume ``token`` if it is the next byte."""
+
+        if self.peek() == token[0]:
+            self._position += 1
+            return True
+        return False
+
+    def raw_value(self) -> bytes:
+        """Return the bytes of the next complete JSON value."""
+
+        first = self.peek()
+        if first is None:
+            raise ResearchmapError("researchmap returned truncated JSON")
+        start = self._position
+        index = start
+        depth = 0
+        in_string = False
+        while True:
+            buffer = self._buffer
+            if first not in b'"{[':
+                match = _SCALAR_END.search(buffer, index)
+                if match is not None:
+                    return self._take(start, match.start())
+                index = len(buffer)
+            else:
+                while True:
+                    if in_string:
+                        end = buffer.find(b'"', index)
+                        if end < 0:
+                            index = len(buffer)
+                            break
+                        backslashes = 0
+                        while buffer[end - 1 - backslashes] == 0x5C:
+                            backslashes += 1
+                        index = end + 1
+                        if backslashes % 2:
+                            continue
+                        in_string = False
+                        if depth == 0:
+                            return self._take(start, index)
+                        continue
+                    match = _STRUCTURE.search(buffer, index)
+                    if match is None:
+                        index = len(buffer)
+                        break
+                    index = match.end()
+                    token = buffer[match.start()]
+                    if token == 0x22:
+                        in_string = True
+                    elif token in b"{[":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            return self._take(start, index)
+            if not self._fill():
+                if first not in b'"{[':
+                    return self._take(start, len(self._buffer))
+                raise ResearchmapError("researchmap returned truncated JSON")
+
+    def _take(self, start: int, end: int) -> bytes:
+        value = bytes(self._buffer[start:end])
+        self._position = end
+        self._release()
+        return value
+
+    def value(self) -> Any:
+        try:
+            return json.loads(self.raw_value())
+        except ValueError as error:
+            raise ResearchmapError(f"researchmap returned malformed JSON: {error}") from error
+
+    def key(self) -> str:
+        key = self.value()
+        if not isinstance(key, str):
+            raise ResearchmapError("researchmap returned malformed JSON: object key expected")
+        self.expect(b":")
+        return key
+
+    def members(self) -> Iterator[str]:
+        """Yield object keys; the caller must consume each member's value."""
+
+        self.expect(b"{")
+        if self.consume(b"}"):
+            return
+        while True:
+            yield self.key()
+            if self.consume(b"}"):
+                return
+            self.expect(b",")
+
+    def elements(self) -> Iterator[None]:
+        """Yield once per array element; the caller must consume each element."""
+
+        self.expect(b"[")
+        if self.consume(b"]"):
+            return
+        while True:
+            yield None
+            if self.consume(b"]"):
+                return
+            self.expect(b",")
+
+    def at_end(self) -> bool:
+        return self.peek() is None
+
+
+def _section_items(reader: _Reader) -> Iterator[tuple[str | None, Any]]:
+    """Yield ``(section type, item)`` pairs for one ``@graph`` entry.
+
+    A supported section first yields ``_SECTION_START`` in place of an item,
+    even when it has no items. Items are buffered only when ``items`` precedes
+    ``@type`` in the section; sections of unsupported types are skipped
+    without decoding their items.
+    """
+
+    if reader.peek() != ord("{"):
+        reader.raw_value()
+        return
+    section_type: str | None = None
+    pending: list[Any] = []
+    for key in reader.members():
+        if key == "@type":
+            value = reader.value()
+            section_type = value if isinstance(value, str) else ""
+            if section_type in SUPPORTED_SECTION_TYPES:
+                yield section_type, _SECTION_START
+            for item in pending:
+                yield section_type, item
+            pending.clear()
+        elif key == "items" and reader.peek() == ord("["):
+            for _ in reader.elements():
+                if section_type is None:
+                    pending.append(reader.value())
+                elif section_type in SUPPORTED_SECTION_TYPES:
+                    yield section_type, reader.value()
+                else:
+                    reader.raw_value()
+        else:
+            reader.raw_value()
+
+
+def iter_researcher(chunks: Iterable[bytes], permalink: str) -> Iterator[tuple[str, Any]]:
+    """Validate a researcher document while yielding it piece by piece.
+
+    Yields ``("field", (key, value))`` for top-level members other than
+    ``@graph``, ``("section", section_type)`` where each section of a supported
+    type begins, and ``("item", (section_type, item))`` for each of its object
+    items. The checks match the non-streaming client and fail as soon as the
+    offending member is read.
+    """
+
+    reader = _Reader(chunks)
+    if reader.peek() != ord("{"):
+        raise ResearchmapError("researchmap returned a non-object JSON payload")
+    seen_type = seen_permalink = seen_modified = seen_graph = False
+    valid_item_count = 0
+    for key in reader.members():
+        if key == "@graph":
+            if reader.peek() != ord("["):
+                raise ResearchmapError("researchmap payload is missing an @graph array")
+            seen_graph = True
+            for _ in reader.elements():
+                for section_type, item in _section_items(reader):
+                    if item is _SECTION_START:
+                        yield "section", section_type
+                    elif section_type in SUPPORTED_SECTION_TYPES and isinstance(item, dict):
+                        valid_item_count += 1
+                        yield "item", (section_type, item)
+            continue
+
+        value = reader.value()
+        if key == "@type":
+            if value != "researchers":
+                raise ResearchmapError("researchmap payload is not a researcher record")
+            seen_type = True
+        elif key == "permalink":
+            if value != permalink:
+                raise ResearchmapError(
+                    f"researchmap returned data for an unexpected permalink: {value!r}"
+                )
+            seen_permalink = True
+        elif key == "rm:modified":
+            if not isinstance(value, str) or not value.strip():
+                raise ResearchmapError("researchmap payload is missing rm:modified")
+            seen_modified = True
+        yield "field", (key, value)
+    if not reader.at_end():
+        raise ResearchmapError("researchmap returned trailing data after the JSON payload")
+
+    if not seen_type:
+        raise ResearchmapError("researchmap payload is not a researcher record")
+    if not seen_permalink:
+        raise ResearchmapError("researchmap returned data for an unexpected permalink: None")
+    if not seen_modified:
+        raise ResearchmapError("researchmap payload is missing rm:modified")
+    if not seen_graph:
+        raise ResearchmapError("researchmap payload is missing an @graph array")
+    if valid_item_count == 0:
+        raise ResearchmapError("researchmap payload contains no public section items")
+
+
+def parse_researcher(chunks: Iterable[bytes], permalink: str) -> dict[str, Any]:
+    """Assemble the payload shape ``render_all`` expects from a chunked body.
+
+    Every supported section stays a separate ``@graph`` entry, empty or
+    repeated ones included, so the payload indexes like the full document.
+    """
+
+    payload: dict[str, Any] = {}
+    graph: list[dict[str, Any]] = []
+    for kind, value in iter_researcher(chunks, permalink):
+        if kind == "field":
+            key, field = value
+            payload[key] = field
+        elif kind == "section":
+            graph.append({"@type": value, "items": []})
+        else:
+            _, item = value
+            graph[-1]["items"].append(item)
+    payload["@graph"] = graph
+    return payload
@@ -2,34 +2,186 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import shutil
 import tempfile
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Literal, Protocol
 from uuid import uuid4
 
-from markdown import markdown
+from . import metrics
+from .api import ResearchmapUnavailableError
+from .breaker import CircuitBreaker, CircuitOpenError
+from .config import ResearcherTarget, SiteConfig
+from .diff import PayloadDiff, diff_payloads
+from .metrics import Metrics, SyncMetrics
 
-from .config import SiteConfig
-from .render import render_all
+if TYPE_CHECKING:
+    from .index import ResearcherIndex
+    from .publications import PublicationIndex
+    from .render import ItemCache
 
 FRONT_MATTER = re.compile(r"^---\s*\n[\s\S]*?\n---\s*\n?")
+DEFAULT_BATCH_WORKERS = 8
+RENDERERS = ("html", "markdown")
+Renderer = Literal["html", "markdown"]
 
 
 class ResearcherFetcher(Protocol):
     def fetch_researcher(self, permalink: str) -> dict[str, Any]: ...
 
 
+class AsyncResearcherFetcher(Protocol):
+    async def fetch_researcher(self, permalink: str) -> dict[str, Any]: ...
+
+
+class PayloadSink(Protocol):
+    def save(self, permalink: str, payload: dict[str, Any]) -> object: ...
+
+    def load(self, permalink: str) -> dict[str, Any]: ...
+
+
+def _fetch_index(client: ResearcherFetcher, permalink: str) -> ResearcherIndex:
+    from .index import ResearcherIndex
+
+    # Clients that validate payloads hand over the index they built doing so.
+    fetch_index = getattr(client, "fetch_index", None)
+    if fetch_index is not None:
+        return fetch_index(permalink)
+    return ResearcherIndex.build(client.fetch_researcher(permalink))
+
+
+def _store(payload_store: PayloadSink, permalink: str, payload: dict[str, Any]) -> PayloadDiff:
+    """Save ``payload`` and return its changes since the previous stored payload."""
+
+    try:
+        previous = payload_store.load(permalink)
+    except (OSError, ValueError):
+        previous = None
+    changes = diff_payloads(permalink, previous, payload)
+    payload_store.save(permalink, payload)
+    return changes
+
+
+class _Guarded:
+    """Route a client's fetches through a circuit breaker."""
+
+    def __init__(self, client: ResearcherFetcher, breaker: CircuitBreaker) -> None:
+        self.client = client
+        self.breaker = breaker
+
+    def _call(self, fetch: Callable[[str], Any], permalink: str) -> Any:
+        if not self.breaker.allow():
+            retry_at = self.breaker.retry_at()
+            until = f" until {_utc_timestamp(datetime.fromtimestamp(retry_at, UTC))}"
+            raise CircuitOpenError(
+                f"researchmap failed repeatedly; skipping it{until if retry_at else ''}"
+            )
+        available: bool | None = None
+        try:
+            result = fetch(permalink)
+            available = True
+        except (ResearchmapUnavailableError, TimeoutError, ConnectionError):
+            available = False
+            raise
+        except (RuntimeError, OSError, ValueError):
+            # researchmap answered; a 404 or an invalid profile is one researcher's problem.
+            available = True
+            raise
+        finally:
+            if available is None:
+                self.breaker.release()
+            elif available:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+        return result
+
+    def fetch_researcher(self, permalink: str) -> dict[str, Any]:
+        return self._call(self.client.fetch_researcher, permalink)
+
+    def fetch_index(self, permalink: str) -> ResearcherIndex:
+        return self._call(lambda name: _fetch_index(self.client, name), permalink)
+
+
+async def _fetch_index_async(
+    client: AsyncResearcherFetcher, permalink: str
+) -> Mapping[str, Any] | ResearcherIndex:
+    fetch_index = getattr(client, "fetch_index", None)
+    if fetch_index is not None:
+        return await fetch_index(permalink)
+    return await client.fetch_researcher(permalink)
+
+
 @dataclass(frozen=True)
 class SyncResult:
     output_directory: Path
     generated_files: tuple[str, ...]
     last_updated: str
     source_modified: str
+    status: Literal["updated", "unchanged", "stale"] = "updated"
+    changed_files: tuple[str, ...] = ()
+    unchanged_files: tuple[str, ...] = ()
+    removed_files: tuple[str, ...] = ()
+    changes: PayloadDiff | None = None
+    permalink: str = ""
+    metrics: SyncMetrics | None = None
+    refresh_error: str = ""
+    # A refresh still running after its latency budget; it publishes when it completes.
+    refresh: PendingRefresh | None = field(default=None, compare=False, repr=False)
+
+
+class PendingRefresh:
+    """A refresh that outlived its latency budget and runs on in the background.
+
+    It stores and publishes what it fetched when it completes, unless it is
+    abandoned first.
+    """
+
+    def __init__(self) -> None:
+        self._future: Future[SyncResult] = Future()
+        self._lock = threading.Lock()
+        self._abandoned = False
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> SyncResult:
+        return self._future.result(timeout)
+
+    def abandon(self) -> None:
+        """Keep the refresh from storing or publishing; one already doing so finishes first."""
+
+        with self._lock:
+            self._abandoned = True
+
+    @contextmanager
+    def _commit(self) -> Iterator[None]:
+        with self._lock:
+            if self._abandoned:
+                raise RuntimeError("Refresh abandoned after its latency budget")
+            yield
+
+
+@dataclass(frozen=True)
+class BatchSyncResult:
+    results: tuple[SyncResult, ...]
+    failures: Mapping[str, str]
+    # The merged publication pages; None when not configured or not published.
+    aggregate: SyncResult | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
 
 
 def _utc_timestamp(now: datetime) -> str:
@@ -38,7 +190,7 @@ def _utc_timestamp(now: datetime) -> str:
     return now.astimezone(UTC).strftime("%Y-%m-%d %H:%M (UTC)")
 
 
-def _metadata(*, permalink: str, last_updated: str, source_modified: str) -> str:
+def _metadata(*, permalink: str, last_updated: str, source_modified: str, fingerprint: str) -> str:
     lines = [
         f"last_updated: {last_updated}",
         f"permalink: {permalink}",
@@ -46,9 +198,46 @@ def _metadata(*, permalink: str, last_updated: str, source_modified: str) -> str
     ]
     if source_modified:
         lines.append(f"source_modified: {source_modified}")
+    lines.append(f"fingerprint: {fingerprint}")
     return "\n".join(lines) + "\n"
 
 
+def _published_metadata(output: Path) -> dict[str, str]:
+    try:
+        text = (output / "metadata.yml").read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    metadata: dict[str, str] = {}
+    for line in text.splitlines():
+        key, separator, value = line.partition(":")
+        if separator:
+            metadata[key.strip()] = value.strip()
+    return metadata
+
+
+def _fingerprint(config: SiteConfig, manual_directory: Path | None) -> str:
+    """Hash every local input that affects the output besides the payload."""
+
+    from .render import RENDER_SIGNATURE
+
+    digest = hashlib.sha256(f"render-signature:{RENDER_SIGNATURE}\n".encode())
+    digest.update(repr((config.researchmap, config.profile)).encode("utf-8"))
+    if manual_directory is not None and manual_directory.is_dir():
+        for source in sorted(manual_directory.glob("*.md")):
+            digest.update(b"\0" + source.name.encode("utf-8") + b"\0")
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+_output_locks: dict[Path, threading.Lock] = {}
+_output_locks_guard = threading.Lock()
+
+
+def _output_lock(output: Path) -> threading.Lock:
+    with _output_locks_guard:
+        return _output_locks.setdefault(output, threading.Lock())
+
+
 def _replace_directory(staging: Path, destination: Path) -> None:
     """Replace a generated directory and restore the old tree on failure."""
 
@@ -69,16 +258,107 @@ def _replace_directory(staging: Path, destination: Path) -> None:
         shutil.rmtree(backup)
 
 
-def _html_fragment(markdown_source: str) -> str:
-    source = FRONT_MATTER.sub("", markdown_source).strip()
-    if not source:
-        return ""
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _stage_files(
+    rendered: Mapping[str, str], staging: Path, output: Path
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Fill ``staging`` and return the changed, unchanged, and removed files.
+
+    Files whose content hash matches the published copy are hard-linked (or
+    copied with their metadata) instead of rewritten, so their mtimes survive
+    the directory swap and rsync or a CDN purge can skip them.
+    """
+
+    changed: list[str] = []
+    unchanged: list[str] = []
+    for filename, content in sorted(rendered.items()):
+        data = content.encode("utf-8")
+        published = output / filename
+        target = staging / filename
+        if _file_digest(published) == hashlib.sha256(data).hexdigest():
+            try:
+                os.link(published, target)
+            except OSError:
+                shutil.copy2(published, target)
+            unchanged.append(filename)
+        else:
+            target.write_bytes(data)
+            metrics.count("bytes_written", len(data))
+            changed.append(filename)
+    removed = (
+        sorted(path.name for path in output.iterdir() if path.name not in rendered)
+        if output.is_dir()
+        else []
+    )
+    return tuple(changed), tuple(unchanged), tuple(removed)
+
+
+def _convert_markdown(source: str) -> str:
+    # Python-Markdown is only loaded by the markdown renderer and manual content.
+    from markdown import markdown
+
     # Fragments are mounted below an <h2> section title in index.html.
     source = re.sub(r"^(#{1,5})([ \t]+)", r"#\1\2", source, flags=re.MULTILINE)
     return markdown(source, extensions=["extra", "sane_lists"]).strip() + "\n"
 
 
-def _render_manual_content(directory: Path | None) -> dict[str, str]:
+def _fragment_key(source: str) -> str:
+    from markdown import __version__ as MARKDOWN_VERSION
+
+    digest = hashlib.sha256(f"{MARKDOWN_VERSION}:{source}".encode()).hexdigest()
+    return f"html:{digest}"
+
+
+def _html_fragment(markdown_source: str, cache: ItemCache | None = None) -> str:
+    return _html_fragments({"": markdown_source}, cache)[""]
+
+
+def _html_fragments(
+    sources: Mapping[str, str],
+    cache: ItemCache | None = None,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """Convert named Markdown sources, in ``executor`` when one is given."""
+
+    with metrics.stage("html_fragment"):
+        return _convert_fragments(sources, cache, executor)
+
+
+def _convert_fragments(
+    sources: Mapping[str, str], cache: ItemCache | None, executor: Executor | None
+) -> dict[str, str]:
+    fragments: dict[str, str] = {}
+    pending: dict[str, tuple[str, Future[str] | str]] = {}
+    for name, markdown_source in sources.items():
+        source = FRONT_MATTER.sub("", markdown_source).strip()
+        key = _fragment_key(source) if source and cache is not None else ""
+        cached = cache.get(key) if key and cache is not None else None
+        if not source or cached is not None:
+            fragments[name] = cached or ""
+            continue
+        pending[name] = (
+            key,
+            executor.submit(_convert_markdown, source)
+            if executor is not None
+            else _convert_markdown(source),
+        )
+    for name, (key, outcome) in pending.items():
+        fragment = outcome.result() if isinstance(outcome, Future) else outcome
+        if key and cache is not None:
+            cache.put(key, fragment)
+        fragments[name] = fragment
+    return {name: fragments[name] for name in sources}
+
+
+def _render_manual_content(
+    directory: Path | None, cache: ItemCache | None = None
+) -> dict[str, str]:
     if directory is None:
         return {}
     if not directory.is_dir():
@@ -86,12 +366,54 @@ def _render_manual_content(directory: Path | None) -> dict[str, str]:
 
     rendered: dict[str, str] = {}
     for source in sorted(directory.glob("*.md")):
-        fragment = _html_fragment(source.read_text(encoding="utf-8"))
+        fragment = _html_fragment(source.read_text(encoding="utf-8"), cache)
         if fragment:
             rendered[f"{source.stem}.html"] = fragment
     return rendered
 
 
+def _refresh(
+    publish: Callable[..., SyncResult],
+    client: ResearcherFetcher,
+    permalink: str,
+    payload_store: PayloadSink | None,
+    force: bool,
+    commit: Callable[[], AbstractContextManager[object]] = nullcontext,
+) -> SyncResult:
+    with metrics.collecting(Metrics()) as collector:
+        with metrics.stage("fetch"):
+            if payload_store is None:
+                fetched: Mapping[str, Any] | ResearcherIndex = _fetch_index(client, permalink)
+            else:
+                payload = client.fetch_researcher(permalink)
+                fetched = payload
+        # Storing and publishing happen together or, for an abandoned refresh, not at all.
+        with commit():
+            changes = None
+            if payload_store is not None:
+                with metrics.stage("store"):
+                    changes = _store(payload_store, permalink, payload)
+            result = publish(fetched, force=force)
+    return replace(result, changes=changes, metrics=collector.snapshot())
+
+
+def _publish_stale(
+    publish: Callable[..., SyncResult], permalink: str, payload_store: PayloadSink | None
+) -> SyncResult | None:
+    """Publish the last stored payload unless the output already holds content."""
+
+    if payload_store is None:
+        return None
+    try:
+        payload = payload_store.load(permalink)
+        with metrics.collecting(Metrics()) as collector:
+            result = publish(payload, force=False, stale=True)
+    except (OSError, ValueError):
+        # The refresh reports the same problem if it is not just a missing snapshot.
+        return None
+    return replace(result, metrics=collector.snapshot())
+
+
 def synchronize(
     config: SiteConfig,
     client: ResearcherFetcher,
@@ -99,52 +421,376 @@ def synchronize(
     *,
     manual_content_directory: str | Path | None = None,
     now: datetime | None = None,
+    force: bool = False,
+    render_cache: ItemCache | None = None,
+    renderer: Renderer = "html",
+    executor: Executor | None = None,
+    payload_store: PayloadSink | None = None,
+    latency_budget: float | None = None,
+    breaker: CircuitBreaker | None = None,
+    publications: PublicationIndex | None = None,
 ) -> SyncResult:
-    """Fetch, render, validate, and atomically publish generated content."""
+    """Fetch, render, validate, and atomically publish generated content.
+
+    When the fetched ``rm:modified`` and the local inputs match what was last
+    published, nothing is rendered or written and the result is ``unchanged``.
+    ``force`` always republishes. A ``render_cache`` lets unchanged items
+    and sections reuse their Markdown and HTML from earlier runs. The
+    ``html`` renderer emits fragments directly; ``markdown`` renders the
+    Markdown sources and converts them with Python-Markdown, with the same
+    result. An ``executor``, typically a ``ProcessPoolExecutor``, renders the
+    sections of the researcher in parallel. Each fetched payload is saved
+    to ``payload_store`` before it is published, and ``changes`` of the
+    result holds its item-level diff against the previously stored payload.
+
+    With a ``latency_budget`` or a ``breaker``, the last stored payload is
+    published first when nothing is published yet. A refresh that fails, or
+    is refused by an open ``breaker``, then returns that ``stale`` result
+    with its ``refresh_error``. A refresh that outlives ``latency_budget``
+    seconds keeps running in a background thread and publishes when it
+    completes; the stale result returned meanwhile holds it as a
+    ``PendingRefresh``, which a caller that cannot wait abandons.
+    Each published researcher also replaces its items in ``publications``.
+    """
+
+    permalink = config.researchmap.permalink
+    publish = partial(
+        _publish,
+        config,
+        output_directory=output_directory,
+        manual_content_directory=manual_content_directory,
+        now=now,
+        render_cache=render_cache,
+        renderer=renderer,
+        executor=executor,
+        publications=publications,
+    )
+    if latency_budget is None and breaker is None:
+        return _refresh(publish, client, permalink, payload_store, force)
+    if latency_budget is not None and latency_budget <= 0:
+        raise ValueError("latency_budget must be positive")
+    if latency_budget is not None and payload_store is None:
+        raise ValueError("latency_budget needs a payload_store to serve stale content from")
+    if breaker is not None:
+        client = _Guarded(client, breaker)
+
+    stale = _publish_stale(publish, permalink, payload_store)
+    pending = PendingRefresh()
+    refresh = pending._future
+
+    def run() -> None:
+        try:
+            result = _refresh(publish, client, permalink, payload_store, force, pending._commit)
+            refresh.set_result(result)
+        except BaseException as error:
+            refresh.set_exception(error)
+
+    if latency_budget is None or stale is None:
+        # Without stale content to serve, waiting for the refresh is the only option.
+        run()
+    else:
+        # Exit may stop an abandoned refresh, never one that is storing or publishing.
+        name = f"researchmap-refresh-{permalink}"
+        threading.Thread(target=run, name=name, daemon=True).start()
+        wait([refresh], timeout=latency_budget)
+    if not refresh.done():
+        return replace(
+            stale,
+            refresh_error=f"Refresh exceeded the {latency_budget:g}s latency budget",
+            refresh=pending,
+        )
+    error = refresh.exception()
+    if error is None:
+        return refresh.result()
+    if stale is None or not isinstance(error, RuntimeError | OSError | ValueError):
+        raise error
+    return replace(stale, refresh_error=str(error))
+
 
-    payload = client.fetch_researcher(config.researchmap.permalink)
-    markdown_sections = render_all(payload, config.profile)
-    if "profile.md" not in markdown_sections:
-        raise ValueError("Rendering produced no profile content")
+async def asynchronize(
+    config: SiteConfig,
+    client: AsyncResearcherFetcher,
+    output_directory: str | Path,
+    *,
+    manual_content_directory: str | Path | None = None,
+    now: datetime | None = None,
+    force: bool = False,
+    render_cache: ItemCache | None = None,
+    renderer: Renderer = "html",
+    executor: Executor | None = None,
+    payload_store: PayloadSink | None = None,
+    publications: PublicationIndex | None = None,
+) -> SyncResult:
+    """Await the fetch, then render and publish like ``synchronize``.
+
+    Rendering and the atomic swap are blocking, so they run in the event
+    loop's default executor and many syncs can share one loop.
+    """
+
+    import asyncio
+
+    permalink = config.researchmap.permalink
+    changes = None
+    # Each task runs in a copy of the context, so concurrent syncs keep their own collector.
+    with metrics.collecting(Metrics()) as collector:
+        with metrics.stage("fetch"):
+            if payload_store is None:
+                fetched = await _fetch_index_async(client, permalink)
+            else:
+                payload = await client.fetch_researcher(permalink)
+                fetched = payload
+        if payload_store is not None:
+            with metrics.stage("store"):
+                changes = await asyncio.to_thread(_store, payload_store, permalink, payload)
+        result = await asyncio.to_thread(
+            _publish,
+            config,
+            fetched,
+            output_directory,
+            manual_content_directory=manual_content_directory,
+            now=now,
+            force=force,
+            render_cache=render_cache,
+            renderer=renderer,
+            executor=executor,
+            publications=publications,
+        )
+    return replace(result, changes=changes, metrics=collector.snapshot())
+
+
+def _publish(
+    config: SiteConfig,
+    payload: Mapping[str, Any] | ResearcherIndex,
+    output_directory: str | Path,
+    *,
+    manual_content_directory: str | Path | None,
+    now: datetime | None,
+    force: bool,
+    render_cache: ItemCache | None,
+    renderer: Renderer,
+    executor: Executor | None,
+    publications: PublicationIndex | None = None,
+    stale: bool = False,
+) -> SyncResult:
+    # The renderers and records load here, so the command line starts without them.
+    from . import render_html
+    from .index import ResearcherIndex
+    from .render import render_all
 
-    rendered = {
-        f"{Path(filename).stem}.html": _html_fragment(content)
-        for filename, content in markdown_sections.items()
-    }
+    output = Path(output_directory).resolve()
     manual_directory = (
         Path(manual_content_directory).resolve() if manual_content_directory is not None else None
     )
-    manual_sections = _render_manual_content(manual_directory)
-    collisions = sorted(rendered.keys() & manual_sections.keys())
-    if collisions:
-        raise ValueError(
-            "Manual content conflicts with generated sections: " + ", ".join(collisions)
+    with metrics.stage("index"):
+        index = ResearcherIndex.of(payload)
+    metrics.set_items(index.item_counts)
+    if publications is not None:
+        with metrics.stage("publications"):
+            publications.update(config.researchmap.permalink, index)
+    source_modified = str(index.fields.get("rm:modified") or "").strip()
+    fingerprint = _fingerprint(config, manual_directory)
+    # A refresh that outlives its latency budget may publish alongside the next run.
+    with _output_lock(output):
+        published = _published_metadata(output)
+        if stale:
+            # Whatever is published for the same inputs is at least as fresh as the store.
+            current = bool(published.get("source_modified"))
+        else:
+            current = (
+                not force
+                and bool(source_modified)
+                and published.get("source_modified") == source_modified
+            )
+        if current and published.get("fingerprint") == fingerprint:
+            files = tuple(sorted(path.name for path in output.iterdir()))
+            return SyncResult(
+                output_directory=output,
+                generated_files=files,
+                last_updated=published.get("last_updated", ""),
+                source_modified=published.get("source_modified", ""),
+                status="stale" if stale else "unchanged",
+                unchanged_files=files,
+                permalink=config.researchmap.permalink,
+            )
+
+        with metrics.stage("render"):
+            if renderer == "html":
+                rendered = render_html.render_all(
+                    index, config.profile, cache=render_cache, executor=executor
+                )
+            elif renderer == "markdown":
+                sources = render_all(index, config.profile, cache=render_cache, executor=executor)
+                rendered = _html_fragments(
+                    {
+                        f"{Path(filename).stem}.html": content
+                        for filename, content in sources.items()
+                    },
+                    render_cache,
+                    executor,
+                )
+            else:
+                raise ValueError(f"Unknown renderer: {renderer!r}")
+        if "profile.html" not in rendered:
+            raise ValueError("Rendering produced no profile content")
+
+        with metrics.stage("manual_content"):
+            manual_sections = _render_manual_content(manual_directory, render_cache)
+        collisions = sorted(rendered.keys() & manual_sections.keys())
+        if collisions:
+            raise ValueError(
+                "Manual content conflicts with generated sections: " + ", ".join(collisions)
+            )
+        rendered.update(manual_sections)
+
+        timestamp = _utc_timestamp(now or datetime.now(UTC))
+        rendered["metadata.yml"] = _metadata(
+            permalink=config.researchmap.permalink,
+            last_updated=timestamp,
+            source_modified=source_modified,
+            fingerprint=fingerprint,
         )
-    rendered.update(manual_sections)
 
-    timestamp = _utc_timestamp(now or datetime.now(UTC))
-    source_modified = str(payload.get("rm:modified") or "").strip()
-    rendered["metadata.yml"] = _metadata(
-        permalink=config.researchmap.permalink,
-        last_updated=timestamp,
-        source_modified=source_modified,
+        output.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{output.name}.staging-", dir=output.parent))
+        try:
+            with metrics.stage("stage"):
+                changed, unchanged, removed = _stage_files(rendered, staging, output)
+            with metrics.stage("replace"):
+                _replace_directory(staging, output)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging)
+
+        return SyncResult(
+            output_directory=output,
+            generated_files=tuple(sorted(rendered)),
+            last_updated=timestamp,
+            source_modified=source_modified,
+            status="stale" if stale else "updated",
+            changed_files=changed,
+            unchanged_files=unchanged,
+            removed_files=removed,
+            permalink=config.researchmap.permalink,
+        )
+
+
+def _target_config(config: SiteConfig, target: ResearcherTarget) -> SiteConfig:
+    return replace(
+        config,
+        researchmap=replace(config.researchmap, permalink=target.permalink),
+        profile=target.profile,
+        researchers=(),
+        aggregate_directory=None,
     )
 
-    output = Path(output_directory).resolve()
-    output.parent.mkdir(parents=True, exist_ok=True)
-    staging = Path(tempfile.mkdtemp(prefix=f".{output.name}.staging-", dir=output.parent))
-    try:
-        for filename, content in sorted(rendered.items()):
-            path = staging / filename
-            path.write_text(content, encoding="utf-8", newline="\n")
-        _replace_directory(staging, output)
-    finally:
-        if staging.exists():
-            shutil.rmtree(staging)
 
+def publish_aggregate(
+    publications: PublicationIndex,
+    output_directory: str | Path,
+    *,
+    render_cache: ItemCache | None = None,
+    now: datetime | None = None,
+) -> SyncResult:
+    """Atomically publish the merged publication pages of ``publications``."""
+
+    output = Path(output_directory).resolve()
+    rendered = publications.fragments(cache=render_cache)
+    timestamp = _utc_timestamp(now or datetime.now(UTC))
+    with _output_lock(output):
+        output.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{output.name}.staging-", dir=output.parent))
+        try:
+            changed, unchanged, removed = _stage_files(rendered, staging, output)
+            if changed or removed or not output.is_dir():
+                _replace_directory(staging, output)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging)
     return SyncResult(
         output_directory=output,
         generated_files=tuple(sorted(rendered)),
         last_updated=timestamp,
-        source_modified=source_modified,
+        source_modified="",
+        status="updated" if changed or removed else "unchanged",
+        changed_files=changed,
+        unchanged_files=unchanged,
+        removed_files=removed,
     )
+
+
+def synchronize_batch(
+    config: SiteConfig,
+    client: ResearcherFetcher,
+    *,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    now: datetime | None = None,
+    force: bool = False,
+    render_cache: ItemCache | None = None,
+    renderer: Renderer = "html",
+    executor: Executor | None = None,
+    payload_store: PayloadSink | None = None,
+    latency_budget: float | None = None,
+    breaker: CircuitBreaker | None = None,
+) -> BatchSyncResult:
+    """Synchronize every configured researcher through a bounded thread pool.
+
+    Each researcher is fetched, rendered, and atomically published on its own;
+    one failure is reported without touching the other researchers' output.
+    The client is shared, so its connection pool should allow ``max_workers``
+    concurrent connections. ``latency_budget`` and ``breaker`` apply to each
+    researcher as in ``synchronize``; one shared breaker stops the whole batch
+    from waiting on an upstream that keeps failing. With an
+    ``aggregate_directory`` configured, the papers and presentations of all
+    researchers are merged and published there once every researcher has
+    synced; after a failure the previous aggregate pages stay in place.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    targets = config.researchers
+    timestamp = now or datetime.now(UTC)
+    publications = None
+    if config.aggregate_directory is not None:
+        from .publications import PublicationIndex
+
+        publications = PublicationIndex()
+
+    def run(target: ResearcherTarget) -> SyncResult | str:
+        try:
+            return synchronize(
+                _target_config(config, target),
+                client,
+                target.output_directory,
+                manual_content_directory=target.manual_content_directory,
+                now=timestamp,
+                force=force,
+                render_cache=render_cache,
+                renderer=renderer,
+                executor=executor,
+                payload_store=payload_store,
+                latency_budget=latency_budget,
+                breaker=breaker,
+                publications=publications,
+            )
+        except (RuntimeError, OSError, ValueError) as error:
+            return str(error)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(targets) or 1),
+        thread_name_prefix="researchmap-sync",
+    ) as pool:
+        outcomes = list(pool.map(run, targets))
+
+    results: list[SyncResult] = []
+    failures: dict[str, str] = {}
+    for target, outcome in zip(targets, outcomes, strict=True):
+        if isinstance(outcome, SyncResult):
+            results.append(outcome)
+        else:
+            failures[target.permalink] = outcome
+    aggregate = None
+    if publications is not None and config.aggregate_directory is not None and not failures:
+        aggregate = publish_aggregate(
+            publications, config.aggregate_directory, render_cache=render_cache, now=timestamp
+        )
+    return BatchSyncResult(results=tuple(results), failures=failures, aggregate=aggregate)
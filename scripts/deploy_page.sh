@@ -33,11 +33,15 @@ for required_file in "${required_files[@]}"; do
   fi
 done
 
+# Build before switching branches: the package is installed from this checkout.
+site_build="$(mktemp -d "${RUNNER_TEMP}/site-build.XXXXXX")/site"
+python -m researchmap_site.build "${site_snapshot}" "${site_build}"
+
 git config user.email "41898282+github-actions[bot]@users.noreply.github.com"
 git config user.name "github-actions[bot]"
 git fetch origin page
 git switch --force-create page origin/page
-rsync --archive --delete --exclude=.git "${site_snapshot}/" ./
+rsync --archive --delete --exclude=.git "${site_build}/" ./
 
 git add -u
 while IFS= read -r -d '' path; do
@@ -0,0 +1,147 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from researchmap_site.aio import AsyncResearchmapClient
+from researchmap_site.client import ResearchmapError
+from researchmap_site.config import ProfileConfig, ResearchmapConfig, SiteConfig
+from researchmap_site.ratelimit import AdaptiveRateLimiter
+from researchmap_site.sync import asynchronize
+
+CONFIG = SiteConfig(
+    researchmap=ResearchmapConfig(permalink="kenjikun", base_url="https://api.researchmap.jp"),
+    profile=ProfileConfig(email="person [at] example.test", social_links=()),
+)
+
+
+def researcher(permalink: str = "kenjikun") -> dict[str, object]:
+    return {
+        "@type": "researchers",
+        "permalink": permalink,
+        "rm:modified": "2026-01-15T06:32:11Z",
+        "@graph": [{"@type": "education", "items": [{"affiliation": {"en": "School"}}]}],
+    }
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload: object = None, headers: dict[str, str] | None = None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = json.dumps(payload).encode("utf-8")
+
+    async def read(self) -> bytes:
+        await asyncio.sleep(0)
+        return self.body
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse] | None = None) -> None:
+        self.responses = responses or []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url: str, *, params: dict[str, str]) -> "FakeRequest":
+        return FakeRequest(self, url)
+
+
+class FakeRequest:
+    def __init__(self, session: FakeSession, url: str) -> None:
+        self.session = session
+        self.url = url
+
+    async def __aenter__(self) -> FakeResponse:
+        session = self.session
+        session.in_flight += 1
+        session.max_in_flight = max(session.max_in_flight, session.in_flight)
+        await asyncio.sleep(0.01)
+        if session.responses:
+            return session.responses.pop(0)
+        return FakeResponse(200, researcher(self.url.rsplit("/", 1)[-1]))
+
+    async def __aexit__(self, *_: object) -> None:
+        self.session.in_flight -= 1
+
+
+def test_async_client_retries_with_retry_after_and_backoff() -> None:
+    sleeps: list[float] = []
+    clock = [0.0]
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock[0] += delay
+
+    session = FakeSession(
+        [
+            FakeResponse(503, headers={"Retry-After": "7"}),
+            FakeResponse(502),
+            FakeResponse(500),
+            FakeResponse(200, researcher()),
+        ]
+    )
+    limiter = AdaptiveRateLimiter(clock=lambda: clock[0])
+    client = AsyncResearchmapClient(
+        "https://api.researchmap.jp", session=session, sleep=sleep, rate_limiter=limiter
+    )
+
+    payload = asyncio.run(client.fetch_researcher("kenjikun"))
+
+    assert payload["permalink"] == "kenjikun"
+    assert sleeps == [7.0, 2.0, 4.0]
+    assert limiter.stats().throttled == 1
+    assert limiter.rate < limiter.max_rate
+
+
+def test_async_client_gives_up_after_the_retry_budget() -> None:
+    async def sleep(delay: float) -> None:
+        return None
+
+    session = FakeSession([FakeResponse(503) for _ in range(5)])
+    client = AsyncResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,
+        sleep=sleep,
+        rate_limiter=AdaptiveRateLimiter(),
+    )
+
+    with pytest.raises(ResearchmapError, match="HTTP 503 after 4 retries"):
+        asyncio.run(client.fetch_researcher("kenjikun"))
+
+
+def test_async_client_enforces_a_global_concurrency_limit() -> None:
+    session = FakeSession()
+    client = AsyncResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,
+        max_concurrency=3,
+        rate_limiter=AdaptiveRateLimiter(rate=1000.0, burst=100),
+    )
+
+    async def fetch_all() -> list[dict[str, object]]:
+        return await asyncio.gather(
+            *(client.fetch_researcher(f"person{index}") for index in range(20))
+        )
+
+    payloads = asyncio.run(fetch_all())
+
+    assert [payload["permalink"] for payload in payloads] == [
+        f"person{index}" for index in range(20)
+    ]
+    assert session.max_in_flight == 3
+
+
+def test_asynchronize_publishes_like_synchronize(tmp_path: Path) -> None:
+    client = AsyncResearchmapClient("https://api.researchmap.jp", session=FakeSession())
+    output = tmp_path / "_auto_contents"
+
+    result = asyncio.run(asynchronize(CONFIG, client, output))
+
+    assert result.status == "updated"
+    assert "School" in (output / "profile.html").read_text(encoding="utf-8")
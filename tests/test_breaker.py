@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from researchmap_site.breaker import CircuitBreaker
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_repeated_failures_and_admits_one_trial() -> None:
+    clock = Clock()
+    breaker = CircuitBreaker(threshold=2, cooldown=60, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    assert breaker.retry_at() == 1_060.0
+
+    clock.now += 60
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+    # A failed trial reopens the breaker at once, below the threshold.
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_breaker_state_survives_between_runs(tmp_path: Path) -> None:
+    clock = Clock()
+    path = tmp_path / "breaker.json"
+    first = CircuitBreaker(path, threshold=1, cooldown=60, clock=clock)
+    first.record_failure()
+
+    assert CircuitBreaker(path, clock=clock).state == "open"
+    clock.now += 60
+    second = CircuitBreaker(path, clock=clock)
+    assert second.allow()
+    second.record_success()
+    assert CircuitBreaker(path, clock=clock).state == "closed"
+
+    path.write_text("not json", encoding="utf-8")
+    assert CircuitBreaker(path, clock=clock).state == "closed"
@@ -0,0 +1,74 @@
+import gzip
+from pathlib import Path
+
+from researchmap_site.build import build_site
+
+INDEX = """<link rel="stylesheet" href="assets/css/style.css">
+<a href="https://researchmap.jp/kenjikun">researchmap</a> <a href="#papers">Papers</a>
+<div data-source="_auto_contents/papers.html"></div>
+<div data-source="_auto_contents/books.html" data-optional></div>
+"""
+
+
+def test_build_fingerprints_references_and_precompresses(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "assets" / "css").mkdir(parents=True)
+    (source / "_auto_contents").mkdir()
+    (source / "index.html").write_text(INDEX, encoding="utf-8")
+    (source / "assets" / "css" / "style.css").write_text("body{}", encoding="utf-8")
+    (source / "_auto_contents" / "papers.html").write_text("<ul></ul>\n", encoding="utf-8")
+    (source / "_auto_contents" / "metadata.yml").write_text("permalink: a\n", encoding="utf-8")
+
+    result = build_site(source, tmp_path / "site")
+
+    site = tmp_path / "site"
+    papers = result.fingerprinted["_auto_contents/papers.html"]
+    assert papers.startswith("_auto_contents/papers.") and papers.endswith(".html")
+    assert (site / papers).read_bytes() == (site / "_auto_contents/papers.html").read_bytes()
+    index = (site / "index.html").read_text(encoding="utf-8")
+    assert f'data-source="{papers}" data-fingerprinted' in index
+    assert f'href="{result.fingerprinted["assets/css/style.css"]}"' in index
+    # Missing optional fragments and external or in-page links are left alone.
+    assert 'data-source="_auto_contents/books.html" data-optional' in index
+    assert 'href="https://researchmap.jp/kenjikun"' in index and 'href="#papers"' in index
+    assert gzip.decompress((site / "_auto_contents/metadata.yml.gz").read_bytes()) == (
+        b"permalink: a\n"
+    )
+
+    before = {path: path.read_bytes() for path in site.rglob("*") if path.is_file()}
+    build_site(source, site)
+    assert {path: path.read_bytes() for path in site.rglob("*") if path.is_file()} == before
+
+
+def test_build_prerenders_fragments_and_hides_empty_optional_sections(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "_auto_contents").mkdir(parents=True)
+    (source / "index.html").write_text(
+        """<li><a href="#profile">Profile</a></li><li><a href="#books">Books</a></li>
+<noscript><p>JavaScript is required.</p></noscript>
+<section id="profile">
+<div data-source="_auto_contents/profile.html" aria-busy="true">
+<p class="loading">Loading…</p>
+</div>
+</section>
+<section id="books" data-optional>
+<div data-source="_auto_contents/books.html" aria-busy="true"><p>Loading…</p></div>
+</section>
+<time id="last-updated">unknown</time>
+""",
+        encoding="utf-8",
+    )
+    (source / "_auto_contents" / "profile.html").write_text("<p>Profile</p>\n", encoding="utf-8")
+    (source / "_auto_contents" / "metadata.yml").write_text(
+        "last_updated: 2026-08-20 12:34 (UTC)\n", encoding="utf-8"
+    )
+
+    result = build_site(source, tmp_path / "site")
+
+    index = (tmp_path / "site" / "index.html").read_text(encoding="utf-8")
+    assert result.prerendered == ("_auto_contents/profile.html",)
+    assert 'aria-busy="false" data-prerendered>\n<p>Profile</p>\n</div>' in index
+    assert "Loading" not in index and "<noscript>" not in index
+    assert '<section id="books" hidden data-optional>' in index
+    assert '<li hidden><a href="#books">' in index
+    assert '<time id="last-updated" data-prerendered>2026-08-20 12:34 (UTC)</time>' in index
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only a fetch or render may load; see the lazy imports in cli and sync.
+HEAVY_MODULES = (
+    "asyncio",
+    "markdown",
+    "requests",
+    "urllib3",
+    "researchmap_site.client",
+    "researchmap_site.records",
+    "researchmap_site.render",
+    "researchmap_site.render_html",
+)
+
+
+def imported_modules(*args: str) -> tuple[int, dict[str, int]]:
+    """Run the CLI under ``-X importtime`` and return its exit code and module times."""
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "researchmap_site", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    modules: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return process.returncode, modules
+
+
+@pytest.mark.parametrize(
+    ("args", "status"),
+    [
+        (("--help",), 0),
+        (("--config", "/nonexistent/site.toml"), 1),
+        (("--workers", "0"), 2),
+    ],
+)
+def test_cli_starts_without_network_or_render_modules(args: tuple[str, ...], status: int) -> None:
+    code, modules = imported_modules(*args)
+
+    assert code == status
+    assert "researchmap_site.cli" in modules
+    assert sorted(name for name in HEAVY_MODULES if name in modules) == []
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
+import json
+from pathlib import Path
+
+import pytest
 import requests
+import urllib3
 
-from researchmap_site.client import ResearchmapClient, ResearchmapError
+from researchmap_site.cache import BodyWriter, ResponseCache
+from researchmap_site.client import ResearchmapClient, ResearchmapError, _retry_policy
+from researchmap_site.ratelimit import AdaptiveRateLimiter
 
 
 class FakeResponse:
-    def __init__(self, payload: object) -> None:
+    def __init__(
+        self,
+        payload: object,
+        *,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode("utf-8")
+        self.raw: object = None
 
     def raise_for_status(self) -> None:
         return None
@@ -21,14 +38,35 @@ class FakeSession:
         self.headers: dict[str, str] = {}
         self.response = response
         self.last_request: tuple[str, dict[str, str], float] | None = None
+        self.last_headers: dict[str, str] = {}
+        self.streamed = False
 
-    def get(self, url: str, *, params: dict[str, str], timeout: float) -> FakeResponse:
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, str],
+        headers: dict[str, str] | None = None,
+        timeout: float,
+        stream: bool = False,
+    ) -> FakeResponse:
         self.last_request = (url, params, timeout)
+        self.last_headers = headers or {}
+        self.streamed = stream
         if self.response is None:
             raise requests.Timeout("timed out")
         return self.response
 
 
+def researcher() -> dict[str, object]:
+    return {
+        "@type": "researchers",
+        "permalink": "kenjikun",
+        "rm:modified": "2026-01-15T06:32:11Z",
+        "@graph": [{"@type": "education", "items": [{"rm:id": "1"}]}],
+    }
+
+
 def test_fetch_researcher_uses_format_and_timeout() -> None:
     session = FakeSession(
         FakeResponse(
@@ -56,6 +94,19 @@ def test_fetch_researcher_uses_format_and_timeout() -> None:
     )
 
 
+def test_fetch_index_returns_the_index_built_during_validation() -> None:
+    client = ResearchmapClient(
+        "https://api.researchmap.jp/",
+        session=FakeSession(FakeResponse(researcher())),  # type: ignore[arg-type]
+    )
+
+    index = client.fetch_index("kenjikun")
+
+    assert index.fields["permalink"] == "kenjikun"
+    assert "@graph" not in index.fields
+    assert len(index.section("education")) == 1
+
+
 def test_fetch_researcher_rejects_invalid_schema() -> None:
     session = FakeSession(
         FakeResponse(
@@ -140,3 +191,214 @@ def test_fetch_researcher_turns_network_errors_into_sync_failures() -> None:
         assert "timed out" in str(error)
     else:
         raise AssertionError("network errors should fail the sync")
+
+
+def test_fetch_researcher_revalidates_cached_responses(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache")
+    session = FakeSession(
+        FakeResponse(researcher(), headers={"ETag": '"v1"', "Last-Modified": "Thu, 15 Jan 2026"})
+    )
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        cache=cache,
+    )
+
+    first = client.fetch_researcher("kenjikun")
+    assert session.last_headers == {}
+
+    session.response = FakeResponse(None, status_code=304)
+    second = client.fetch_researcher("kenjikun")
+
+    assert session.last_headers == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Thu, 15 Jan 2026",
+    }
+    assert second == first
+
+
+def test_invalid_payloads_are_not_cached(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache")
+    degraded = researcher()
+    degraded["@graph"] = []
+    session = FakeSession(FakeResponse(degraded, headers={"ETag": '"bad"'}))
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        cache=cache,
+    )
+
+    try:
+        client.fetch_researcher("kenjikun")
+    except ResearchmapError:
+        pass
+    else:
+        raise AssertionError("empty researcher data should fail")
+
+    assert cache.get("https://api.researchmap.jp/kenjikun?format=json") is None
+
+
+class PagedSession:
+    def __init__(self, papers: int, *, report_total: bool = True) -> None:
+        self.headers: dict[str, str] = {}
+        self.papers = [{"rm:id": str(index)} for index in range(papers)]
+        self.report_total = report_total
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, str],
+        headers: dict[str, str] | None = None,
+        timeout: float,
+        stream: bool = False,
+    ) -> FakeResponse:
+        self.requests.append((url, params))
+        section = url.rsplit("/", 1)[-1]
+        if section == "profile":
+            header = researcher()
+            header.pop("@graph")
+            return FakeResponse(header)
+        if section != "published_papers":
+            return FakeResponse(None, status_code=404)
+        start = int(params["start"])
+        page = self.papers[start - 1 : start - 1 + int(params["limit"])]
+        if not self.report_total:
+            return FakeResponse({"items": page})
+        return FakeResponse({"total_items": len(self.papers), "items": page})
+
+
+@pytest.mark.parametrize(
+    ("papers", "report_total", "expected_starts"),
+    [
+        (5, True, ["1", "3", "5"]),
+        (4, True, ["1", "3"]),
+        (5, False, ["1", "3", "5"]),
+        (4, False, ["1", "3", "5"]),
+    ],
+)
+def test_paged_fetch_assembles_sections_from_every_page(
+    papers: int, report_total: bool, expected_starts: list[str]
+) -> None:
+    session = PagedSession(papers=papers, report_total=report_total)
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        page_size=2,
+        rate_limiter=AdaptiveRateLimiter(rate=1000.0, burst=100),
+    )
+
+    payload = client.fetch_researcher("kenjikun")
+
+    assert payload["permalink"] == "kenjikun"
+    assert payload["@graph"] == [{"@type": "published_papers", "items": session.papers}]
+    starts = sorted(
+        params["start"]
+        for url, params in session.requests
+        if url.endswith("/kenjikun/published_papers")
+    )
+    assert starts == expected_starts
+
+
+def test_paged_fetches_of_every_caller_have_a_pooled_connection() -> None:
+    base_url = "https://api.researchmap.jp"
+    with (
+        ResearchmapClient(base_url, pool_size=8, page_size=100, section_workers=4) as paged,
+        ResearchmapClient(base_url, pool_size=8) as whole,
+    ):
+        assert paged.session.get_adapter(base_url)._pool_maxsize == 32
+        assert whole.session.get_adapter(base_url)._pool_maxsize == 8
+
+
+class StreamingResponse(FakeResponse):
+    def iter_content(self, chunk_size: int) -> list[bytes]:
+        return [self.content[start : start + 3] for start in range(0, len(self.content), 3)]
+
+    def close(self) -> None:
+        return None
+
+
+def test_streaming_fetch_parses_and_caches_the_body_incrementally(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache")
+    session = FakeSession(StreamingResponse(researcher(), headers={"ETag": '"v1"'}))
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        cache=cache,
+        stream=True,
+    )
+
+    first = client.fetch_researcher("kenjikun")
+    session.response = StreamingResponse(None, status_code=304)
+    second = client.fetch_researcher("kenjikun")
+
+    assert first == second == researcher()
+    assert session.streamed
+    assert session.last_headers == {"If-None-Match": '"v1"'}
+
+
+def test_streaming_fetch_survives_a_failing_cache_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def disk_full(self: BodyWriter, chunk: bytes) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(BodyWriter, "write", disk_full)
+    cache = ResponseCache(tmp_path / "cache")
+    session = FakeSession(StreamingResponse(researcher(), headers={"ETag": '"v1"'}))
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        cache=cache,
+        stream=True,
+    )
+
+    assert client.fetch_researcher("kenjikun") == researcher()
+    assert list((tmp_path / "cache").rglob("*")) == []
+
+
+def test_throttled_responses_slow_down_the_shared_limiter() -> None:
+    limiter = AdaptiveRateLimiter(rate=4.0)
+    session = FakeSession(FakeResponse(None, status_code=429, headers={"Retry-After": "2"}))
+    session.response.raise_for_status = _raise_http_error  # type: ignore[method-assign]
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=session,  # type: ignore[arg-type]
+        rate_limiter=limiter,
+    )
+
+    try:
+        client.fetch_researcher("kenjikun")
+    except ResearchmapError:
+        pass
+    else:
+        raise AssertionError("throttled responses should fail the sync")
+
+    stats = limiter.stats()
+    assert stats.throttled == 1
+    assert stats.rate == 2.0
+
+
+def test_a_throttled_response_is_reported_once_when_retries_run_out() -> None:
+    limiter = AdaptiveRateLimiter(rate=4.0)
+    raw = urllib3.HTTPResponse(status=429)
+    # urllib3 reports the last throttled response before giving up on retries.
+    _retry_policy(limiter).increment("GET", "/kenjikun", response=raw)
+    response = FakeResponse(None, status_code=429)
+    response.raw = raw
+    client = ResearchmapClient(
+        "https://api.researchmap.jp",
+        session=FakeSession(response),  # type: ignore[arg-type]
+        rate_limiter=limiter,
+    )
+
+    client._send("https://api.researchmap.jp/kenjikun", {"format": "json"}, {})
+
+    stats = limiter.stats()
+    assert stats.throttled == 1
+    assert stats.rate == 2.0
+
+
+def _raise_http_error() -> None:
+    raise requests.HTTPError("429 Too Many Requests")
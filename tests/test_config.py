@@ -36,3 +36,69 @@ email = "person@example.test"
 
     with pytest.raises(ConfigError, match="HTTPS"):
         load_config(config_file)
+
+
+def test_config_declares_batch_researchers(tmp_path: Path) -> None:
+    config_file = tmp_path / "site.toml"
+    config_file.write_text(
+        """
+[researchmap]
+permalink = "person"
+base_url = "https://example.test"
+
+[profile]
+email = "person@example.test"
+
+[[researchers]]
+permalink = "alice"
+output = "sites/alice/_auto_contents"
+
+[[researchers]]
+permalink = "bob"
+output = "sites/bob/_auto_contents"
+manual_content = "sites/bob/_contents"
+
+[researchers.profile]
+email = "bob@example.test"
+
+[aggregate]
+output = "sites/lab/_aggregate"
+""".strip(),
+        encoding="utf-8",
+    )
+
+    config = load_config(config_file)
+
+    alice, bob = config.researchers
+    assert alice.output_directory == tmp_path / "sites/alice/_auto_contents"
+    assert alice.profile == config.profile
+    assert alice.manual_content_directory is None
+    assert bob.profile.email == "bob@example.test"
+    assert bob.manual_content_directory == tmp_path / "sites/bob/_contents"
+    assert config.aggregate_directory == tmp_path / "sites/lab/_aggregate"
+
+
+def test_config_rejects_duplicate_batch_outputs(tmp_path: Path) -> None:
+    config_file = tmp_path / "site.toml"
+    config_file.write_text(
+        """
+[researchmap]
+permalink = "person"
+base_url = "https://example.test"
+
+[profile]
+email = "person@example.test"
+
+[[researchers]]
+permalink = "alice"
+output = "shared"
+
+[[researchers]]
+permalink = "bob"
+output = "shared"
+""".strip(),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ConfigError, match="shared with another researcher"):
+        load_config(config_file)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import queue
+import random
+import stat
+import threading
+from pathlib import Path
+
+from researchmap_site.daemon import SyncDaemon, request
+from researchmap_site.sync import SyncResult
+
+
+def result(tmp_path: Path) -> SyncResult:
+    return SyncResult(tmp_path, (), "", "")
+
+
+def test_researchers_are_staggered_and_refreshed_over_the_socket(tmp_path: Path) -> None:
+    synced: queue.Queue[tuple[str, bool]] = queue.Queue()
+
+    def sync(permalink: str, force: bool) -> SyncResult:
+        synced.put((permalink, force))
+        return result(tmp_path)
+
+    daemon = SyncDaemon(
+        ["kenjikun", "hanako"],
+        sync,
+        interval=3600,
+        jitter=60,
+        clock=lambda: 0.0,
+        rng=random.Random(0),
+    )
+    status = daemon.status()
+    assert 0 < status["kenjikun"]["next_run_seconds"] <= 60
+    assert 1800 < status["hanako"]["next_run_seconds"] <= 1860
+
+    with daemon.serve(tmp_path / "sync.sock") as path:
+        assert stat.S_IMODE(path.stat().st_mode) & 0o077 == 0
+        runner = threading.Thread(target=daemon.run)
+        runner.start()
+        assert request(path, "force hanako") == {"queued": ["hanako"]}
+        assert synced.get(timeout=5) == ("hanako", True)
+        assert request(path, "refresh nobody") == {"error": "Unknown researcher: nobody"}
+        daemon.stop()
+        runner.join(timeout=5)
+
+    assert not path.exists()
+    assert synced.empty()
+    assert daemon.status()["hanako"]["last_status"] == "updated"
+
+
+def test_triggers_during_a_sync_collapse_into_one_follow_up(tmp_path: Path) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    runs: queue.Queue[bool] = queue.Queue()
+
+    def sync(permalink: str, force: bool) -> SyncResult:
+        runs.put(force)
+        started.set()
+        release.wait(timeout=5)
+        return result(tmp_path)
+
+    # Without jitter the first researcher is due at once.
+    daemon = SyncDaemon(["kenjikun"], sync, interval=3600, jitter=0, clock=lambda: 0.0)
+    runner = threading.Thread(target=daemon.run)
+    runner.start()
+    assert started.wait(timeout=5)
+    daemon.trigger("kenjikun")
+    daemon.trigger(force=True)
+    daemon.trigger("kenjikun")
+    assert daemon.status()["kenjikun"] | {"next_run_seconds": 0} == {
+        "next_run_seconds": 0,
+        "running": True,
+        "queued": True,
+    }
+    release.set()
+    assert [runs.get(timeout=5), runs.get(timeout=5)] == [False, True]
+    daemon.stop()
+    runner.join(timeout=5)
+
+    assert runs.empty()
@@ -0,0 +1,39 @@
+from researchmap_site.diff import diff_payloads
+
+
+def payload(*papers: dict[str, object], modified: str = "2026-01-01") -> dict[str, object]:
+    return {
+        "permalink": "kenjikun",
+        "rm:modified": modified,
+        "@graph": [
+            {"@type": "published_papers", "items": list(papers)},
+            {"@type": "awards", "items": [{"award_name": {"en": "Prize"}}]},
+        ],
+    }
+
+
+def test_diff_matches_items_by_researchmap_id() -> None:
+    previous = payload(
+        {"rm:id": "1", "paper_title": {"en": "Kept"}},
+        {"rm:id": "2", "paper_title": {"en": "Draft"}},
+        {"rm:id": "3", "paper_title": {"en": "Withdrawn"}},
+    )
+    current = payload(
+        {"rm:id": "4", "paper_title": {"en": "New"}},
+        {"rm:id": "2", "paper_title": {"en": "Final"}},
+        {"rm:id": "1", "paper_title": {"en": "Kept"}},
+        modified="2026-02-01",
+    )
+
+    changes = diff_payloads("kenjikun", previous, current)
+
+    assert changes.fields == ("rm:modified",)
+    (papers,) = changes.sections
+    assert (papers.added, papers.modified, papers.removed) == (("4",), ("2",), ("3",))
+    assert changes.section("awards") is None
+    assert changes.to_dict()["sections"]["published_papers"]["added"] == ["4"]
+
+    first = diff_payloads("kenjikun", None, current)
+    assert first.previous_modified == ""
+    assert first.section("awards").added[0].startswith("sha256:")
+    assert not diff_payloads("kenjikun", current, current).changed
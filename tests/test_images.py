@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from researchmap_site import images
+from researchmap_site.images import build_images
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def staged_site(root: Path) -> Path:
+    (root / "assets" / "images").mkdir(parents=True)
+    Image.new("RGB", (640, 640), "teal").save(root / "assets/images/profile.jpg")
+    (root / "index.html").write_text(
+        '<div class="hero-portrait"><img src="assets/images/profile.jpg" alt="Portrait"></div>\n',
+        encoding="utf-8",
+    )
+    return root
+
+
+def test_variants_are_published_with_srcset_and_reused_from_the_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = tmp_path / "cache"
+    first = build_images(staged_site(tmp_path / "first"), cache)
+
+    html = (tmp_path / "first" / "index.html").read_text(encoding="utf-8")
+    assert html.startswith('<div class="hero-portrait"><picture><source type="image/')
+    assert 'sizes="138px"' in html and 'alt="Portrait"></picture></div>' in html
+    jpegs = [path for path in first if path.endswith(".jpg")]
+    assert len(jpegs) == 3
+    with Image.open(tmp_path / "first" / jpegs[0]) as variant:
+        assert variant.width == 160
+
+    # An unchanged source is served from the cache without decoding it again.
+    monkeypatch.setattr(images, "_pillow", lambda: None)
+    assert build_images(staged_site(tmp_path / "second"), cache) == first
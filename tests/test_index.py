@@ -0,0 +1,37 @@
+from researchmap_site.index import ResearcherIndex
+
+
+def payload() -> dict[str, object]:
+    return {
+        "permalink": "kenjikun",
+        "@graph": [
+            {
+                "@type": "published_papers",
+                "items": [
+                    {
+                        "paper_title": {"ja": "論文", "en": " Paper "},
+                        "authors": {"ja": [{"name": "アリス"}], "en": [{"name": "Alice"}]},
+                        "publication_date": "2024-01",
+                    },
+                    "not an item",
+                ],
+            },
+            {"@type": "research_areas", "items": [{"research_field": {"ja": "金融"}}]},
+            {"@type": "awards", "items": "malformed"},
+            {"@type": "published_papers", "items": [{"paper_title": {"en": "Later"}}]},
+        ],
+    }
+
+
+def test_index_resolves_records_once_per_section() -> None:
+    index = ResearcherIndex.build(payload())
+
+    (paper,) = index.section("published_papers")
+    assert (paper.title, paper.authors, paper.year) == ("Paper", ("Alice",), "2024")
+    (area,) = index.section("research_areas")
+    assert area.text("research_field") == "金融"
+    assert index.section("awards") == ()
+    assert "@graph" not in index.fields
+    # Later duplicate sections are not rendered but still count as content.
+    assert index.item_count({"published_papers", "awards"}) == 2
+    assert ResearcherIndex.of(index) is index
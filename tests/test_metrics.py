@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from researchmap_site.client import ResearchmapClient
+from researchmap_site.config import ProfileConfig, ResearchmapConfig, SiteConfig
+from researchmap_site.metrics import SyncMetrics, write_metrics
+from researchmap_site.payload_store import PayloadStore
+from researchmap_site.ratelimit import AdaptiveRateLimiter
+from researchmap_site.sync import synchronize
+
+PAYLOAD = {
+    "@type": "researchers",
+    "permalink": "kenjikun",
+    "rm:modified": "2026-01-15T06:32:11Z",
+    "@graph": [
+        {"@type": "published_papers", "items": [{"rm:id": "1", "paper_title": {"en": "Paper"}}]},
+        {"@type": "awards", "items": [{"rm:id": "2", "award_name": {"en": "Prize"}}]},
+    ],
+}
+
+
+@contextmanager
+def flaky_server(body: bytes, failures: int) -> Iterator[str]:
+    """Answer 503 ``failures`` times, then serve ``body``."""
+
+    remaining = [failures]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            failing = remaining[0] > 0
+            remaining[0] -= 1
+            data = b"" if failing else body
+            self.send_response(503 if failing else 200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *_: Any) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sync_reports_stage_timings_retries_and_bytes(tmp_path: Path) -> None:
+    body = json.dumps(PAYLOAD).encode("utf-8")
+    with flaky_server(body, failures=1) as base_url:
+        config = SiteConfig(
+            researchmap=ResearchmapConfig(permalink="kenjikun", base_url=base_url),
+            profile=ProfileConfig(email="person [at] example.test", social_links=()),
+        )
+        limiter = AdaptiveRateLimiter(rate=1000.0, burst=100)
+        with (
+            ResearchmapClient(base_url, rate_limiter=limiter) as client,
+            PayloadStore(tmp_path / "payloads") as store,
+        ):
+            result = synchronize(config, client, tmp_path / "_auto_contents", payload_store=store)
+
+    metrics = result.metrics
+    assert metrics is not None
+    assert result.permalink == "kenjikun"
+    for stage in ("fetch", "http", "decode", "validate", "store", "render", "stage", "replace"):
+        assert metrics.stages[stage].calls == 1
+        assert metrics.stages[stage].wall_seconds >= 0
+    assert metrics.stages["fetch"].wall_seconds >= metrics.stages["http"].wall_seconds
+    written = sum((result.output_directory / name).stat().st_size for name in result.changed_files)
+    assert metrics.counters == {
+        "http_requests": 1,
+        "http_retries": 1,
+        "bytes_received": len(body),
+        "bytes_written": written,
+    }
+    assert metrics.items == {"awards": 1, "published_papers": 1}
+
+
+def test_metrics_are_written_as_json_lines_or_a_prometheus_textfile(tmp_path: Path) -> None:
+    metrics = SyncMetrics(
+        stages={},
+        counters={"http_requests": 2, "http_retries": 0, "bytes_received": 10, "bytes_written": 0},
+        items={"awards": 3},
+    )
+    lines = tmp_path / "sync.jsonl"
+    write_metrics(lines, "jsonl", [("kenjikun", "updated", metrics)])
+    write_metrics(lines, "jsonl", [("kenjikun", "unchanged", metrics)])
+    records = [json.loads(line) for line in lines.read_text(encoding="utf-8").splitlines()]
+    assert [record["status"] for record in records] == ["updated", "unchanged"]
+    assert records[0]["counters"]["http_requests"] == 2
+
+    textfile = tmp_path / "researchmap.prom"
+    write_metrics(textfile, "prometheus", [("kenjikun", "updated", metrics)])
+    text = textfile.read_text(encoding="utf-8")
+    assert "# TYPE researchmap_sync_http_requests gauge" in text
+    assert 'researchmap_sync_http_requests{permalink="kenjikun"} 2\n' in text
+    assert 'researchmap_sync_items{permalink="kenjikun",section="awards"} 3\n' in text
+    assert list(tmp_path.glob(".*.tmp")) == []
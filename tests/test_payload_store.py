@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from researchmap_site.payload_store import INDEX_NAME, PayloadStore
+
+
+def payload(modified: str, award: str = "Prize") -> dict[str, object]:
+    return {
+        "permalink": "kenjikun",
+        "rm:modified": modified,
+        "@graph": [
+            {"@type": "published_papers", "items": [{"paper_title": {"en": "Paper"}}]},
+            {"@type": "awards", "items": [{"award_name": {"en": award}}]},
+        ],
+    }
+
+
+def test_snapshots_share_unchanged_sections_and_survive_reopening(tmp_path: Path) -> None:
+    with PayloadStore(tmp_path) as store:
+        first = store.save("kenjikun", payload("2026-01-01"))
+        assert store.save("kenjikun", payload("2026-01-01")) == first
+        second = store.save("kenjikun", payload("2026-02-01", award="Renamed"))
+
+    assert first.sections[0] == second.sections[0]
+    assert first.sections[1] != second.sections[1]
+    # A crash mid-append leaves a partial index line, which is ignored.
+    with (tmp_path / INDEX_NAME).open("ab") as index:
+        index.write(b'{"permalink":"kenjikun","mod')
+
+    with PayloadStore(tmp_path) as store:
+        assert store.history("kenjikun") == (first, second)
+        assert store.load("kenjikun") == payload("2026-02-01", award="Renamed")
+        assert store.load("kenjikun", "2026-01-01") == payload("2026-01-01")
+        with pytest.raises(OSError, match="No stored payload"):
+            store.load("kenjikun", "2025-12-01")
+        store.save("kenjikun", payload("2026-03-01"))
+
+
+def test_compaction_drops_expired_snapshots_and_their_frames(tmp_path: Path) -> None:
+    with PayloadStore(tmp_path, keep=2) as store:
+        # Compaction runs once expired snapshots outnumber retained ones.
+        for month in range(1, 6):
+            store.save("kenjikun", payload(f"2026-0{month}-01", award=f"Prize {month}"))
+        assert [snapshot.modified for snapshot in store.history("kenjikun")] == [
+            "2026-04-01",
+            "2026-05-01",
+        ]
+        (pack,) = tmp_path.glob("pack-*.dat")
+        size = pack.stat().st_size
+
+        assert store.compact() == 0
+        assert store.load("kenjikun") == payload("2026-05-01", award="Prize 5")
+
+    with PayloadStore(tmp_path, keep=2) as store:
+        assert len(store.history("kenjikun")) == 2
+        assert store.load("kenjikun", "2026-04-01") == payload("2026-04-01", award="Prize 4")
+    (pack,) = tmp_path.glob("pack-*.dat")
+    assert pack.stat().st_size == size
+
+
+def test_stores_of_two_processes_follow_each_others_compaction(tmp_path: Path) -> None:
+    with PayloadStore(tmp_path, keep=1) as daemon, PayloadStore(tmp_path, keep=1) as offline:
+        daemon.save("kenjikun", payload("2026-01-01"))
+        daemon.save("kenjikun", payload("2026-02-01", award="Renamed"))
+        assert daemon.compact() == 1
+        # The other store still knows the old pack; its save must land in the new one.
+        offline.save("hanako", payload("2026-03-01"))
+        assert [snapshot.modified for snapshot in offline.history("kenjikun")] == ["2026-02-01"]
+
+    (pack,) = tmp_path.glob("pack-*.dat")
+    with PayloadStore(tmp_path) as store:
+        assert store.load("hanako") == payload("2026-03-01")
+        assert store.load("kenjikun") == payload("2026-02-01", award="Renamed")
+    assert list(tmp_path.glob("pack-*.dat")) == [pack]
@@ -0,0 +1,86 @@
+from researchmap_site.index import ResearcherIndex
+from researchmap_site.publications import PublicationIndex
+
+
+def paper(title: str, date: str, authors: list[str], doi: str = "") -> dict[str, object]:
+    item: dict[str, object] = {
+        "paper_title": {"en": title},
+        "authors": {"en": [{"name": name} for name in authors]},
+        "publication_date": date,
+    }
+    if doi:
+        item["identifiers"] = {"doi": [doi]}
+    return item
+
+
+def researcher(*papers: dict[str, object], talks: tuple[str, ...] = ()) -> ResearcherIndex:
+    presentations = [
+        {"presentation_title": {"en": talk}, "presentation_date": "2025-06"} for talk in talks
+    ]
+    return ResearcherIndex.build(
+        {
+            "@graph": [
+                {"@type": "published_papers", "items": list(papers)},
+                {"@type": "presentations", "items": presentations},
+            ]
+        }
+    )
+
+
+def test_copies_merge_by_doi_then_normalized_title_and_year() -> None:
+    publications = PublicationIndex()
+    publications.update(
+        "alice",
+        researcher(
+            paper("Deep Markets", "2026-01", ["Alice", "Bob"], doi="10.1000/XYZ"),
+            paper("Quiet Results", "2024-05", ["Alice"]),
+            talks=("Lab Talk",),
+        ),
+    )
+    publications.update(
+        "bob",
+        researcher(
+            paper("Deep markets.", "2026-02", ["Bob"]),
+            paper("Deep Markets", "2026-01", ["Bob"], doi="https://doi.org/10.1000/other"),
+            paper("Quiet  results", "2023-05", ["Bob"]),
+            talks=("lab talk",),
+        ),
+    )
+
+    merged = publications.by_doi("doi:10.1000/xyz")
+    assert merged is not None and merged.researchers == ("alice", "bob")
+    # The copy with a DOI and more authors represents the paper.
+    assert merged.record.authors == ("Alice", "Bob")
+    assert publications.by_doi("10.1000/OTHER").researchers == ("bob",)
+    # Same title in different years is two papers: four papers and one talk in total.
+    assert len(publications) == 5
+    assert len(publications.by_author(" BOB ")) == 3
+
+    pages = publications.fragments()
+    papers = pages["papers.html"]
+    assert papers.index("<h3>2026</h3>") < papers.index("<h3>2024</h3>")
+    assert papers.count("Authors:") == 4
+    assert (
+        pages["presentations.html"].count("Lab Talk")
+        + pages["presentations.html"].count("lab talk")
+        == 1
+    )
+
+
+def test_updates_replace_a_researchers_contribution() -> None:
+    publications = PublicationIndex()
+    shared = paper("Shared Work", "2025-03", ["Alice", "Bob"], doi="10.1/shared")
+    publications.update("alice", researcher(shared, paper("Solo", "2020", ["Alice"])))
+    publications.update("bob", researcher(shared))
+    before = publications.fragments()
+
+    publications.update("alice", researcher(shared))
+    after = publications.fragments()
+    assert "Solo" in before["papers.html"] and "Solo" not in after["papers.html"]
+    assert "<h3>2020</h3>" not in after["papers.html"]
+    assert publications.by_author("alice")[0].researchers == ("alice", "bob")
+
+    publications.remove("alice")
+    publications.remove("bob")
+    assert len(publications) == 0 and publications.fragments() == {}
+    assert publications.by_author("Alice") == ()
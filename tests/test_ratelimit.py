@@ -0,0 +1,48 @@
+from researchmap_site.ratelimit import DEFAULT_MAX_RATE, DEFAULT_RATE, AdaptiveRateLimiter
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_spaces_requests_after_the_burst() -> None:
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=4.0, burst=2, clock=clock)
+
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.25, 0.5]
+    assert limiter.stats().requests == 4
+
+
+def test_throttling_backs_off_multiplicatively_and_recovers_additively() -> None:
+    clock = Clock()
+    limiter = AdaptiveRateLimiter(rate=8.0, burst=1, max_rate=8.0, increase=2.0, clock=clock)
+
+    limiter.on_throttle(retry_after=3.0)
+    limiter.on_throttle()
+
+    assert limiter.rate == 4.0
+    assert limiter.stats().throttled == 2
+    assert limiter.reserve() == 3.0
+
+    clock.now = 10.0
+    for _ in range(100):
+        limiter.on_success()
+
+    assert limiter.rate == 8.0
+    assert limiter.reserve() == 0.0
+
+
+def test_default_ceiling_lets_the_rate_climb_above_its_start() -> None:
+    limiter = AdaptiveRateLimiter(clock=Clock())
+
+    for _ in range(1000):
+        limiter.on_success()
+
+    assert limiter.rate > DEFAULT_RATE
+    assert limiter.rate == limiter.max_rate == DEFAULT_MAX_RATE
@@ -0,0 +1,46 @@
+import sys
+
+from researchmap_site.records import Paper, Presentation
+
+
+def test_records_are_slotted_and_share_repeated_strings() -> None:
+    first = Paper.from_item(
+        {
+            "paper_title": {"en": "First"},
+            "authors": {"en": [{"name": "".join(["Ali", "ce"])}]},
+            "publication_name": {"en": "".join(["Journal of ", "Examples"])},
+            "publication_date": "2024-03",
+            "identifiers": {"doi": [" 10.1000/1 "]},
+            "referee": True,
+        }
+    )
+    second = Paper.from_item(
+        {
+            "title": "Second",
+            "authors": [{"name": "Alice"}],
+            "publication_name": "Journal of Examples",
+            "publication_date": "2024-11",
+        }
+    )
+
+    assert not hasattr(first, "__dict__")
+    assert (first.title, first.year, first.doi, first.referee) == (
+        "First",
+        "2024",
+        "10.1000/1",
+        True,
+    )
+    assert first.authors[0] is second.authors[0] is sys.intern("Alice")
+    assert first.journal is second.journal
+    assert first.year is second.year
+    assert first.sort_key < second.sort_key
+
+
+def test_presentations_fall_back_to_authors_and_year() -> None:
+    presentation = Presentation.from_item(
+        {"title": "Talk", "presenters": [], "authors": ["Bob"], "year": 2019}
+    )
+
+    assert presentation.presenters == ("Bob",)
+    assert presentation.year == "2019"
+    assert presentation.sort_key == "2019"
@@ -1,5 +1,12 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 from researchmap_site.config import ProfileConfig, SocialLink
 from researchmap_site.render import render_all
+from researchmap_site.render_cache import RenderCache
+from researchmap_site.render_html import render_all as render_all_html
+from researchmap_site.sync import _html_fragment, _html_fragments
 
 
 def sample_payload() -> dict[str, object]:
@@ -90,3 +97,75 @@ def test_render_all_normalizes_sections_and_escapes_api_text() -> None:
     assert "Example Society" in rendered["awards.md"]
     assert "books.md" not in rendered
     assert "projects.md" not in rendered
+
+
+def test_cached_render_matches_uncached_and_reuses_unchanged_items(tmp_path: Path) -> None:
+    profile = ProfileConfig(email="person [at] example.test", social_links=())
+    payload = sample_payload()
+    expected = render_all(payload, profile)
+
+    with RenderCache(tmp_path / "render.sqlite3") as cache:
+        assert render_all(payload, profile, cache=cache) == expected
+        assert cache.hits == 0
+
+    with RenderCache(tmp_path / "render.sqlite3") as cache:
+        assert render_all(payload, profile, cache=cache) == expected
+        assert cache.misses == 0
+
+        edited = copy.deepcopy(payload)
+        for section in edited["@graph"]:
+            if section["@type"] == "awards":
+                section["items"][0]["award_name"] = {"en": "Renamed & <award>"}
+        before = cache.misses
+        assert render_all(edited, profile, cache=cache) == render_all(edited, profile)
+        assert cache.misses - before == 1
+
+
+def test_html_renderer_matches_markdown_conversion() -> None:
+    profile = ProfileConfig(
+        email="person [at] example.test",
+        social_links=(SocialLink("GitHub", "https://github.com/example", "GH"),),
+    )
+    payload = sample_payload()
+    # A second paper makes the list loose, as in real researcher records.
+    for section in payload["@graph"]:
+        if section["@type"] == "published_papers":
+            section["items"].append({"paper_title": {"ja": "論文 *2* <b>"}, "referee": True})
+            # Tabs expand to the stops of the Markdown line, and two trailing
+            # spaces make a hard line break.
+            section["items"].append(
+                {
+                    "paper_title": {"en": "Tabbed\t*title*\tx"},
+                    "publication_name": {"en": "Journal  \nof\tthings"},
+                }
+            )
+
+    converted = {
+        name.replace(".md", ".html"): _html_fragment(content)
+        for name, content in render_all(payload, profile).items()
+    }
+
+    assert render_all_html(payload, profile) == converted
+    assert "<li>\n<p><strong>論文 *2* &lt;b&gt;</strong>" in converted["papers.html"]
+    assert "<strong>Tabbed  *title*   x</strong>" in converted["papers.html"]
+    assert "Journal<br />\nof  things" in converted["papers.html"]
+
+
+def test_process_pool_render_matches_serial_render(tmp_path: Path) -> None:
+    profile = ProfileConfig(email="person [at] example.test", social_links=())
+    payload = sample_payload()
+    markdown = render_all(payload, profile)
+    html = render_all_html(payload, profile)
+
+    with (
+        ProcessPoolExecutor(max_workers=2) as executor,
+        RenderCache(tmp_path / "render.sqlite3") as cache,
+    ):
+        assert render_all(payload, profile, cache=cache, executor=executor) == markdown
+        assert render_all_html(payload, profile, executor=executor) == html
+        assert _html_fragments(markdown, executor=executor) == {
+            name: _html_fragment(content) for name, content in markdown.items()
+        }
+        # Cache hits are resolved in the parent without a round trip.
+        assert render_all(payload, profile, cache=cache, executor=executor) == markdown
+        assert cache.misses == cache.hits
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from researchmap_site.render_cache import RenderCache
+
+
+def test_flush_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    path = tmp_path / "render.sqlite3"
+    with RenderCache(path, max_entries=2) as cache:
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.flush()
+        assert cache.get("a") == "A"
+        cache.put("c", "C")
+
+    with RenderCache(path, max_entries=2) as cache:
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
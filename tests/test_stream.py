@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from researchmap_site.client import ResearchmapError
+from researchmap_site.index import ResearcherIndex
+from researchmap_site.stream import parse_researcher
+
+
+def researcher() -> dict[str, object]:
+    return {
+        "@context": "https://api.researchmap.jp/ontology",
+        "@type": "researchers",
+        "permalink": "kenjikun",
+        "rm:modified": "2026-01-15T06:32:11Z",
+        "degrees": [{"degree": {"en": "Doctor of Science", "ja": "博士（理学）"}}],
+        "@graph": [
+            {
+                "@type": "published_papers",
+                "items": [
+                    {
+                        "paper_title": {"en": 'Escaped \\"quotes\\" and [brackets] {braces}'},
+                        "authors": {"en": [{"name": "Alice"}, {"name": "Bob"}]},
+                        "referee": True,
+                        "rm:id": 12,
+                    },
+                    None,
+                ],
+            },
+            {"items": [{"affiliation": {"en": "Late type"}}], "@type": "education"},
+            {"@type": "unknown-error", "items": [{"ignored": True}]},
+        ],
+    }
+
+
+def chunks(document: object, size: int) -> list[bytes]:
+    body = json.dumps(document, ensure_ascii=False, indent=1).encode("utf-8")
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 1 << 16])
+def test_parse_researcher_matches_the_full_document(size: int) -> None:
+    payload = parse_researcher(chunks(researcher(), size), "kenjikun")
+
+    assert payload["degrees"] == researcher()["degrees"]
+    assert payload["@graph"] == [
+        {"@type": "published_papers", "items": [researcher()["@graph"][0]["items"][0]]},
+        {"@type": "education", "items": [{"affiliation": {"en": "Late type"}}]},
+    ]
+
+
+def test_parse_researcher_fails_on_the_first_invalid_member() -> None:
+    def body() -> object:
+        yield b'{"@type": "researchers", "permalink": "someone-else", '
+        raise AssertionError("the rest of the body should not be read")
+
+    with pytest.raises(ResearchmapError, match="unexpected permalink"):
+        parse_researcher(body(), "kenjikun")
+
+
+@pytest.mark.parametrize(
+    ("document", "message"),
+    [
+        ([], "non-object"),
+        ({"@type": "researchers", "permalink": "kenjikun"}, "rm:modified"),
+        (
+            {"@type": "researchers", "permalink": "kenjikun", "rm:modified": "x"},
+            "@graph",
+        ),
+        (
+            {
+                "@type": "researchers",
+                "permalink": "kenjikun",
+                "rm:modified": "x",
+                "@graph": [{"@type": "unknown-error", "items": [{}]}],
+            },
+            "no public section items",
+        ),
+    ],
+)
+def test_parse_researcher_keeps_the_client_validation_rules(document: object, message: str) -> None:
+    with pytest.raises(ResearchmapError, match=message):
+        parse_researcher(chunks(document, 5), "kenjikun")
+
+
+def test_parse_researcher_rejects_truncated_bodies() -> None:
+    body = json.dumps(researcher()).encode("utf-8")
+
+    with pytest.raises(ResearchmapError, match="truncated"):
+        parse_researcher([body[:-40]], "kenjikun")
+
+
+@pytest.mark.parametrize("size", [3, 1 << 16])
+def test_parse_researcher_indexes_like_the_full_document(size: int) -> None:
+    document = researcher()
+    paper = document["@graph"][0]["items"][0]
+    document["@graph"] = [
+        {"@type": "published_papers", "items": [paper]},
+        {"@type": "books", "items": []},
+        {"items": [{"book_title": {"en": "Later section"}}], "@type": "books_etc"},
+        {"@type": "published_papers", "items": [paper, {"paper_title": {"en": "Repeated"}}]},
+    ]
+
+    streamed = ResearcherIndex.build(parse_researcher(chunks(document, size), "kenjikun"))
+    full = ResearcherIndex.build(document)
+
+    assert streamed.sections == full.sections
+    assert streamed.item_counts == full.item_counts
+    assert streamed.section("books", "books_etc") == ()
+    assert len(streamed.section("published_papers")) == 1
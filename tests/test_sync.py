@@ -1,11 +1,22 @@
+import shutil
+import threading
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from researchmap_site.api import ResearchmapUnavailableError
+from researchmap_site.breaker import CircuitBreaker, CircuitOpenError
 from researchmap_site.client import ResearchmapError
-from researchmap_site.config import ProfileConfig, ResearchmapConfig, SiteConfig
-from researchmap_site.sync import synchronize
+from researchmap_site.config import (
+    ProfileConfig,
+    ResearcherTarget,
+    ResearchmapConfig,
+    SiteConfig,
+)
+from researchmap_site.payload_store import PayloadStore
+from researchmap_site.sync import synchronize, synchronize_batch
 
 CONFIG = SiteConfig(
     researchmap=ResearchmapConfig(permalink="kenjikun", base_url="https://api.researchmap.jp"),
@@ -120,3 +131,308 @@ def test_manual_content_cannot_replace_generated_sections(tmp_path: Path) -> Non
             tmp_path / "_auto_contents",
             manual_content_directory=manual,
         )
+
+
+class BatchClient:
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+
+    def fetch_researcher(self, permalink: str) -> dict[str, object]:
+        self.requested.append(permalink)
+        if permalink == "broken":
+            raise ResearchmapError(f"could not fetch {permalink}")
+        researcher = payload()
+        researcher["permalink"] = permalink
+        return researcher
+
+
+def test_batch_sync_publishes_each_researcher_independently(tmp_path: Path) -> None:
+    profile = ProfileConfig(email="lab [at] example.test", social_links=())
+    targets = tuple(
+        ResearcherTarget(
+            permalink=permalink,
+            output_directory=tmp_path / permalink / "_auto_contents",
+            profile=profile,
+        )
+        for permalink in ("alice", "broken", "carol")
+    )
+    (tmp_path / "broken" / "_auto_contents").mkdir(parents=True)
+    (tmp_path / "broken" / "_auto_contents" / "profile.html").write_text(
+        "old content", encoding="utf-8"
+    )
+    client = BatchClient()
+
+    batch = synchronize_batch(
+        SiteConfig(researchmap=CONFIG.researchmap, profile=CONFIG.profile, researchers=targets),
+        client,
+        max_workers=2,
+    )
+
+    assert sorted(client.requested) == ["alice", "broken", "carol"]
+    assert [result.output_directory.parent.name for result in batch.results] == [
+        "alice",
+        "carol",
+    ]
+    assert batch.failures == {"broken": "could not fetch broken"}
+    assert not batch.ok
+    metadata = (tmp_path / "carol" / "_auto_contents" / "metadata.yml").read_text(encoding="utf-8")
+    assert "permalink: carol" in metadata
+    assert "lab [at] example.test" in (
+        tmp_path / "alice" / "_auto_contents" / "profile.html"
+    ).read_text(encoding="utf-8")
+    assert (tmp_path / "broken" / "_auto_contents" / "profile.html").read_text(
+        encoding="utf-8"
+    ) == "old content"
+
+
+def test_batch_sync_publishes_merged_publications(tmp_path: Path) -> None:
+    shared = {
+        "paper_title": {"en": "Joint Paper"},
+        "publication_date": "2025-04",
+        "identifiers": {"doi": ["10.1000/joint"]},
+    }
+
+    class LabClient(BatchClient):
+        def fetch_researcher(self, permalink: str) -> dict[str, object]:
+            researcher = super().fetch_researcher(permalink)
+            own = {"paper_title": {"en": f"Paper by {permalink}"}, "publication_date": "2024"}
+            researcher["@graph"] = [{"@type": "published_papers", "items": [shared, own]}]
+            return researcher
+
+    profile = ProfileConfig(email="lab [at] example.test", social_links=())
+    config = SiteConfig(
+        researchmap=CONFIG.researchmap,
+        profile=CONFIG.profile,
+        researchers=tuple(
+            ResearcherTarget(permalink, tmp_path / permalink, profile)
+            for permalink in ("alice", "carol")
+        ),
+        aggregate_directory=tmp_path / "lab",
+    )
+
+    batch = synchronize_batch(config, LabClient(), max_workers=2)
+
+    assert batch.aggregate is not None and batch.aggregate.generated_files == ("papers.html",)
+    papers = (tmp_path / "lab" / "papers.html").read_text(encoding="utf-8")
+    assert papers.count("Joint Paper") == 1
+    assert "Paper by alice" in papers and "Paper by carol" in papers
+
+    broken = replace(
+        config,
+        researchers=(*config.researchers, ResearcherTarget("broken", tmp_path / "x", profile)),
+    )
+    assert synchronize_batch(broken, LabClient()).aggregate is None
+    assert (tmp_path / "lab" / "papers.html").read_text(encoding="utf-8") == papers
+
+
+def test_unchanged_researcher_skips_render_and_publish(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    manual = tmp_path / "_contents"
+    manual.mkdir()
+    (manual / "research.md").write_text("## Topic\n", encoding="utf-8")
+    first = synchronize(
+        CONFIG,
+        FakeClient(payload()),
+        output,
+        manual_content_directory=manual,
+        now=datetime(2026, 8, 20, 12, 34, tzinfo=UTC),
+    )
+    profile_mtime = (output / "profile.html").stat().st_mtime_ns
+
+    second = synchronize(
+        CONFIG,
+        FakeClient(payload()),
+        output,
+        manual_content_directory=manual,
+        now=datetime(2026, 8, 27, 12, 34, tzinfo=UTC),
+    )
+
+    assert first.status == "updated"
+    assert second.status == "unchanged"
+    assert second.last_updated == "2026-08-20 12:34 (UTC)"
+    assert second.generated_files == first.generated_files
+    assert (output / "profile.html").stat().st_mtime_ns == profile_mtime
+
+    (manual / "research.md").write_text("## Another topic\n", encoding="utf-8")
+    third = synchronize(CONFIG, FakeClient(payload()), output, manual_content_directory=manual)
+
+    assert third.status == "updated"
+    assert "Another topic" in (output / "research.html").read_text(encoding="utf-8")
+
+
+def test_publish_reports_and_preserves_unchanged_files(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    synchronize(CONFIG, FakeClient(payload()), output, now=datetime(2026, 8, 20, tzinfo=UTC))
+    (output / "stale.html").write_text("stale", encoding="utf-8")
+    profile = output / "profile.html"
+    profile_stat = profile.stat()
+
+    researcher = payload()
+    researcher["rm:modified"] = "2026-02-01T00:00:00Z"
+    researcher["@graph"] = [
+        {
+            "@type": "awards",
+            "items": [{"award_name": {"en": "New award"}, "award_date": "2026"}],
+        }
+    ]
+    result = synchronize(
+        CONFIG, FakeClient(researcher), output, now=datetime(2026, 8, 27, tzinfo=UTC)
+    )
+
+    assert result.changed_files == ("awards.html", "metadata.yml")
+    assert result.unchanged_files == ("profile.html",)
+    assert result.removed_files == ("stale.html",)
+    assert not (output / "stale.html").exists()
+    assert profile.stat().st_mtime_ns == profile_stat.st_mtime_ns
+    assert not list(tmp_path.glob("._auto_contents.*"))
+
+
+def test_offline_rebuild_renders_the_stored_payload(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    store = PayloadStore(tmp_path / "payloads")
+    researcher = payload()
+    researcher["@graph"] = [{"@type": "awards", "items": [{"award_name": {"en": "Prize"}}]}]
+    synchronize(CONFIG, FakeClient(researcher), output, payload_store=store)
+    assert store.load("kenjikun") == researcher
+
+    renamed = SiteConfig(
+        researchmap=CONFIG.researchmap,
+        profile=ProfileConfig(email="new [at] example.test", social_links=()),
+    )
+    result = synchronize(renamed, store, output, force=True)
+
+    assert result.changed_files == ("metadata.yml", "profile.html")
+    assert "new [at] example.test" in (output / "profile.html").read_text(encoding="utf-8")
+    with pytest.raises(OSError, match="No stored payload"):
+        store.load("someone-else")
+
+
+def test_stored_payloads_report_item_changes(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    researcher = payload()
+    researcher["@graph"] = [
+        {"@type": "awards", "items": [{"rm:id": "7", "award_name": {"en": "Prize"}}]}
+    ]
+    with PayloadStore(tmp_path / "payloads") as store:
+        first = synchronize(CONFIG, FakeClient(researcher), output, payload_store=store)
+        researcher["@graph"][0]["items"][0]["award_name"] = {"en": "Renamed"}
+        second = synchronize(CONFIG, FakeClient(researcher), output, payload_store=store)
+
+    assert first.changes is not None and first.changes.section("awards").added == ("7",)
+    assert second.changes is not None and second.changes.section("awards").modified == ("7",)
+    # The payload kept its rm:modified, so nothing was republished.
+    assert second.status == "unchanged"
+
+
+class SlowClient(FakeClient):
+    def __init__(self, payload: dict[str, object]) -> None:
+        super().__init__(payload)
+        self.release = threading.Event()
+
+    def fetch_researcher(self, permalink: str) -> dict[str, object]:
+        self.release.wait(10)
+        return super().fetch_researcher(permalink)
+
+
+def test_slow_refresh_serves_the_stored_payload_and_publishes_later(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    store = PayloadStore(tmp_path / "payloads")
+    researcher = payload()
+    synchronize(CONFIG, FakeClient(researcher), output, payload_store=store)
+    shutil.rmtree(output)
+
+    updated = payload()
+    updated["rm:modified"] = "2026-02-01T00:00:00Z"
+    client = SlowClient(updated)
+    result = synchronize(CONFIG, client, output, payload_store=store, latency_budget=0.05)
+
+    assert result.status == "stale" and "latency budget" in result.refresh_error
+    assert "2026-01-15T06:32:11Z" in (output / "metadata.yml").read_text(encoding="utf-8")
+    assert result.refresh is not None
+    client.release.set()
+    refreshed = result.refresh.result(timeout=10)
+    assert refreshed.status == "updated"
+    assert "2026-02-01T00:00:00Z" in (output / "metadata.yml").read_text(encoding="utf-8")
+
+
+def test_abandoned_refresh_neither_stores_nor_publishes(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    store = PayloadStore(tmp_path / "payloads")
+    synchronize(CONFIG, FakeClient(payload()), output, payload_store=store)
+
+    updated = payload()
+    updated["rm:modified"] = "2026-02-01T00:00:00Z"
+    client = SlowClient(updated)
+    result = synchronize(
+        CONFIG, client, output, payload_store=store, latency_budget=0.05, force=True
+    )
+    assert result.refresh is not None
+    result.refresh.abandon()
+    client.release.set()
+
+    with pytest.raises(RuntimeError, match="abandoned"):
+        result.refresh.result(timeout=10)
+    assert "2026-01-15T06:32:11Z" in (output / "metadata.yml").read_text(encoding="utf-8")
+    assert len(store.history(CONFIG.researchmap.permalink)) == 1
+
+
+def test_open_breaker_skips_researchmap_and_keeps_published_content(tmp_path: Path) -> None:
+    output = tmp_path / "_auto_contents"
+    store = PayloadStore(tmp_path / "payloads")
+    synchronize(CONFIG, FakeClient(payload()), output, payload_store=store)
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+
+    class CountingClient:
+        calls = 0
+
+        def fetch_researcher(self, permalink: str) -> dict[str, object]:
+            CountingClient.calls += 1
+            raise ResearchmapUnavailableError(f"could not fetch {permalink}: HTTP 503")
+
+    results = [
+        synchronize(CONFIG, CountingClient(), output, payload_store=store, breaker=breaker)
+        for _ in range(3)
+    ]
+
+    assert CountingClient.calls == 2
+    assert [result.status for result in results] == ["stale"] * 3
+    assert "could not fetch" in results[0].refresh_error
+    assert "skipping it until" in results[2].refresh_error
+    with pytest.raises(CircuitOpenError):
+        synchronize(CONFIG, CountingClient(), tmp_path / "other", breaker=breaker)
+
+
+def test_breaker_ignores_errors_of_single_researchers(tmp_path: Path) -> None:
+    profile = ProfileConfig(email="lab [at] example.test", social_links=())
+
+    class EmptyProfiles(BatchClient):
+        def fetch_researcher(self, permalink: str) -> dict[str, object]:
+            if permalink.startswith("empty"):
+                raise ResearchmapError("researchmap payload contains no public section items")
+            if permalink == "surprise":
+                raise KeyError(permalink)
+            return super().fetch_researcher(permalink)
+
+    permalinks = ("empty-1", "empty-2", "empty-3", "alice")
+    config = SiteConfig(
+        researchmap=CONFIG.researchmap,
+        profile=CONFIG.profile,
+        researchers=tuple(ResearcherTarget(p, tmp_path / p, profile) for p in permalinks),
+    )
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+
+    batch = synchronize_batch(config, EmptyProfiles(), max_workers=1, breaker=breaker)
+
+    assert sorted(batch.failures) == ["empty-1", "empty-2", "empty-3"]
+    assert [result.permalink for result in batch.results] == ["alice"]
+    assert breaker.state == "closed"
+
+    # An unexpected error during a half-open trial must not keep the breaker shut.
+    clock = [0.0]
+    breaker = CircuitBreaker(threshold=1, cooldown=60, clock=lambda: clock[0])
+    breaker.record_failure()
+    clock[0] = 60.0
+    surprise = replace(CONFIG, researchmap=replace(CONFIG.researchmap, permalink="surprise"))
+    with pytest.raises(KeyError):
+        synchronize(surprise, EmptyProfiles(), tmp_path / "surprise", breaker=breaker)
+    assert breaker.allow()